@@ -1,19 +1,93 @@
 """AWS client wrapper for blue/green deployment operations."""
-import boto3
-from typing import Dict, List, Optional, Tuple
+import functools
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from botocore.exceptions import BotoCoreError, ClientError, WaiterError
+from typing import TYPE_CHECKING, Any, Callable, Dict, FrozenSet, Iterable, List, Optional, Tuple
 from datetime import datetime, timezone
 from dateutil.parser import parse as parse_date
 
+if TYPE_CHECKING:
+    import boto3
+
+
+# Shared by every client. Adaptive retries back off client-side when an API
+# throttles instead of burning attempts on the legacy fixed schedule, the
+# pool fits the parallel describes and waiters, keepalive stops idle pooled
+# connections between dashboard redraws from being dropped, and the
+# timeouts fail fast rather than hanging the CLI on a dead connection
+CLIENT_CONFIG = dict(
+    retries={"mode": "adaptive", "max_attempts": 10},
+    max_pool_connections=25,
+    tcp_keepalive=True,
+    connect_timeout=3,
+    read_timeout=10
+)
+
+
+# Linux on-demand hourly prices (USD) for the instance types this project
+# runs, so status refreshes never wait on the slow, throttled Pricing API.
+# Types or regions missing here are looked up once and cached in-process.
+ON_DEMAND_PRICES = {
+    "t3.nano": {"us-east-1": 0.0052},
+    "t3.micro": {"us-east-1": 0.0104},
+    "t3.small": {"us-east-1": 0.0208},
+    "t3.medium": {"us-east-1": 0.0416},
+    "t4g.nano": {"us-east-1": 0.0042},
+    "t4g.micro": {"us-east-1": 0.0084},
+    "t4g.small": {"us-east-1": 0.0168},
+}
+
+
+def _utcnow() -> datetime:
+    """Get the current time in UTC."""
+    return datetime.now(timezone.utc)
+
+
+@functools.lru_cache(maxsize=None)
+def get_session(region: str = "us-east-1") -> "boto3.Session":
+    """Get the shared boto3 session for a region.
+
+    Credential and endpoint resolution happen once per process instead of
+    once per client.
+    """
+    # boto3 costs ~100 ms to import; defer it until a command needs AWS
+    import boto3
+    return boto3.Session(region_name=region)
+
+
+@functools.lru_cache(maxsize=None)
+def get_client(service: str, region: str = "us-east-1"):
+    """Get the shared boto3 client for a service and region."""
+    from botocore.config import Config as BotoConfig
+
+    return get_session(region).client(service, config=BotoConfig(**CLIENT_CONFIG))
+
+
+@functools.lru_cache(maxsize=None)
+def get_aws_client(region: str = "us-east-1") -> "AWSClient":
+    """Get the shared AWSClient for a region."""
+    return AWSClient(region=region)
+
 
 class AWSClient:
     """Wrapper for AWS API operations."""
 
-    def __init__(self, region: str = "us-east-1"):
+    INSTANCE_BATCH_SIZE = 100  # Instance IDs per describe_instances call
+    SPOT_PRICE_TTL = 60  # Seconds to reuse a fetched spot price
+
+    def __init__(self, region: str = "us-east-1", clock: Optional[Callable[[], datetime]] = None):
         self.region = region
-        self.ec2 = boto3.client("ec2", region_name=region)
-        self.elbv2 = boto3.client("elbv2", region_name=region)
-        self.autoscaling = boto3.client("autoscaling", region_name=region)
-        self.pricing = boto3.client("pricing", region_name="us-east-1")  # Pricing API only in us-east-1
+        self._now = clock or _utcnow  # Injectable so tests can pin "now"
+        self.ec2 = get_client("ec2", region)
+        self.elbv2 = get_client("elbv2", region)
+        self.autoscaling = get_client("autoscaling", region)
+        self.s3 = get_client("s3", region)
+        self.pricing = get_client("pricing", "us-east-1")  # Pricing API only in us-east-1
+        self._ondemand_prices: Dict[Tuple[str, str], Optional[float]] = {}
+        self._spot_prices: Dict[Tuple[str, str], Tuple[datetime, Optional[float]]] = {}
 
     def get_asg_info(self, asg_name: str) -> Optional[Dict]:
         """Get Auto Scaling Group information."""
@@ -24,6 +98,24 @@ class AWSClient:
             return None
         return response["AutoScalingGroups"][0]
 
+    def get_asg_infos(self, asg_names: List[str]) -> Dict[str, Dict]:
+        """Get several Auto Scaling Groups in one describe call.
+
+        Returns a name -> info dict; ASGs that don't exist are left out.
+        """
+        response = self.autoscaling.describe_auto_scaling_groups(
+            AutoScalingGroupNames=asg_names
+        )
+        return {asg["AutoScalingGroupName"]: asg for asg in response["AutoScalingGroups"]}
+
+    def get_asg_summary(self, asg_name: str) -> Optional[Tuple[int, FrozenSet[str]]]:
+        """Get ASG desired capacity and instance IDs as a cheap change probe."""
+        asg_info = self.get_asg_info(asg_name)
+        if not asg_info:
+            return None
+        instance_ids = frozenset(i["InstanceId"] for i in asg_info.get("Instances", []))
+        return asg_info["DesiredCapacity"], instance_ids
+
     def get_target_group_health(self, target_group_arn: str) -> List[Dict]:
         """Get target group health information."""
         response = self.elbv2.describe_target_health(
@@ -31,15 +123,108 @@ class AWSClient:
         )
         return response["TargetHealthDescriptions"]
 
+    def get_target_groups_health(self, target_group_arns: List[str]) -> Dict[str, List[Dict]]:
+        """Get health for several target groups, keyed by ARN.
+
+        DescribeTargetHealth takes a single ARN, so the lookups run
+        concurrently and cost one round trip instead of one per group.
+        """
+        if len(target_group_arns) <= 1:
+            return {arn: self.get_target_group_health(arn) for arn in target_group_arns}
+        with ThreadPoolExecutor(max_workers=len(target_group_arns)) as executor:
+            return dict(zip(target_group_arns, executor.map(self.get_target_group_health, target_group_arns)))
+
+    def wait_for_targets_settled(
+        self,
+        target_group_arn: str,
+        min_targets: int = 1,
+        delay: int = 5,
+        max_attempts: int = 120,
+        stop: Optional[threading.Event] = None
+    ) -> bool:
+        """Wait until a target group has min_targets targets, all healthy or all unused.
+
+        The built-in target_in_service waiter needs every target "healthy",
+        which targets of the idle color never are (they report "unused"
+        while the listener points at the other color), so this checks a
+        custom waiter model one attempt at a time, sleeping on stop between
+        attempts so the caller can cancel the wait.
+
+        Returns:
+            True once settled, False if max_attempts ran out, stop was set
+            or the call failed
+        """
+        from botocore.waiter import WaiterModel, create_waiter_with_client
+
+        # Same rule as cli.summarize_target_health: a mix of states is not settled
+        settled = " || ".join(
+            f"length(TargetHealthDescriptions[?TargetHealth.State != '{state}']) == `0`"
+            for state in ("healthy", "unused")
+        )
+        model = WaiterModel({
+            "version": 2,
+            "waiters": {
+                "TargetsSettled": {
+                    "operation": "DescribeTargetHealth",
+                    "delay": delay,
+                    "maxAttempts": 1,
+                    "acceptors": [{
+                        "matcher": "path",
+                        "argument": f"({settled}) && length(TargetHealthDescriptions) >= `{min_targets}`",
+                        "expected": True,
+                        "state": "success",
+                    }],
+                }
+            }
+        })
+        waiter = create_waiter_with_client("TargetsSettled", model, self.elbv2)
+        for attempt in range(max_attempts):
+            if stop is not None and stop.is_set():
+                return False
+            try:
+                waiter.wait(TargetGroupArn=target_group_arn)
+                return True
+            except WaiterError as e:
+                # An API error ends the wait; only an unmatched response retries
+                if "Error" in (e.last_response or {}):
+                    return False
+            if attempt + 1 < max_attempts:
+                if stop is None:
+                    time.sleep(delay)
+                elif stop.wait(delay):
+                    return False
+        return False
+
     def get_instance_details(self, instance_ids: List[str]) -> List[Dict]:
-        """Get EC2 instance details."""
+        """Get EC2 instance details.
+
+        Large lists are split into INSTANCE_BATCH_SIZE chunks that are
+        described concurrently; results keep the chunk order.
+        """
+        if not instance_ids:
+            return []
+        chunks = [
+            instance_ids[i:i + self.INSTANCE_BATCH_SIZE]
+            for i in range(0, len(instance_ids), self.INSTANCE_BATCH_SIZE)
+        ]
+        if len(chunks) == 1:
+            responses = [self.ec2.describe_instances(InstanceIds=instance_ids)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(len(chunks), 4)) as executor:
+                responses = list(executor.map(lambda ids: self.ec2.describe_instances(InstanceIds=ids), chunks))
+        return [
+            instance
+            for response in responses
+            for reservation in response["Reservations"]
+            for instance in reservation["Instances"]
+        ]
+
+    def terminate_instances(self, instance_ids: List[str]) -> List[Dict]:
+        """Terminate instances in a single API call."""
         if not instance_ids:
             return []
-        response = self.ec2.describe_instances(InstanceIds=instance_ids)
-        instances = []
-        for reservation in response["Reservations"]:
-            instances.extend(reservation["Instances"])
-        return instances
+        response = self.ec2.terminate_instances(InstanceIds=instance_ids)
+        return response["TerminatingInstances"]
 
     def get_spot_price(self, instance_type: str, availability_zone: str) -> Optional[float]:
         """Get current spot price for instance type."""
@@ -53,24 +238,128 @@ class AWSClient:
             return float(response["SpotPriceHistory"][0]["SpotPrice"])
         return None
 
+    def get_spot_prices(
+        self,
+        pairs: Iterable[Tuple[str, str]],
+        now: Optional[datetime] = None
+    ) -> Dict[Tuple[str, str], float]:
+        """Get current spot prices for several (instance_type, availability_zone) pairs.
+
+        Prices fetched within the last SPOT_PRICE_TTL seconds are reused;
+        the rest are fetched in one describe_spot_price_history call. Pairs
+        with no price history are left out of the result.
+        """
+        pairs = set(pairs)
+        if not pairs:
+            return {}
+        if now is None:
+            now = self._now()
+        stale = {
+            pair for pair in pairs
+            if pair not in self._spot_prices
+            or not 0 <= (now - self._spot_prices[pair][0]).total_seconds() < self.SPOT_PRICE_TTL
+        }
+        if stale:
+            response = self.ec2.describe_spot_price_history(
+                InstanceTypes=sorted({instance_type for instance_type, _ in stale}),
+                ProductDescriptions=["Linux/UNIX"],
+                Filters=[{"Name": "availability-zone", "Values": sorted({az for _, az in stale})}],
+                StartTime=now
+            )
+            fetched: Dict[Tuple[str, str], Optional[float]] = dict.fromkeys(stale)
+            # History is newest first, so keep the first price seen for each pair
+            for entry in response["SpotPriceHistory"]:
+                key = (entry["InstanceType"], entry["AvailabilityZone"])
+                if key in stale and fetched[key] is None:
+                    fetched[key] = float(entry["SpotPrice"])
+            for key, price in fetched.items():
+                self._spot_prices[key] = (now, price)
+        return {
+            pair: self._spot_prices[pair][1]
+            for pair in pairs
+            if self._spot_prices[pair][1] is not None
+        }
+
+    def get_ondemand_price(self, instance_type: str, region: Optional[str] = None) -> Optional[float]:
+        """Get the Linux on-demand hourly price for an instance type.
+
+        Served from ON_DEMAND_PRICES when listed; otherwise the Pricing API
+        is asked once per (type, region) and the answer (or None, when it
+        can't be priced) is reused for the life of the client.
+        """
+        region = region or self.region
+        listed = ON_DEMAND_PRICES.get(instance_type, {}).get(region)
+        if listed is not None:
+            return listed
+        key = (instance_type, region)
+        if key not in self._ondemand_prices:
+            self._ondemand_prices[key] = self._lookup_ondemand_price(instance_type, region)
+        return self._ondemand_prices[key]
+
+    def _lookup_ondemand_price(self, instance_type: str, region: str) -> Optional[float]:
+        """Ask the Pricing API for a Linux, shared-tenancy on-demand hourly price."""
+        filters = {
+            "instanceType": instance_type,
+            "regionCode": region,
+            "operatingSystem": "Linux",
+            "tenancy": "Shared",
+            "preInstalledSw": "NA",
+            "capacitystatus": "Used",
+        }
+        try:
+            response = self.pricing.get_products(
+                ServiceCode="AmazonEC2",
+                Filters=[{"Type": "TERM_MATCH", "Field": f, "Value": v} for f, v in filters.items()],
+                MaxResults=1
+            )
+            product = json.loads(response["PriceList"][0])
+            term = next(iter(product["terms"]["OnDemand"].values()))
+            dimension = next(iter(term["priceDimensions"].values()))
+            return float(dimension["pricePerUnit"]["USD"])
+        except (BotoCoreError, ClientError, IndexError, KeyError, StopIteration, ValueError):
+            return None
+
+    def get_terraform_output(self, bucket: str, key: str, name: str) -> Optional[Any]:
+        """Read an output value straight from a terraform state file in S3.
+
+        Skips `terraform output` (init, provider load, state lock) entirely.
+        Returns None if the state or output can't be read.
+        """
+        try:
+            response = self.s3.get_object(Bucket=bucket, Key=key)
+            state = json.loads(response["Body"].read())
+            return state["outputs"][name]["value"]
+        except (BotoCoreError, ClientError, KeyError, TypeError, ValueError):
+            return None
+
     def check_spot_interruption(self, instance_id: str) -> Optional[Dict]:
         """Check if instance has spot interruption notice (requires SSM access)."""
         # This would require SSM access to the instance to check metadata
         # For now, we'll return None - can be enhanced later
         return None
 
-    def calculate_instance_uptime(self, launch_time: datetime) -> Tuple[int, int, int]:
-        """Calculate instance uptime in days, hours, minutes."""
-        now = datetime.now(timezone.utc)
-        delta = now - launch_time
-        days = delta.days
-        hours, remainder = divmod(delta.seconds, 3600)
-        minutes, _ = divmod(remainder, 60)
-        return days, hours, minutes
+    def calculate_instance_uptime(self, launch_time: datetime, now: Optional[datetime] = None) -> Tuple[int, int, int]:
+        """Calculate instance uptime in days, hours, minutes.
+
+        Pass now to measure several instances against the same moment.
+        """
+        if now is None:
+            now = self._now()
+        days, remainder = divmod(int((now - launch_time).total_seconds()), 86400)
+        hours, remainder = divmod(remainder, 3600)
+        return days, hours, remainder // 60
 
     def get_environment_status(self, asg_name: str, target_group_arns: Dict[str, str]) -> Dict:
         """Get comprehensive environment status."""
-        asg_info = self.get_asg_info(asg_name)
+        return self.build_environment_status(asg_name, self.get_asg_info(asg_name), target_group_arns)
+
+    def build_environment_status(
+        self,
+        asg_name: str,
+        asg_info: Optional[Dict],
+        target_group_arns: Dict[str, str]
+    ) -> Dict:
+        """Get comprehensive environment status for an already described ASG."""
         if not asg_info:
             return {
                 "exists": False,
@@ -81,17 +370,37 @@ class AWSClient:
 
         # Get instance details
         instance_ids = [i["InstanceId"] for i in asg_info.get("Instances", [])]
+
+        # A scaled-down environment with nothing left draining has no
+        # targets to check or instances to price
+        if asg_info["DesiredCapacity"] == 0 and not instance_ids:
+            return {
+                "exists": True,
+                "asg_name": asg_name,
+                "desired_capacity": 0,
+                "min_size": asg_info["MinSize"],
+                "max_size": asg_info["MaxSize"],
+                "instances": [],
+                "health": {tg_name: [] for tg_name in target_group_arns},
+                "total_hourly_cost": 0.0,
+                "total_monthly_cost": 0.0
+            }
+
         instances = self.get_instance_details(instance_ids)
 
         # Get target group health
-        health = {}
-        for tg_name, tg_arn in target_group_arns.items():
-            tg_health = self.get_target_group_health(tg_arn)
-            health[tg_name] = tg_health
+        health_by_arn = self.get_target_groups_health(list(target_group_arns.values()))
+        health = {tg_name: health_by_arn[tg_arn] for tg_name, tg_arn in target_group_arns.items()}
 
-        # Calculate costs and uptime
+        # Calculate costs and uptime, all as of the same moment
         instance_details = []
         total_hourly_cost = 0.0
+        now = self._now()
+        spot_prices = self.get_spot_prices(
+            ((i["InstanceType"], i["Placement"]["AvailabilityZone"])
+             for i in instances if i.get("InstanceLifecycle") == "spot"),
+            now
+        )
 
         for instance in instances:
             instance_type = instance["InstanceType"]
@@ -101,14 +410,13 @@ class AWSClient:
 
             # Get pricing
             if lifecycle == "spot":
-                spot_price = self.get_spot_price(instance_type, az)
-                hourly_cost = spot_price if spot_price else 0.0
+                hourly_cost = spot_prices.get((instance_type, az), 0.0)
             else:
-                hourly_cost = 0.0094  # t3.micro on-demand hourly price
+                hourly_cost = self.get_ondemand_price(instance_type) or 0.0
 
             total_hourly_cost += hourly_cost
 
-            days, hours, minutes = self.calculate_instance_uptime(launch_time)
+            days, hours, minutes = self.calculate_instance_uptime(launch_time, now)
 
             instance_details.append({
                 "instance_id": instance["InstanceId"],
@@ -171,14 +479,17 @@ class AWSClient:
         launch_time = instance["LaunchTime"]
         az = instance["Placement"]["AvailabilityZone"]
 
-        # Get pricing (t3.nano)
+        # Price and uptime as of the same moment
+        now = self._now()
+
+        # Get pricing
         if lifecycle == "spot":
-            spot_price = self.get_spot_price(instance_type, az)
-            hourly_cost = spot_price if spot_price else 0.0016  # Fallback to approximate spot price
+            spot_prices = self.get_spot_prices([(instance_type, az)], now)
+            hourly_cost = spot_prices.get((instance_type, az), 0.0016)  # Fallback to approximate spot price
         else:
-            hourly_cost = 0.0052  # t3.nano on-demand hourly price
+            hourly_cost = self.get_ondemand_price(instance_type) or 0.0
 
-        days, hours, minutes = self.calculate_instance_uptime(launch_time)
+        days, hours, minutes = self.calculate_instance_uptime(launch_time, now)
 
         instance_detail = {
             "instance_id": instance["InstanceId"],
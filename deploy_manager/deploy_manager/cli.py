@@ -1,13 +1,23 @@
 #!/usr/bin/env python3
 """Blue/Green Deployment Manager CLI."""
+import codecs
+import functools
+import math
+import os
 import sys
 import time
 import subprocess
+import threading
+from collections import Counter
+from datetime import datetime, timezone
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, wait as wait_futures
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Sequence, Tuple, Union
 import click
+from botocore.exceptions import BotoCoreError, ClientError
 
 
+@functools.lru_cache(maxsize=None)
 def get_iac_root() -> Path:
     """Get the root directory of the IAC repo.
 
@@ -16,62 +26,447 @@ def get_iac_root() -> Path:
     # This file is at deploy_manager/deploy_manager/cli.py
     # IAC root is ../../ from here
     return Path(__file__).resolve().parent.parent.parent
-from rich.console import Console
+from rich.console import Console, Group
 from rich.table import Table
 from rich.panel import Panel
 from rich.live import Live
 from rich.text import Text
+from rich.cells import cell_len
 from rich import box
 
-from .aws_client import AWSClient
+from .aws_client import get_aws_client, get_client
 from .config import Config
 from .ecr_client import ECRClient
 from .deploy_state import DeployState
 
 
-console = Console()
+# Output is short opaque strings (tags, ids, costs) with literal emoji, so
+# skip Rich's regex highlighter and :shortcode: emoji replacement
+console = Console(highlight=False, emoji=False)
+
+# Make argv for a blue/green deploy that preserves the active side's capacity;
+# each element is formatted on its own, so values can never split into extra args
+DEPLOY_CMD_TMPL = (
+    "make",
+    "deploy:new-{env}",
+    "ACTIVE_DESIRED_CAPACITY={capacity}",
+    "ACTIVE_MIN_SIZE={min_size}",
+    "ACTIVE_MAX_SIZE={max_size}",
+)
+
+
+class Countdown:
+    """Renderable showing the seconds left until a deadline.
+
+    Rich re-renders it on each Live refresh, so the caller can block in a
+    single sleep while the display keeps ticking.
+    """
+
+    def __init__(self, label: str, seconds: int):
+        self.label = label
+        self.deadline = time.monotonic() + seconds
+
+    def __rich__(self) -> Text:
+        remaining = max(0, math.ceil(self.deadline - time.monotonic()))
+        return Text(f"{self.label} {remaining}s...", style="cyan")
+
+
+class MonitorPanel:
+    """Renderable deploy monitor panel with a live elapsed-time counter.
+
+    The poll loop swaps in new status segments as they arrive while Rich
+    re-renders the panel on its own refresh thread, so the timer keeps
+    ticking between AWS polls.
+    """
+
+    def __init__(self, title: str, max_wait_time: int):
+        self.title = title
+        self.max_wait_time = max_wait_time
+        self.start = time.monotonic()
+        # (segments, ready) from _monitor_status_parts, replaced as a whole
+        self.content: Tuple[List[Tuple[str, str]], bool] = ([], False)
+
+    def elapsed(self) -> int:
+        return int(time.monotonic() - self.start)
+
+    def __rich__(self) -> Panel:
+        body, ready = self.content
+        elapsed = min(self.elapsed(), self.max_wait_time)
+        parts = [(f"⏱  Elapsed: {elapsed}s / {self.max_wait_time}s\n\n", "cyan")] + body
+        if ready:
+            parts.append(("\n✓ Environment is healthy and ready!", "bold green"))
+        return Panel(Text.assemble(*parts), title=self.title, border_style="green" if ready else "cyan")
+
+# Display name and style per instance lifecycle
+LIFECYCLE_STYLES = {
+    "spot": ("Spot", "yellow"),
+    "on-demand": ("On-Demand", "blue"),
+}
+
+# Style per EC2 instance state (anything else is shown as a problem)
+STATE_STYLES = {
+    "running": "green",
+}
+
+# Shared status cells for the images/history tables (never mutated)
+DEPLOYED_CELL = Text("← DEPLOYED", style="green")
+NEW_CELL = Text("← NEW", style="yellow")
+CURRENT_CELL = Text("current", style="green")
+
+
+def _humanize(dt: datetime, now: datetime) -> str:
+    """Format how long ago dt was relative to now (e.g. '3h ago')."""
+    elapsed = max(0, int((now - dt).total_seconds()))
+    if elapsed >= 86400:
+        return f"{elapsed // 86400}d ago"
+    if elapsed > 3600:
+        return f"{elapsed // 3600}h ago"
+    return f"{elapsed // 60}m ago"
+
+
+def format_uptime(uptime: Dict) -> str:
+    """Format an uptime dict as e.g. '1d 2h 30m'."""
+    return "%(days)dd %(hours)dh %(minutes)dm" % uptime
+
+
+# Past this many rows, tables are streamed as plain tab-separated text
+PLAIN_OUTPUT_THRESHOLD = 500
+
+
+def print_rows(columns: Sequence[Tuple[str, str]], rows: List[Sequence[Union[str, Text]]]) -> None:
+    """Print rows as a simple Rich table.
+
+    Column widths are computed up front so Rich does not have to measure
+    every cell. Large outputs skip table layout entirely and are written as
+    plain tab-separated lines.
+
+    Args:
+        columns: (header, style) per column
+        rows: Cell values, either plain strings or styled Text
+    """
+    if len(rows) > PLAIN_OUTPUT_THRESHOLD:
+        lines = ["\t".join(header for header, _ in columns)]
+        lines.extend("\t".join(str(cell) for cell in row) for row in rows)
+        sys.stdout.write("\n".join(lines) + "\n")
+        return
+
+    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
+    for i, (header, style) in enumerate(columns):
+        width = max([cell_len(header)] + [cell_len(str(row[i])) for row in rows])
+        table.add_column(header, style=style, width=width, no_wrap=True)
+    for row in rows:
+        table.add_row(*row)
+    console.print(table)
+
+
+def print_fields(
+    title: str,
+    fields: Sequence[Tuple[str, Union[str, Text]]],
+    empty: str = "Nothing reported",
+) -> None:
+    """Print a short list of label/value pairs as aligned lines.
+
+    Used for small fixed-shape outputs where a full table layout is not
+    worth its cost. With no fields, the empty message is printed under the
+    title instead.
+    """
+    lines = [Text(title, style="bold")]
+    if not fields:
+        lines.append(Text(empty, style="dim"))
+    width = max((cell_len(label) for label, _ in fields), default=0)
+    for label, value in fields:
+        lines.append(Text.assemble((label.ljust(width), "cyan"), "  ", value))
+    console.print(Text("\n").join(lines))
+
+
+# Linux process table, scanned directly instead of forking pgrep
+PROC_DIR = Path("/proc")
+
+
+def check_terraform_running() -> bool:
+    """Check if there's a terraform process currently running."""
+    if PROC_DIR.is_dir():
+        # One directory read; only pid entries are opened, as raw bytes.
+        # comm is the executable name (truncated to 15 chars), which also
+        # catches terraform-provider-* plugins. Matching it rather than the
+        # full cmdline avoids false hits on e.g. an editor open on terraform/.
+        with os.scandir(PROC_DIR) as entries:
+            for entry in entries:
+                if not entry.name.isdigit():
+                    continue
+                try:
+                    with open(os.path.join(entry.path, "comm"), "rb") as comm:
+                        if comm.read().startswith(b"terraform"):
+                            return True
+                except OSError:
+                    # Process exited while scanning
+                    continue
+        return False
+
+    try:
+        result = subprocess.run(
+            ["pgrep", "-f", "terraform"],
+            capture_output=True,
+            text=True,
+            timeout=1  # Never let a slow pgrep hold up the status render
+        )
+        return result.returncode == 0  # 0 means process found
+    except Exception:
+        # If pgrep fails or times out, assume no terraform running
+        return False
+
+
+def run_deploy_with_tag(tag: str) -> bool:
+    """Run `make deploy:with-tag` in the IaC root and report success.
+
+    The make run stays a child process so the deploy is only recorded to
+    history once make exits cleanly; Ctrl-C still reaches make through the
+    shared process group.
+    """
+    result = subprocess.run(
+        ["make", "deploy:with-tag", f"TAG={tag}"],
+        cwd=get_iac_root(),
+        close_fds=True,
+    )
+    return result.returncode == 0
+
+
+def parse_systemctl_show(output: str) -> List[Tuple[str, str]]:
+    """Parse `systemctl show -p Id -p ActiveState` output into (service, state) pairs.
+
+    Units are printed as blocks of key=value lines separated by blank lines.
+    """
+    services = []
+    for block in output.strip().split("\n\n"):
+        props = dict(line.split("=", 1) for line in block.splitlines() if "=" in line)
+        if "Id" in props:
+            service = props["Id"]
+            if service.endswith(".service"):
+                service = service[:-len(".service")]
+            services.append((service, props.get("ActiveState", "unknown")))
+    return services
+
+
+_remote_output_lock = threading.Lock()
+
+
+def _print_remote_line(line: str, label: Optional[str] = None) -> None:
+    """Print one line of streamed remote command output.
+
+    label prefixes the line with the pipeline it came from, so output from
+    pipelines running side by side stays attributable. Writes are serialized
+    so lines from different threads never interleave mid-line.
+    """
+    prefix = f"[{label}] " if label else ""
+    with _remote_output_lock:
+        console.print(Text(f"  │ {prefix}{line}", style="dim"))
+
+
+def _stream_output(fd: int, chunk_size: int = 64 * 1024) -> None:
+    """Copy a child process's output pipe to stdout until it closes.
+
+    Reads whatever is available rather than waiting for whole lines, so
+    prompts without a trailing newline show up immediately, and writes the
+    text as-is instead of running it through Rich markup.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    while True:
+        chunk = os.read(fd, chunk_size)
+        text = decoder.decode(chunk, final=not chunk)
+        if text:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+        if not chunk:
+            return
+
+
+def _run_in_daemon_thread(fn: Callable, *args) -> Future:
+    """Run fn(*args) on a daemon thread and return a Future for its result.
+
+    Unlike an executor, the thread does not keep the process alive (e.g.
+    after Ctrl-C) while a long AWS waiter is still sleeping.
+    """
+    future: Future = Future()
+
+    def run():
+        try:
+            future.set_result(fn(*args))
+        except BaseException as e:
+            future.set_exception(e)
+
+    threading.Thread(target=run, daemon=True).start()
+    return future
+
+
+def summarize_target_health(tg_health: List[Dict]) -> Tuple[str, str, str, bool]:
+    """Summarize a non-empty target group's health in one pass over its targets.
+
+    Returns:
+        (icon, style, detail, settled) where settled means every target is
+        healthy or unused
+    """
+    counts = Counter(t["TargetHealth"]["State"] for t in tg_health)
+    total_count = len(tg_health)
+
+    if counts["healthy"] == total_count:
+        # All healthy and receiving traffic (active environment)
+        return "●", "green", f"{counts['healthy']}/{total_count} ✓ receiving traffic", True
+    if counts["unused"] == total_count:
+        # All unused - ready but not receiving traffic (inactive environment)
+        return "○", "cyan", f"{counts['unused']}/{total_count} ✓ ready (not receiving traffic)", True
+    if counts["initial"] > 0:
+        # Still initializing
+        return "◐", "yellow", f"{counts['initial']}/{total_count} initializing...", False
+    if counts["unhealthy"] > 0:
+        # Some unhealthy
+        return "✗", "red", f"{counts['unhealthy']}/{total_count} failing checks", False
+    # Mixed state
+    return "◐", "yellow", "mixed state", False
+
+
+def _target_states(status: Dict) -> Tuple:
+    """Get each target group's sorted target states, for spotting changes between polls."""
+    return tuple(
+        (name, tuple(sorted(t["TargetHealth"]["State"] for t in tg_health)))
+        for name, tg_health in status.get("health", {}).items()
+    )
+
+
+def _targets_settled(status: Dict) -> bool:
+    """Check whether every target group is settled, as summarize_target_health defines it.
+
+    Settled targets only change when the ASG itself changes, so callers can
+    skip re-describing them until it does.
+    """
+    if not status.get("exists") or not status.get("health"):
+        return False
+    return all(
+        tg_health and summarize_target_health(tg_health)[3]
+        for tg_health in status["health"].values()
+    )
+
+
+def _monitor_status_parts(status: Dict, tg_labels: Dict[str, Tuple[str, str]]) -> Tuple[List[Tuple[str, str]], bool]:
+    """Build the deploy monitor's (text, style) segments for one status.
+
+    Returns the segments and whether the environment is healthy and at
+    its desired capacity.
+    """
+    parts = []
+    if not status["exists"] or status["desired_capacity"] == 0:
+        parts.append(("Status: ", "white"))
+        parts.append(("No instances\n", "yellow"))
+        return parts, False
+
+    # Instance status
+    parts.append((f"Instances: {len(status['instances'])}\n", "white"))
+
+    for instance in status["instances"]:
+        state = instance["state"]
+        state_style = "green" if state == "running" else "yellow"
+        parts.append((f"  • {instance['instance_id']}: ", "dim"))
+        parts.append((f"{state}\n", state_style))
+
+    # Health status
+    parts.append(("\nHealth:\n", "white"))
+    all_healthy = True
+
+    for tg_name, tg_health in status["health"].items():
+        if not tg_health:
+            parts.append((f"  • {tg_name}: ", "dim"))
+            parts.append(("no targets\n", "yellow"))
+            all_healthy = False
+            continue
+
+        icon, style, detail, settled = summarize_target_health(tg_health)
+        all_healthy = all_healthy and settled
+
+        parts.append((f"  {icon} ", style))
+        parts.append(tg_labels.get(tg_name) or (f"{tg_name}: ", "bold white"))
+        parts.append((f"{detail}\n", style))
+
+    ready = all_healthy and len(status["instances"]) >= status["desired_capacity"]
+    return parts, ready
 
 
 class DeploymentManager:
     """Manages blue/green deployments."""
 
+    ACTIVE_ENV_TTL = 10  # Seconds to reuse a looked-up active environment
+
     def __init__(self, config: Config):
         self.config = config
-        self.aws = AWSClient(region=config.region)
+        self.aws = get_aws_client(config.region)
+        self.deploy_state = DeployState(region=config.region)
+        self._active_env_lock = threading.Lock()
+        self._active_env_inflight: Optional[Future] = None
+        self._active_env_cache: Optional[Tuple[float, str]] = None
 
     def get_active_environment(self) -> str:
-        """Determine which environment is currently active."""
-        # Check which target group the listener is pointing to
-        try:
-            result = subprocess.run(
-                ["terraform", "-chdir=terraform/prod", "output", "-json", "active_color"],
-                capture_output=True,
-                text=True,
-                check=True,
-                timeout=5,  # Add timeout to prevent hanging on state lock
-                cwd=get_iac_root()
-            )
-            import json
-            active = json.loads(result.stdout)
-            return active.strip('"')
-        except subprocess.TimeoutExpired:
-            # Timeout likely means state is locked by another terraform process
-            console.print("[yellow]Warning: Terraform state is locked. Falling back to instance detection.[/yellow]", style="dim")
-            # Fall through to fallback logic
-        except Exception:
-            # Fallback: check which environment has instances
-            blue_info = self.aws.get_asg_info(self.config.blue_asg)
-            green_info = self.aws.get_asg_info(self.config.green_asg)
-
-            blue_capacity = blue_info["DesiredCapacity"] if blue_info else 0
-            green_capacity = green_info["DesiredCapacity"] if green_info else 0
-
-            if blue_capacity > 0 and green_capacity == 0:
-                return "blue"
-            elif green_capacity > 0 and blue_capacity == 0:
-                return "green"
+        """Determine which environment is currently active.
+
+        A blue/green answer is reused for ACTIVE_ENV_TTL seconds (or until
+        invalidate_active_env), and concurrent callers share a single
+        in-flight lookup instead of each querying terraform/AWS.
+        """
+        with self._active_env_lock:
+            cached = self._active_env_cache
+            if cached is not None and time.monotonic() - cached[0] < self.ACTIVE_ENV_TTL:
+                return cached[1]
+            inflight = self._active_env_inflight
+            if inflight is None:
+                inflight = self._active_env_inflight = Future()
+                is_leader = True
             else:
-                return "unknown"
+                is_leader = False
+
+        if not is_leader:
+            return inflight.result()
+
+        try:
+            active = self._lookup_active_environment()
+            if active in ("blue", "green"):
+                with self._active_env_lock:
+                    self._active_env_cache = (time.monotonic(), active)
+            inflight.set_result(active)
+            return active
+        except BaseException as e:
+            inflight.set_exception(e)
+            raise
+        finally:
+            with self._active_env_lock:
+                self._active_env_inflight = None
+
+    def invalidate_active_env(self) -> None:
+        """Forget the active environment so the next call looks it up again."""
+        with self._active_env_lock:
+            self._active_env_cache = None
+
+    def _lookup_active_environment(self) -> str:
+        """Look up the active environment from terraform state or ASG capacity."""
+        # Read the listener's active color from the prod terraform state; a
+        # single S3 GET, so it is always read fresh and flips made outside
+        # this tool show up immediately
+        active = self.aws.get_terraform_output(
+            self.config.tf_state_bucket, self.config.tf_state_key, "active_color"
+        )
+        if active in ("blue", "green"):
+            return active
+
+        # Fallback: check which environment has instances
+        asg_infos = self.aws.get_asg_infos([self.config.blue_asg, self.config.green_asg])
+        blue_info = asg_infos.get(self.config.blue_asg)
+        green_info = asg_infos.get(self.config.green_asg)
+
+        blue_capacity = blue_info["DesiredCapacity"] if blue_info else 0
+        green_capacity = green_info["DesiredCapacity"] if green_info else 0
+
+        if blue_capacity > 0 and green_capacity == 0:
+            return "blue"
+        elif green_capacity > 0 and blue_capacity == 0:
+            return "green"
+        else:
+            return "unknown"
 
     def get_active_capacity(self) -> int:
         """Get the desired capacity of the currently active environment."""
@@ -83,19 +478,44 @@ class DeploymentManager:
             return asg_info["DesiredCapacity"]
         return 1  # Default fallback
 
-    def show_status(self):
-        """Display comprehensive deployment status."""
-        active_env = self.get_active_environment()
+    def get_environment_statuses(self) -> Tuple[Dict, Dict]:
+        """Get (blue, green) environment status.
+
+        Both ASGs are described in one call, then the per-environment
+        instance, health and pricing lookups run concurrently.
+        """
+        asg_infos = self.aws.get_asg_infos([self.config.blue_asg, self.config.green_asg])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            blue_future = executor.submit(
+                self.aws.build_environment_status,
+                self.config.blue_asg,
+                asg_infos.get(self.config.blue_asg),
+                self.config.blue_target_groups
+            )
+            green_future = executor.submit(
+                self.aws.build_environment_status,
+                self.config.green_asg,
+                asg_infos.get(self.config.green_asg),
+                self.config.green_target_groups
+            )
+            return blue_future.result(), green_future.result()
 
-        # Get status for both environments
-        blue_status = self.aws.get_environment_status(
-            self.config.blue_asg,
-            self.config.blue_target_groups
-        )
-        green_status = self.aws.get_environment_status(
-            self.config.green_asg,
-            self.config.green_target_groups
-        )
+    def show_status(self, before_render: Optional[Callable[[], None]] = None):
+        """Display comprehensive deployment status.
+
+        Args:
+            before_render: Optional hook run after the AWS data is fetched
+                and before anything is printed
+        """
+        # The active-color lookup (terraform state) and the environment
+        # status fetch are independent, so overlap them
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            active_future = executor.submit(self.get_active_environment)
+            blue_status, green_status = self.get_environment_statuses()
+            active_env = active_future.result()
+
+        if before_render:
+            before_render()
 
         # Create header
         header = Text()
@@ -120,8 +540,8 @@ class DeploymentManager:
         # Display total costs
         total_cost = blue_status.get("total_hourly_cost", 0) + green_status.get("total_hourly_cost", 0)
         cost_table = Table(title="Cost Summary", box=box.ROUNDED)
-        cost_table.add_column("Metric", style="cyan")
-        cost_table.add_column("Value", style="green")
+        cost_table.add_column("Metric", style="cyan", no_wrap=True)
+        cost_table.add_column("Value", style="green", no_wrap=True)
         cost_table.add_row("Hourly Cost", f"${total_cost:.4f}/hr")
         cost_table.add_row("Daily Cost", f"${total_cost * 24:.2f}/day")
         cost_table.add_row("Monthly Cost (est)", f"${total_cost * 730:.2f}/mo")
@@ -149,29 +569,25 @@ class DeploymentManager:
 
         # Create instances table
         table = Table(box=box.SIMPLE, show_header=True, header_style="bold")
-        table.add_column("Instance ID", style="cyan")
-        table.add_column("Type", style="white")
-        table.add_column("Lifecycle", style="yellow")
-        table.add_column("State", style="white")
-        table.add_column("Uptime", style="white")
-        table.add_column("Cost", style="green")
+        table.add_column("Instance ID", style="cyan", no_wrap=True)
+        table.add_column("Type", style="white", no_wrap=True)
+        table.add_column("Lifecycle", style="yellow", no_wrap=True)
+        table.add_column("State", style="white", no_wrap=True)
+        table.add_column("Uptime", style="white", no_wrap=True)
+        table.add_column("Cost", style="green", no_wrap=True)
 
         for instance in status["instances"]:
-            uptime = instance["uptime"]
-            uptime_str = f"{uptime['days']}d {uptime['hours']}h {uptime['minutes']}m"
-
-            lifecycle_display = "Spot" if instance["lifecycle"] == "spot" else "On-Demand"
-            lifecycle_style = "yellow" if instance["lifecycle"] == "spot" else "blue"
-
+            lifecycle_display, lifecycle_style = LIFECYCLE_STYLES.get(
+                instance["lifecycle"], LIFECYCLE_STYLES["on-demand"]
+            )
             state = instance["state"]
-            state_style = "green" if state == "running" else "red"
 
             table.add_row(
                 instance["instance_id"],
                 instance["instance_type"],
-                f"[{lifecycle_style}]{lifecycle_display}[/{lifecycle_style}]",
-                f"[{state_style}]{state}[/{state_style}]",
-                uptime_str,
+                Text(lifecycle_display, style=lifecycle_style),
+                Text(state, style=STATE_STYLES.get(state, "red")),
+                format_uptime(instance["uptime"]),
                 f"${instance['hourly_cost']:.4f}/hr"
             )
 
@@ -184,29 +600,8 @@ class DeploymentManager:
                 health_parts.append((tg_name, "no targets", "yellow", None))
                 continue
 
-            # Count different states
-            healthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "healthy")
-            unused_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unused")
-            unhealthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unhealthy")
-            initial_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "initial")
-            total_count = len(tg_health)
-
-            # Determine status and styling
-            if healthy_count == total_count:
-                # All healthy and receiving traffic (active environment)
-                health_parts.append((tg_name, f"{healthy_count}/{total_count} ✓ receiving traffic", "green", "●"))
-            elif unused_count == total_count:
-                # All unused - ready but not receiving traffic (inactive environment)
-                health_parts.append((tg_name, f"{unused_count}/{total_count} ✓ ready (not receiving traffic)", "cyan", "○"))
-            elif initial_count > 0:
-                # Still initializing
-                health_parts.append((tg_name, f"{initial_count}/{total_count} initializing...", "yellow", "◐"))
-            elif unhealthy_count > 0:
-                # Some unhealthy
-                health_parts.append((tg_name, f"{unhealthy_count}/{total_count} failing checks", "red", "✗"))
-            else:
-                # Mixed state
-                health_parts.append((tg_name, f"mixed state", "yellow", "◐"))
+            icon, style, detail, _ = summarize_target_health(tg_health)
+            health_parts.append((tg_name, detail, style, icon))
 
         # Format health status in a compact, readable way
         health_text.append("\n", style="white")
@@ -230,8 +625,6 @@ class DeploymentManager:
         cost_text.append(f" (${status['total_monthly_cost']:.2f}/mo est)", style="dim green")
 
         # Combine all info - use Group to combine renderables
-        from rich.console import Group
-
         content_items = [
             capacity_text,
             health_text,
@@ -285,26 +678,30 @@ class DeploymentManager:
                 active_max = 2
 
             # Run make deploy command with active environment capacity preserved
-            cmd = (f"make deploy:new-{target_env} "
-                   f"ACTIVE_DESIRED_CAPACITY={active_capacity} "
-                   f"ACTIVE_MIN_SIZE={active_min} "
-                   f"ACTIVE_MAX_SIZE={active_max}")
-            console.print(f"[dim]Running: {cmd}[/dim]\n")
+            cmd = [
+                arg.format(
+                    env=target_env,
+                    capacity=active_capacity,
+                    min_size=active_min,
+                    max_size=active_max
+                )
+                for arg in DEPLOY_CMD_TMPL
+            ]
+            console.print(f"[dim]Running: {' '.join(cmd)}[/dim]\n")
             console.print(f"[dim]Preserving {active_env} capacity: {active_capacity} instances[/dim]\n")
 
+            # Run make directly rather than through /bin/sh
             process = subprocess.Popen(
                 cmd,
-                shell=True,
                 stdout=subprocess.PIPE,
                 stderr=subprocess.STDOUT,
-                text=True,
-                bufsize=1,
+                bufsize=0,
                 cwd=get_iac_root()
             )
 
             # Stream output
-            for line in process.stdout:
-                console.print(line, end="")
+            with process.stdout:
+                _stream_output(process.stdout.fileno())
 
             process.wait()
 
@@ -340,11 +737,11 @@ class DeploymentManager:
                 console.print("[dim]No celery-beat instance found, skipping restart[/dim]")
                 return
 
-            instance_id = asg_info["Instances"][0]["InstanceId"]
-            console.print(f"[dim]Terminating celery-beat instance {instance_id}...[/dim]")
+            instance_ids = [i["InstanceId"] for i in asg_info["Instances"]]
+            console.print(f"[dim]Terminating celery-beat instance {', '.join(instance_ids)}...[/dim]")
 
-            # Terminate the instance - ASG will recreate it automatically
-            self.aws.ec2.terminate_instances(InstanceIds=[instance_id])
+            # Terminate the instances - ASG will recreate them automatically
+            self.aws.terminate_instances(instance_ids)
             console.print("[green]✓ Celery-beat instance terminated (ASG will recreate with new image)[/green]\n")
 
         except Exception as e:
@@ -357,92 +754,73 @@ class DeploymentManager:
         target_groups = self.config.blue_target_groups if environment == "blue" else self.config.green_target_groups
 
         max_wait_time = 600  # 10 minutes
-        check_interval = 10  # Check every 10 seconds
-        elapsed = 0
+        # Poll quickly right after something changes, then back off while
+        # instances boot and targets sit in the same state
+        min_interval, max_interval = 5, 30
+        check_interval = min_interval
+        waiter_delay = 5
 
         console.print(f"[dim]Waiting for {environment} to become healthy (timeout: {max_wait_time}s)...[/dim]\n")
 
-        with Live(console=console, refresh_per_second=1) as live:
-            while elapsed < max_wait_time:
-                status = self.aws.get_environment_status(asg_name, target_groups)
-
-                # Create status display
-                status_text = Text()
-                status_text.append(f"⏱  Elapsed: {elapsed}s / {max_wait_time}s\n\n", style="cyan")
-
-                if not status["exists"] or status["desired_capacity"] == 0:
-                    status_text.append("Status: ", style="white")
-                    status_text.append("No instances\n", style="yellow")
-                else:
-                    # Instance status
-                    status_text.append(f"Instances: {len(status['instances'])}\n", style="white")
-
-                    for instance in status["instances"]:
-                        state = instance["state"]
-                        state_style = "green" if state == "running" else "yellow"
-                        status_text.append(f"  • {instance['instance_id']}: ", style="dim")
-                        status_text.append(f"{state}\n", style=state_style)
-
-                    # Health status
-                    status_text.append("\nHealth:\n", style="white")
-                    all_healthy = True
-
-                    for tg_name, tg_health in status["health"].items():
-                        if not tg_health:
-                            status_text.append(f"  • {tg_name}: ", style="dim")
-                            status_text.append("no targets\n", style="yellow")
-                            all_healthy = False
-                            continue
-
-                        # Count different health states
-                        healthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "healthy")
-                        unused_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unused")
-                        unhealthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unhealthy")
-                        initial_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "initial")
-                        total_count = len(tg_health)
-
-                        status_text.append(f"  ", style="dim")
-                        if healthy_count == total_count:
-                            # All healthy and receiving traffic
-                            status_text.append(f"● ", style="green")
-                            status_text.append(f"{tg_name}: ", style="bold white")
-                            status_text.append(f"{healthy_count}/{total_count} ✓ receiving traffic\n", style="green")
-                        elif unused_count == total_count:
-                            # All unused - ready but not receiving traffic
-                            status_text.append(f"○ ", style="cyan")
-                            status_text.append(f"{tg_name}: ", style="bold white")
-                            status_text.append(f"{unused_count}/{total_count} ✓ ready (not receiving traffic)\n", style="cyan")
-                        elif initial_count > 0:
-                            # Still initializing
-                            status_text.append(f"◐ ", style="yellow")
-                            status_text.append(f"{tg_name}: ", style="bold white")
-                            status_text.append(f"{initial_count}/{total_count} initializing...\n", style="yellow")
-                            all_healthy = False
-                        elif unhealthy_count > 0:
-                            # Some unhealthy
-                            status_text.append(f"✗ ", style="red")
-                            status_text.append(f"{tg_name}: ", style="bold white")
-                            status_text.append(f"{unhealthy_count}/{total_count} failing checks\n", style="red")
-                            all_healthy = False
-                        else:
-                            # Mixed state
-                            status_text.append(f"◐ ", style="yellow")
-                            status_text.append(f"{tg_name}: ", style="bold white")
-                            status_text.append(f"mixed state\n", style="yellow")
-                            all_healthy = False
-
-                    # Check if ready
-                    if all_healthy and len(status["instances"]) >= status["desired_capacity"]:
-                        status_text.append("\n", style="white")
-                        status_text.append("✓ Environment is healthy and ready!", style="bold green")
-                        live.update(Panel(status_text, title=f"{environment.upper()} Deployment Status", border_style="green"))
-                        console.print()
-                        return True
-
-                live.update(Panel(status_text, title=f"{environment.upper()} Deployment Status", border_style="cyan"))
-
-                time.sleep(check_interval)
-                elapsed += check_interval
+        # One waiter per target group watches for the targets to settle and
+        # wakes the poll loop as soon as they all do; stop_waiters ends them
+        # once the loop is done, so they never outlive the monitor
+        asg_summary = self.aws.get_asg_summary(asg_name)
+        min_targets = max(asg_summary[0] if asg_summary else 1, 1)
+        stop_waiters = threading.Event()
+        waiters = [
+            _run_in_daemon_thread(
+                self.aws.wait_for_targets_settled, tg_arn, min_targets,
+                waiter_delay, max_wait_time // waiter_delay, stop_waiters
+            )
+            for tg_arn in target_groups.values()
+        ]
+
+        tg_labels = {name: (f"{name}: ", "bold white") for name in target_groups}
+        panel = MonitorPanel(f"{environment.upper()} Deployment Status", max_wait_time)
+        status = None
+        rendered_status = None
+        progress = None
+
+        try:
+            # Live redraws the panel (and its elapsed counter) on its own thread;
+            # this loop only polls AWS and swaps in new content
+            with Live(panel, console=console, refresh_per_second=4):
+                while panel.elapsed() < max_wait_time:
+                    # Only do the full describe (instances, target health, pricing)
+                    # when the ASG changed or targets are still transitioning
+                    new_summary = self.aws.get_asg_summary(asg_name)
+                    if status is None or new_summary != asg_summary or not _targets_settled(status):
+                        status = self.aws.get_environment_status(asg_name, target_groups)
+                    asg_summary = new_summary
+
+                    # The body only changes when status was re-described
+                    if status is not rendered_status:
+                        rendered_status = status
+                        panel.content = _monitor_status_parts(status, tg_labels)
+
+                    if panel.content[1]:
+                        # Leaving Live renders the final, green panel
+                        break
+
+                    new_progress = (new_summary, _target_states(status))
+                    if new_progress != progress:
+                        check_interval = min_interval
+                    else:
+                        check_interval = min(check_interval * 1.5, max_interval)
+                    progress = new_progress
+
+                    pending = [w for w in waiters if not w.done()]
+                    if pending:
+                        wait_futures(pending, timeout=check_interval)
+                    else:
+                        time.sleep(check_interval)
+        finally:
+            stop_waiters.set()
+
+        if panel.content[1]:
+            console.print()
+            return True
 
         console.print("[red]Timeout waiting for environment to become healthy.[/red]")
         return False
@@ -466,18 +844,20 @@ class DeploymentManager:
             # Determine the correct make target based on target environment
             if target_env == "green":
                 # Flip to green - preserve green's capacity (which will become active)
-                # Echo 'y' to auto-confirm Makefile prompt (we already confirmed above)
-                cmd = "echo 'y' | make deploy:flip"
+                cmd = ["make", "deploy:flip"]
             else:
                 # Flip back to blue (rollback) - preserve blue's capacity (which will become active)
-                # Echo 'y' to auto-confirm Makefile prompt (we already confirmed above)
-                cmd = "echo 'y' | make deploy:rollback"
+                cmd = ["make", "deploy:rollback"]
 
-            console.print(f"\n[dim]Running: {cmd}[/dim]\n")
+            console.print(f"\n[dim]Running: {' '.join(cmd)}[/dim]\n")
 
-            result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True, cwd=get_iac_root())
+            # Answer 'y' to the Makefile prompt on stdin (we already confirmed above)
+            result = subprocess.run(
+                cmd, input="y\n", check=True, capture_output=True, text=True, cwd=get_iac_root()
+            )
             console.print(result.stdout)
 
+            self.invalidate_active_env()
             console.print(f"\n[green]✓ Traffic successfully flipped to {target_env.upper()}![/green]")
             return True
 
@@ -516,11 +896,10 @@ class DeploymentManager:
         console.print(f"[bold green]✓ Deployment healthy! Waiting {wait_seconds}s before flip...[/bold green]")
         console.print(f"[bold cyan]{'='*60}[/bold cyan]\n")
 
-        for remaining in range(wait_seconds, 0, -1):
-            console.print(f"\r[cyan]Flipping traffic in {remaining}s...[/cyan]  ", end="")
-            time.sleep(1)
+        with Live(Countdown("Flipping traffic in", wait_seconds), console=console, refresh_per_second=2):
+            time.sleep(wait_seconds)
 
-        console.print("\n")
+        console.print()
 
         # Flip traffic without confirmation
         success = self.flip_traffic(target_env=target_env, skip_confirm=True)
@@ -558,18 +937,19 @@ def dashboard():
 @cli.command()
 def status():
     """Show current deployment status."""
-    # Check if terraform is running
-    try:
-        result = subprocess.run(["pgrep", "-f", "terraform"], capture_output=True, text=True)
-        if result.returncode == 0:
-            console.print("[bold yellow]Warning: Terraform is currently running.[/bold yellow]")
-            console.print("[dim]Status information may be incomplete or outdated.[/dim]\n")
-    except Exception:
-        pass  # Ignore if pgrep fails
-
     config = Config()
     manager = DeploymentManager(config)
-    manager.show_status()
+
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        # Overlap the terraform process check with the AWS status fetch
+        terraform_check = executor.submit(check_terraform_running)
+
+        def warn_if_terraform_running():
+            if terraform_check.result():
+                console.print("[bold yellow]Warning: Terraform is currently running.[/bold yellow]")
+                console.print("[dim]Status information may be incomplete or outdated.[/dim]\n")
+
+        manager.show_status(before_render=warn_if_terraform_running)
 
 
 @cli.command()
@@ -673,23 +1053,27 @@ def deploy_when_ready(service, tag, timeout, no_flip):
     console.print(f"\n[bold]Waiting for image tag: {tag}[/bold]")
     console.print(f"Timeout: {timeout}s ({timeout // 60} min)\n")
 
-    # Wait for all required images
-    all_ready = True
-    for svc_name, repo_name in repos_to_check:
-        console.print(f"[cyan]Checking {svc_name}[/cyan] ({repo_name})...")
+    # Wait for all required images together, one ECR call per repo per poll
+    targets = [(repo_name, tag) for _, repo_name in repos_to_check]
+    found = dict.fromkeys(targets, False)
+    console.print("[cyan]Checking[/cyan] " + ", ".join(f"{svc} ({repo})" for svc, repo in repos_to_check) + "...")
 
-        def progress_callback(attempt, elapsed, found):
-            status = "[green]FOUND[/green]" if found else "[yellow]waiting...[/yellow]"
-            console.print(f"  Attempt {attempt}, elapsed {elapsed}s: {status}", end="\r")
+    def progress_callback(attempt, elapsed, poll_found):
+        found.update(poll_found)
+        statuses = ", ".join(
+            f"{svc} " + ("[green]FOUND[/green]" if found[(repo, tag)] else "[yellow]waiting...[/yellow]")
+            for svc, repo in repos_to_check
+        )
+        console.print(f"  Attempt {attempt}, elapsed {elapsed}s: {statuses}", end="\r")
 
-        ready = ecr.wait_for_image(repo_name, tag, timeout=timeout, callback=progress_callback)
-        console.print()  # newline after progress
+    all_ready = ecr.wait_for_images(targets, timeout=timeout, callback=progress_callback)
+    console.print()  # newline after progress
 
-        if ready:
+    for svc_name, repo_name in repos_to_check:
+        if found[(repo_name, tag)]:
             console.print(f"  [green]✓ {svc_name} image ready[/green]")
         else:
             console.print(f"  [red]✗ {svc_name} image not found after {timeout}s[/red]")
-            all_ready = False
 
     if not all_ready:
         console.print("\n[red]Aborting: Not all images are ready[/red]")
@@ -698,13 +1082,7 @@ def deploy_when_ready(service, tag, timeout, no_flip):
     # Deploy using make target
     console.print(f"\n[bold green]All images ready! Deploying...[/bold green]")
 
-    iac_root = get_iac_root()
-    result = subprocess.run(
-        ["make", f"deploy:with-tag", f"TAG={tag}"],
-        cwd=iac_root
-    )
-
-    if result.returncode != 0:
+    if not run_deploy_with_tag(tag):
         console.print("[red]Deployment failed[/red]")
         sys.exit(1)
 
@@ -747,48 +1125,30 @@ def images(service, limit):
         console.print("  [yellow]No main-* tagged images found[/yellow]")
         return
 
-    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-    table.add_column("Tag", style="cyan")
-    table.add_column("Pushed", style="dim")
-    table.add_column("Status")
-
-    for img in images_list:
-        # Find the main-* tag
-        main_tag = None
-        for t in img["tags"]:
-            if t.startswith("main-"):
-                main_tag = t
-                break
+    now = datetime.now(timezone.utc)
+    rows = []
+    for idx, img in enumerate(images_list):
+        main_tag = img["matching_tag"]
 
         if not main_tag:
             continue
 
         # Format pushed time
         pushed_at = img["pushed_at"]
-        if pushed_at:
-            from datetime import datetime, timezone
-            now = datetime.now(timezone.utc)
-            delta = now - pushed_at
-            if delta.days > 0:
-                pushed_str = f"{delta.days}d ago"
-            elif delta.seconds > 3600:
-                pushed_str = f"{delta.seconds // 3600}h ago"
-            else:
-                pushed_str = f"{delta.seconds // 60}m ago"
-        else:
-            pushed_str = "unknown"
+        pushed_str = _humanize(pushed_at, now) if pushed_at else "unknown"
 
         # Status indicator
-        if main_tag == deployed_tag:
-            status = "[green]← DEPLOYED[/green]"
-        elif images_list.index(img) == 0 and main_tag != deployed_tag:
-            status = "[yellow]← NEW[/yellow]"
+        is_deployed = main_tag == deployed_tag
+        if is_deployed:
+            status = DEPLOYED_CELL
+        elif idx == 0:
+            status = NEW_CELL
         else:
             status = ""
 
-        table.add_row(main_tag, pushed_str, status)
+        rows.append((main_tag, pushed_str, status))
 
-    console.print(table)
+    print_rows([("Tag", "cyan"), ("Pushed", "dim"), ("Status", "")], rows)
 
 
 @cli.command("rollback")
@@ -834,13 +1194,7 @@ def rollback(target_tag, yes):
     # Deploy the rollback tag
     console.print("\n[bold]Deploying rollback...[/bold]")
 
-    iac_root = get_iac_root()
-    result = subprocess.run(
-        ["make", f"deploy:with-tag", f"TAG={target_tag}"],
-        cwd=iac_root
-    )
-
-    if result.returncode != 0:
+    if not run_deploy_with_tag(target_tag):
         console.print("[red]Rollback deployment failed[/red]")
         sys.exit(1)
 
@@ -865,44 +1219,29 @@ def history(limit):
 
     console.print("\n[bold]Deployment History[/bold]\n")
 
-    table = Table(show_header=True, header_style="bold", box=box.SIMPLE)
-    table.add_column("#", style="dim")
-    table.add_column("Tag", style="cyan")
-    table.add_column("Service")
-    table.add_column("When", style="dim")
-    table.add_column("By")
-
+    now = datetime.now(timezone.utc)
+    rows = []
     for i, deploy in enumerate(history_list):
         # Format timestamp
         ts = deploy.get("timestamp", "")
         if ts:
-            from datetime import datetime
             try:
-                dt = datetime.fromisoformat(ts.replace("Z", "+00:00"))
-                from datetime import timezone
-                now = datetime.now(timezone.utc)
-                delta = now - dt
-                if delta.days > 0:
-                    when = f"{delta.days}d ago"
-                elif delta.seconds > 3600:
-                    when = f"{delta.seconds // 3600}h ago"
-                else:
-                    when = f"{delta.seconds // 60}m ago"
+                when = _humanize(datetime.fromisoformat(ts.replace("Z", "+00:00")), now)
             except Exception:
                 when = ts[:19]
         else:
             when = "unknown"
 
-        status = "[green]current[/green]" if i == 0 else str(i)
-        table.add_row(
+        status = CURRENT_CELL if i == 0 else str(i)
+        rows.append((
             status,
             deploy.get("tag", "?"),
             deploy.get("service", "all"),
             when,
             deploy.get("deployed_by", "?")
-        )
+        ))
 
-    console.print(table)
+    print_rows([("#", "dim"), ("Tag", "cyan"), ("Service", ""), ("When", "dim"), ("By", "")], rows)
 
 
 # =============================================================================
@@ -933,66 +1272,214 @@ class ProdLiteManager:
         }
     }
 
-    def __init__(self):
-        import boto3
-        self.ec2 = boto3.client("ec2", region_name=self.REGION)
-        self.ssm = boto3.client("ssm", region_name=self.REGION)
-
-    def get_instance(self) -> Optional[Dict]:
-        """Get the prod-lite instance."""
-        response = self.ec2.describe_instances(
-            Filters=[
-                {"Name": "tag:Name", "Values": [self.INSTANCE_NAME]},
-                {"Name": "instance-state-name", "Values": ["running"]}
-            ]
-        )
-        try:
-            return response["Reservations"][0]["Instances"][0]
-        except (IndexError, KeyError):
-            return None
+    # Reuse the instance lookup for this long within one process
+    INSTANCE_CACHE_TTL = 30
+
+    # SSM command polling backoff (seconds)
+    POLL_INITIAL_DELAY = 0.25
+    POLL_MAX_DELAY = 5.0
+
+    # Log group SSM streams command output to (see terraform/prod-lite/locals.tf)
+    LOG_GROUP = "/aws/superschedules/prod-lite/app"
+    _instance_lock = threading.Lock()
+    _instance_cache: Optional[Tuple[float, Dict]] = None
+    _ssm_online: Dict[str, float] = {}
+
+    @classmethod
+    def _client(cls, service: str):
+        """Get a boto3 client shared by every manager in this process."""
+        return get_client(service, cls.REGION)
+
+    def get_instance(self, refresh: bool = False) -> Optional[Dict]:
+        """Get the prod-lite instance.
+
+        The filter never changes, so a found instance is shared by every
+        manager in the process for INSTANCE_CACHE_TTL seconds. Concurrent
+        callers wait on the lock and reuse the first caller's lookup.
+        """
+        cls = type(self)
+        with cls._instance_lock:
+            cached = cls._instance_cache
+            if not refresh and cached and time.monotonic() - cached[0] < cls.INSTANCE_CACHE_TTL:
+                return cached[1]
+
+            response = self._client("ec2").describe_instances(
+                Filters=[
+                    {"Name": "tag:Name", "Values": [self.INSTANCE_NAME]},
+                    {"Name": "instance-state-name", "Values": ["running"]}
+                ]
+            )
+            try:
+                instance = response["Reservations"][0]["Instances"][0]
+            except (IndexError, KeyError):
+                return None
+
+            cls._instance_cache = (time.monotonic(), instance)
+            return instance
 
     def check_ssm_status(self, instance_id: str) -> bool:
-        """Check if instance is SSM-managed."""
-        response = self.ssm.describe_instance_information(
+        """Check if instance is SSM-managed.
+
+        An Online result is reused for INSTANCE_CACHE_TTL seconds; anything
+        else is checked again on the next call.
+        """
+        checked_at = self._ssm_online.get(instance_id)
+        if checked_at is not None and time.monotonic() - checked_at < self.INSTANCE_CACHE_TTL:
+            return True
+
+        response = self._client("ssm").describe_instance_information(
             Filters=[{"Key": "InstanceIds", "Values": [instance_id]}]
         )
         try:
             status = response["InstanceInformationList"][0]["PingStatus"]
-            return status == "Online"
         except (IndexError, KeyError):
             return False
 
-    def run_command(self, instance_id: str, command: str, timeout: int = 300) -> tuple[bool, str]:
-        """Run a command via SSM and return (success, output)."""
+        if status == "Online":
+            self._ssm_online[instance_id] = time.monotonic()
+            return True
+        return False
+
+    def _tail_command_output(self, command_id: str, tail: Dict, on_output: Callable[[str], None]) -> None:
+        """Pass new CloudWatch output lines for an SSM command to on_output.
+
+        tail carries the read position between calls. The command's log
+        streams are read from their start, and later calls resume from the
+        newest event timestamp the agent has written so no local clock is
+        involved. Tailing is best effort: after an API error (e.g. missing
+        logs permissions) it stops and the command result is still reported
+        when it completes.
+        """
+        if tail.get("disabled"):
+            return
+        kwargs = {"logGroupName": self.LOG_GROUP, "logStreamNamePrefix": command_id}
+        if "since" in tail:
+            kwargs["startTime"] = tail["since"]
+        seen = tail.setdefault("seen", set())
+        try:
+            while True:
+                response = self._client("logs").filter_log_events(**kwargs)
+                for event in response.get("events", []):
+                    if event["eventId"] in seen:
+                        continue
+                    seen.add(event["eventId"])
+                    tail["since"] = max(tail.get("since", 0), event["timestamp"])
+                    for line in event["message"].rstrip().splitlines():
+                        on_output(line)
+                if "nextToken" not in response:
+                    break
+                kwargs["nextToken"] = response["nextToken"]
+        except (BotoCoreError, ClientError):
+            tail["disabled"] = True
+
+    def run_command(
+        self,
+        instance_id: str,
+        command: str,
+        timeout: int = 300,
+        on_output: Optional[Callable[[str], None]] = None,
+    ) -> tuple[bool, str]:
+        """Run a command via SSM and return (success, output).
+
+        With on_output set, the command's output is also sent to CloudWatch
+        Logs and each line is passed to on_output while the command runs.
+        """
         try:
-            response = self.ssm.send_command(
+            ssm = self._client("ssm")
+            send_kwargs = {}
+            if on_output:
+                send_kwargs["CloudWatchOutputConfig"] = {
+                    "CloudWatchLogGroupName": self.LOG_GROUP,
+                    "CloudWatchOutputEnabled": True,
+                }
+            response = ssm.send_command(
                 InstanceIds=[instance_id],
                 DocumentName="AWS-RunShellScript",
                 Parameters={"commands": [command]},
-                TimeoutSeconds=timeout
+                TimeoutSeconds=timeout,
+                **send_kwargs
             )
             command_id = response["Command"]["CommandId"]
-
-            # Wait for command to complete
-            import time
-            for _ in range(timeout // 5):
-                time.sleep(5)
-                result = self.ssm.get_command_invocation(
-                    CommandId=command_id,
-                    InstanceId=instance_id
-                )
-                status = result["Status"]
-                if status in ["Success", "Failed", "Cancelled", "TimedOut"]:
+            tail: Dict = {}
+
+            # Wait for command to complete, polling quickly at first so short
+            # commands return in well under a second
+            deadline = time.monotonic() + timeout
+            delay = self.POLL_INITIAL_DELAY
+            result = {}
+            while True:
+                time.sleep(delay)
+                try:
+                    result = ssm.get_command_invocation(
+                        CommandId=command_id,
+                        InstanceId=instance_id
+                    )
+                except ssm.exceptions.InvocationDoesNotExist:
+                    # The invocation is registered shortly after send_command returns
+                    pass
+                if on_output:
+                    self._tail_command_output(command_id, tail, on_output)
+                if result.get("Status") in ["Success", "Failed", "Cancelled", "TimedOut"]:
                     break
+                if time.monotonic() >= deadline:
+                    break
+                delay = min(delay * 2, self.POLL_MAX_DELAY)
 
             output = result.get("StandardOutputContent", "")
             error = result.get("StandardErrorContent", "")
-            success = result["Status"] == "Success"
+            success = result.get("Status") == "Success"
 
             return success, output if success else error
         except Exception as e:
             return False, str(e)
 
+    def run_steps(
+        self,
+        instance_id: str,
+        steps: List[Tuple[str, str, str, str, int]],
+        label: Optional[str] = None,
+    ) -> bool:
+        """Run deploy steps in order, stopping at the first failure.
+
+        Each step is (start message, done message, failure message, command,
+        timeout). Progress is printed as each step starts and finishes, and
+        remote output is streamed while each step runs, prefixed with label
+        when one is given.
+        """
+        on_output = functools.partial(_print_remote_line, label=label)
+        for start_msg, done_msg, fail_msg, command, timeout in steps:
+            console.print(f"[cyan]{start_msg}...[/cyan]")
+            success, output = self.run_command(instance_id, command, timeout=timeout, on_output=on_output)
+            if not success:
+                console.print(f"[red]✗ {fail_msg}:[/red] {output}")
+                return False
+            console.print(f"[green]✓ {done_msg}[/green]")
+        return True
+
+    def run_pipelines(
+        self,
+        instance_id: str,
+        pipelines: Dict[str, List[Tuple[str, str, str, str, int]]],
+        sequential: bool = False,
+    ) -> bool:
+        """Run independent step pipelines and report whether all succeeded.
+
+        pipelines maps a short name to its steps. Pipelines run side by side
+        on one thread each (they share the SSM client and mostly wait on
+        polling), with streamed output prefixed by the pipeline name. With
+        sequential set they run one after another and stop at the first
+        failed pipeline.
+        """
+        if sequential or len(pipelines) < 2:
+            return all(self.run_steps(instance_id, steps) for steps in pipelines.values())
+
+        with ThreadPoolExecutor(max_workers=len(pipelines)) as executor:
+            futures = [
+                executor.submit(self.run_steps, instance_id, steps, label=name)
+                for name, steps in pipelines.items()
+            ]
+            return all([future.result() for future in as_completed(futures)])
+
     def deploy_app(self, instance_id: str, app_name: str) -> bool:
         """Deploy a specific app (gkp-labs or superschedules)."""
         if app_name not in self.APPS:
@@ -1028,7 +1515,7 @@ class ProdLiteManager:
                 python manage.py migrate --noinput && \
                 python manage.py collectstatic --noinput -v0' && \
             echo 'Dependencies installed'"""
-        success, output = self.run_command(instance_id, cmd, timeout=600)
+        success, output = self.run_command(instance_id, cmd, timeout=600, on_output=_print_remote_line)
         if not success:
             console.print(f"[red]✗ Dependencies/migrate failed:[/red] {output}")
             return False
@@ -1072,18 +1559,13 @@ def lite_status():
 
     ssm_status = "Online" if manager.check_ssm_status(instance_id) else "Offline"
 
-    # Create status table
-    table = Table(title="Prod-Lite Instance", box=box.ROUNDED)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="white")
-
-    table.add_row("Instance ID", instance_id)
-    table.add_row("Public IP", public_ip)
-    table.add_row("Instance Type", instance_type)
-    table.add_row("Launch Time", str(launch_time))
-    table.add_row("SSM Status", f"[green]{ssm_status}[/green]" if ssm_status == "Online" else f"[red]{ssm_status}[/red]")
-
-    console.print(table)
+    print_fields("Prod-Lite Instance", [
+        ("Instance ID", instance_id),
+        ("Public IP", public_ip),
+        ("Instance Type", instance_type),
+        ("Launch Time", str(launch_time)),
+        ("SSM Status", Text(ssm_status, style="green" if ssm_status == "Online" else "red")),
+    ])
 
     # Show URLs
     console.print("\n[bold]URLs:[/bold]")
@@ -1103,7 +1585,9 @@ def lite_status():
               help="Which service to deploy (for superschedules)")
 @click.option("--app", "-a", type=click.Choice(["superschedules", "gkp-labs", "all"]), default="superschedules",
               help="Which app to deploy")
-def lite_deploy(service, app):
+@click.option("--sequential", is_flag=True,
+              help="Deploy backend then frontend one at a time (ordered output)")
+def lite_deploy(service, app, sequential):
     """Deploy to prod-lite via SSM (fast ~30s deploy).
 
     By default, deploys superschedules. Use --app to specify a different app:
@@ -1151,63 +1635,50 @@ def lite_deploy(service, app):
     console.print(f"[bold]Deploying {service} to prod-lite (superschedules)...[/bold]\n")
 
     if service == "all":
-        # Deploy both backend and frontend, then restart once at the end
-        console.print("[cyan]Updating backend code...[/cyan]")
-        cmd = """cd /opt/superschedules && \
+        backend_git_cmd = """cd /opt/superschedules && \
             git fetch origin && \
             git reset --hard origin/main && \
             chown -R www-data:www-data . && \
             echo 'Backend code updated'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=120)
-        if not success:
-            console.print(f"[red]✗ Backend git failed:[/red] {output}")
-            sys.exit(1)
-        console.print("[green]✓ Backend code updated[/green]")
-
-        console.print("[cyan]Updating frontend code...[/cyan]")
-        cmd = """cd /opt/superschedules_frontend && \
-            git fetch origin && \
-            git reset --hard origin/main && \
-            chown -R www-data:www-data . && \
-            echo 'Frontend code updated'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=120)
-        if not success:
-            console.print(f"[red]✗ Frontend git failed:[/red] {output}")
-            sys.exit(1)
-        console.print("[green]✓ Frontend code updated[/green]")
-
-        console.print("[cyan]Installing backend dependencies & running migrations...[/cyan]")
-        cmd = """cd /opt/superschedules && \
+        backend_deps_cmd = """cd /opt/superschedules && \
             sudo -u www-data bash -c 'source venv/bin/activate && set -a && source .env && set +a && \
                 pip install -r requirements-prod.txt -q && \
                 python manage.py migrate --noinput && \
                 python manage.py collectstatic --noinput -v0' && \
             echo 'Backend deps installed'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=600)
-        if not success:
-            console.print(f"[red]✗ Backend deps/migrate failed:[/red] {output}")
-            sys.exit(1)
-        console.print("[green]✓ Backend dependencies installed[/green]")
-
-        console.print("[cyan]Building frontend...[/cyan]")
-        cmd = """cd /opt/superschedules_frontend && \
+        frontend_git_cmd = """cd /opt/superschedules_frontend && \
+            git fetch origin && \
+            git reset --hard origin/main && \
+            chown -R www-data:www-data . && \
+            echo 'Frontend code updated'"""
+        frontend_build_cmd = """cd /opt/superschedules_frontend && \
             sudo -u www-data bash -c 'pnpm install --frozen-lockfile 2>/dev/null || pnpm install' && \
             sudo -u www-data pnpm build && \
             echo 'Frontend built'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=600)
-        if not success:
-            console.print(f"[red]✗ Frontend build failed:[/red] {output}")
-            sys.exit(1)
-        console.print("[green]✓ Frontend built[/green]")
 
-        console.print("[cyan]Restarting services...[/cyan]")
-        cmd = "sudo systemctl restart embedding gunicorn celery-worker celery-beat && echo 'Services restarted'"
-        success, output = manager.run_command(instance_id, cmd, timeout=60)
-        if not success:
-            console.print(f"[red]✗ Service restart failed:[/red] {output}")
+        # Backend and frontend touch disjoint directories, so update and build
+        # them side by side, then restart services once at the end
+        pipelines = {
+            "backend": [
+                ("Updating backend code", "Backend code updated", "Backend git failed", backend_git_cmd, 120),
+                ("Installing backend dependencies & running migrations", "Backend dependencies installed",
+                 "Backend deps/migrate failed", backend_deps_cmd, 600),
+            ],
+            "frontend": [
+                ("Updating frontend code", "Frontend code updated", "Frontend git failed", frontend_git_cmd, 120),
+                ("Building frontend", "Frontend built", "Frontend build failed", frontend_build_cmd, 600),
+            ],
+        }
+
+        if not manager.run_pipelines(instance_id, pipelines, sequential=sequential):
             sys.exit(1)
-        console.print("[green]✓ Services restarted[/green]")
 
+        restart_ok = manager.run_steps(instance_id, [
+            ("Restarting services", "Services restarted", "Service restart failed",
+             "sudo systemctl restart embedding gunicorn celery-worker celery-beat && echo 'Services restarted'", 60),
+        ])
+        if not restart_ok:
+            sys.exit(1)
     elif service == "backend":
         console.print("[cyan]Deploying backend...[/cyan]")
         cmd = """cd /opt/superschedules && \
@@ -1220,7 +1691,7 @@ def lite_deploy(service, app):
                 python manage.py collectstatic --noinput -v0' && \
             sudo systemctl restart embedding gunicorn celery-worker celery-beat && \
             echo 'Backend deploy complete'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=600)
+        success, output = manager.run_command(instance_id, cmd, timeout=600, on_output=_print_remote_line)
         if success:
             console.print(f"[green]✓ Backend deployed[/green]")
         else:
@@ -1236,7 +1707,7 @@ def lite_deploy(service, app):
             sudo -u www-data bash -c 'pnpm install --frozen-lockfile 2>/dev/null || pnpm install' && \
             sudo -u www-data pnpm build && \
             echo 'Frontend deploy complete'"""
-        success, output = manager.run_command(instance_id, cmd, timeout=600)
+        success, output = manager.run_command(instance_id, cmd, timeout=600, on_output=_print_remote_line)
         if success:
             console.print(f"[green]✓ Frontend deployed[/green]")
         else:
@@ -1290,7 +1761,6 @@ def lite_shell(root):
         console.print(f"[cyan]Starting bash session to {instance_id} (as www-data)...[/cyan]")
         shell_cmd = "cd /opt/superschedules && sudo -u www-data bash -l"
 
-    import os
     os.execvp("aws", [
         "aws", "ssm", "start-session",
         "--target", instance_id,
@@ -1325,7 +1795,6 @@ def lite_logs(service, follow):
     console.print(f"[cyan]Tailing logs from {log_group}...[/cyan]")
     console.print("[dim]Press Ctrl+C to stop[/dim]\n")
 
-    import os
     os.execvp("aws", cmd)
 
 
@@ -1347,25 +1816,16 @@ def lite_services():
 
     console.print("[cyan]Checking services...[/cyan]\n")
 
-    cmd = """for svc in embedding gunicorn celery-worker celery-beat nginx; do
-        status=$(systemctl is-active $svc 2>/dev/null || echo 'inactive')
-        echo "$svc: $status"
-    done"""
+    # One systemctl call reports every unit
+    cmd = "systemctl show -p Id -p ActiveState embedding gunicorn celery-worker celery-beat nginx"
 
     success, output = manager.run_command(instance_id, cmd, timeout=30)
 
     if success:
-        table = Table(title="Service Status", box=box.ROUNDED)
-        table.add_column("Service", style="cyan")
-        table.add_column("Status", style="white")
-
-        for line in output.strip().split("\n"):
-            if ": " in line:
-                svc, status = line.split(": ", 1)
-                status_style = "[green]active[/green]" if status.strip() == "active" else f"[red]{status.strip()}[/red]"
-                table.add_row(svc, status_style)
-
-        console.print(table)
+        print_fields("Service Status", [
+            (svc, Text(status, style="green" if status == "active" else "red"))
+            for svc, status in parse_systemctl_show(output)
+        ], empty="No services reported")
     else:
         console.print(f"[red]Failed to check services:[/red] {output}")
 
@@ -1416,9 +1876,6 @@ def lite_restart(service):
 @click.option("--no-reboot", is_flag=True, help="Create AMI without rebooting instance")
 def lite_ami(name, no_reboot):
     """Create an AMI from the current prod-lite instance for faster launches."""
-    import boto3
-    from datetime import datetime
-
     manager = ProdLiteManager()
     instance = manager.get_instance()
 
@@ -1443,10 +1900,8 @@ def lite_ami(name, no_reboot):
             console.print("[dim]Cancelled[/dim]")
             return
 
-    ec2 = boto3.client("ec2", region_name=manager.REGION)
-
     try:
-        response = ec2.create_image(
+        response = manager._client("ec2").create_image(
             InstanceId=instance_id,
             Name=name,
             Description=f"Superschedules prod-lite AMI created from {instance_id}",
@@ -8,6 +8,10 @@ class Config:
     def __init__(self):
         self.region = "us-east-1"
 
+        # Remote state for terraform/prod (see terraform/prod/backend.tf)
+        self.tf_state_bucket = "superschedules-tf-state"
+        self.tf_state_key = "prod/terraform.tfstate"
+
         # ASG names
         self.blue_asg = "superschedules-prod-asg-blue"
         self.green_asg = "superschedules-prod-asg-green"
@@ -1,41 +1,127 @@
 """Deployment state tracking via S3."""
 import json
 import os
-import boto3
-from typing import Dict, List, Optional
+import time
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timezone
-from botocore.exceptions import ClientError
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .aws_client import get_client
+
+
+# Stored state is only read by this tool, so skip the spaces after , and :
+JSON_SEPARATORS = (",", ":")
 
 
 class DeployState:
     """Track deployment history in S3 for rollback support."""
 
     S3_BUCKET = "superschedules-data"
-    S3_KEY = "deploy-state/history.json"
+    S3_KEY = "deploy-state/history.jsonl"  # One deployment per line, newest first
+    LEGACY_S3_KEY = "deploy-state/history.json"  # Read until the first JSONL write
     MAX_HISTORY = 50  # Keep last 50 deployments
+    STATE_CACHE_TTL = 60  # Seconds to reuse a loaded history before re-reading S3
+    HISTORY_RANGE_BYTES = 64 * 1024  # Prefix fetched for limited reads (~400 entries)
+    RECORD_ATTEMPTS = 3  # Conditional writes retried when another deploy races us
 
     def __init__(self, region: str = "us-east-1"):
         self.region = region
-        self.s3 = boto3.client("s3", region_name=region)
+        self.s3 = get_client("s3", region)
+        # (loaded at, deployments newest first, whether that is the whole history, ETag)
+        self._state_cache: Optional[Tuple[float, List[Dict], bool, Optional[str]]] = None
+
+    def invalidate(self) -> None:
+        """Drop the cached history so the next read goes to S3."""
+        self._state_cache = None
+
+    def _load_deployments(self, limit: Optional[int] = None, refresh: bool = False) -> List[Dict]:
+        """
+        Load up to limit deployments from S3, newest first.
+
+        Limited reads fetch only the first HISTORY_RANGE_BYTES of the object.
+        A recent load is reused unless refresh is set, and an older one is
+        revalidated by ETag so an unchanged history isn't downloaded again.
+        """
+        cached = self._state_cache
+        covers = cached is not None and (cached[2] or (limit is not None and len(cached[1]) >= limit))
+        if not refresh and covers and time.monotonic() - cached[0] < self.STATE_CACHE_TTL:
+            return cached[1][:limit]
+
+        kwargs = {}
+        if covers and cached[3]:
+            kwargs["IfNoneMatch"] = cached[3]
+        if limit is not None:
+            kwargs["Range"] = f"bytes=0-{self.HISTORY_RANGE_BYTES - 1}"
 
-    def _load_state(self) -> Dict:
-        """Load state from S3."""
         try:
-            response = self.s3.get_object(Bucket=self.S3_BUCKET, Key=self.S3_KEY)
-            return json.loads(response["Body"].read().decode("utf-8"))
+            response = self.s3.get_object(Bucket=self.S3_BUCKET, Key=self.S3_KEY, **kwargs)
+        except ClientError as e:
+            code = e.response["Error"]["Code"]
+            if code in ("304", "NotModified"):
+                self._state_cache = (time.monotonic(),) + cached[1:]
+                return cached[1][:limit]
+            if code != "NoSuchKey":
+                raise
+            deployments = self._load_legacy_deployments()
+            complete = limit is None or len(deployments) <= limit
+            deployments = deployments[:limit]
+            etag = None
+        else:
+            data = response["Body"].read()
+            # A ranged read may stop mid-line; "bytes 0-65535/123456" gives the full size
+            total = int(response.get("ContentRange", "/%d" % len(data)).rsplit("/", 1)[1])
+            truncated = total > len(data)
+            deployments, complete = self._parse_lines(data, limit, truncated)
+            if truncated and len(deployments) < limit:
+                # Entries are larger than expected - fall back to the whole object
+                return self._load_deployments(limit=None, refresh=True)[:limit]
+            etag = response.get("ETag")
+
+        self._state_cache = (time.monotonic(), deployments, complete, etag)
+        return deployments
+
+    @staticmethod
+    def _parse_lines(data: bytes, limit: Optional[int], truncated: bool) -> Tuple[List[Dict], bool]:
+        """Parse JSON lines, returning (deployments, whether that's all of them)."""
+        lines = data.split(b"\n")
+        if truncated:
+            lines.pop()  # May be cut off mid-record
+        deployments = []
+        for line in lines:
+            if not line.strip():
+                continue
+            if limit is not None and len(deployments) >= limit:
+                return deployments, False
+            deployments.append(json.loads(line))
+        return deployments, not truncated
+
+    def _load_legacy_deployments(self) -> List[Dict]:
+        """Load history from the single-document JSON format."""
+        try:
+            response = self.s3.get_object(Bucket=self.S3_BUCKET, Key=self.LEGACY_S3_KEY)
+            return json.loads(response["Body"].read())["deployments"]
         except ClientError as e:
             if e.response["Error"]["Code"] == "NoSuchKey":
-                return {"deployments": []}
+                return []
             raise
 
-    def _save_state(self, state: Dict) -> None:
-        """Save state to S3."""
-        self.s3.put_object(
+    def _save_deployments(self, deployments: List[Dict], etag: Optional[str]) -> None:
+        """
+        Save history to S3 as JSON lines.
+
+        The write is conditional on the object still having the ETag it was
+        read with (or still not existing), so a concurrent deploy's entry is
+        never overwritten; S3 raises PreconditionFailed instead.
+        """
+        condition = {"IfMatch": etag} if etag else {"IfNoneMatch": "*"}
+        response = self.s3.put_object(
             Bucket=self.S3_BUCKET,
             Key=self.S3_KEY,
-            Body=json.dumps(state, indent=2, default=str),
-            ContentType="application/json"
+            Body="".join(json.dumps(d, separators=JSON_SEPARATORS, default=str) + "\n" for d in deployments),
+            ContentType="application/x-ndjson",
+            **condition
         )
+        self._state_cache = (time.monotonic(), deployments, True, response.get("ETag"))
 
     def record_deploy(
         self,
@@ -51,8 +137,6 @@ class DeployState:
             service: Service name (api, frontend, all)
             deployed_by: Username who triggered the deploy
         """
-        state = self._load_state()
-
         # Get username from environment if not provided
         if deployed_by is None:
             deployed_by = os.environ.get("USER", os.environ.get("USERNAME", "unknown"))
@@ -64,13 +148,19 @@ class DeployState:
             "deployed_by": deployed_by,
         }
 
-        # Add to beginning of list
-        state["deployments"].insert(0, deployment)
-
-        # Trim to max history
-        state["deployments"] = state["deployments"][:self.MAX_HISTORY]
-
-        self._save_state(state)
+        for attempt in range(self.RECORD_ATTEMPTS):
+            # Start from the latest history, reading only the entries that
+            # survive the trim
+            deployments = self._load_deployments(limit=self.MAX_HISTORY - 1, refresh=True)
+            try:
+                # Newest first
+                self._save_deployments([deployment] + deployments, self._state_cache[3])
+                return
+            except ClientError as e:
+                conflict = e.response["Error"]["Code"] in ("PreconditionFailed", "ConditionalRequestConflict")
+                if not conflict or attempt == self.RECORD_ATTEMPTS - 1:
+                    raise
+                # Another deploy was recorded since we read - re-read and retry
 
     def get_history(self, limit: int = 10) -> List[Dict]:
         """
@@ -82,8 +172,7 @@ class DeployState:
         Returns:
             List of deployment records, newest first
         """
-        state = self._load_state()
-        return state["deployments"][:limit]
+        return self._load_deployments(limit=limit)
 
     def get_current_tag(self) -> Optional[str]:
         """Get the most recently deployed tag."""
@@ -108,8 +197,7 @@ class DeployState:
 
     def find_tag_in_history(self, tag: str) -> Optional[Dict]:
         """Find a specific tag in deployment history."""
-        state = self._load_state()
-        for deployment in state["deployments"]:
+        for deployment in self._load_deployments():
             if deployment.get("tag") == tag:
                 return deployment
         return None
@@ -1,26 +1,89 @@
 """ECR client for image management and polling."""
+import functools
+import heapq
+import json
+import re
 import time
 import random
-import boto3
-from typing import Dict, List, Optional, Callable
+from typing import Dict, List, Optional, Callable, Set, Tuple
 from datetime import datetime, timezone
-from botocore.exceptions import ClientError
+from types import MappingProxyType
+from botocore.exceptions import BotoCoreError, ClientError
+
+from .aws_client import get_client
+
+
+@functools.lru_cache(maxsize=None)
+def _http_pool():
+    """Get the shared keep-alive pool for health endpoint requests."""
+    # urllib3 ships with botocore; imported here so startup doesn't pay for it
+    import urllib3
+    return urllib3.PoolManager(num_pools=4, maxsize=4, timeout=urllib3.Timeout(connect=2, read=8))
+
+
+@functools.lru_cache(maxsize=32)
+def _prefix_matcher(tag_prefix: str) -> Callable[[str], Optional["re.Match"]]:
+    """Get a compiled, anchored match function for a tag prefix, built once per prefix."""
+    return re.compile(re.escape(tag_prefix)).match
 
 
 class ECRClient:
     """Client for ECR operations including image polling."""
 
-    # ECR repository names
-    REPOS = {
+    # ECR repository names (read-only - shared by every client)
+    REPOS = MappingProxyType({
         "api": "superschedules-api",
         "frontend": "superschedules-frontend",
         "navigator": "superschedules-navigator",
         "collector": "superschedules-collector",
-    }
+    })
+
+    # Reuse a repository listing or image details for this long before describing again
+    IMAGES_CACHE_TTL = 60
 
     def __init__(self, region: str = "us-east-1"):
         self.region = region
-        self.ecr = boto3.client("ecr", region_name=region)
+        self.ecr = get_client("ecr", region)
+        self._images_cache: Dict[str, Tuple[float, List[Dict]]] = {}
+        self._image_info_cache: Dict[Tuple[str, str], Tuple[float, Dict]] = {}
+        # Own generator (seeded from os.urandom) so polling threads don't share
+        # the module-level random lock
+        self._rng = random.Random()
+
+    def invalidate(self) -> None:
+        """Drop cached listings and image details so the next reads hit ECR."""
+        self._images_cache.clear()
+        self._image_info_cache.clear()
+
+    def _describe_repo_images(self, repo: str) -> List[Dict]:
+        """List every tagged image in a repository, reusing a recent listing."""
+        cached = self._images_cache.get(repo)
+        if cached and time.monotonic() - cached[0] < self.IMAGES_CACHE_TTL:
+            return cached[1]
+
+        paginator = self.ecr.get_paginator("describe_images")
+        details = []
+        # Untagged layers can't be deployed or looked up by tag, so ECR drops them server-side
+        pages = paginator.paginate(
+            repositoryName=repo,
+            filter={"tagStatus": "TAGGED"},
+            PaginationConfig={"PageSize": 1000}
+        )
+        for page in pages:
+            details.extend(page.get("imageDetails", []))
+
+        self._images_cache[repo] = (time.monotonic(), details)
+        return details
+
+    def _cached_image_has_tag(self, repo: str, tag: str) -> bool:
+        """Check a recent repository listing for a tag without calling ECR."""
+        cached = self._images_cache.get(repo)
+        if not cached or time.monotonic() - cached[0] >= self.IMAGES_CACHE_TTL:
+            return False
+        return any(
+            tag in image.get("imageTags", []) and image.get("imageDigest") is not None
+            for image in cached[1]
+        )
 
     def get_repo_name(self, service: str) -> str:
         """Get ECR repository name for a service."""
@@ -28,6 +91,9 @@ class ECRClient:
 
     def image_exists(self, repo: str, tag: str) -> bool:
         """Check if an image tag exists and has a digest."""
+        # A listing only proves presence; misses fall through so polling sees new pushes
+        if self._cached_image_has_tag(repo, tag):
+            return True
         try:
             response = self.ecr.describe_images(
                 repositoryName=repo,
@@ -42,7 +108,14 @@ class ECRClient:
             raise
 
     def get_image_info(self, repo: str, tag: str) -> Optional[Dict]:
-        """Get detailed information about a specific image tag."""
+        """Get detailed information about a specific image tag.
+
+        Found images are reused for IMAGES_CACHE_TTL seconds; a missing tag
+        is always looked up again.
+        """
+        cached = self._image_info_cache.get((repo, tag))
+        if cached and time.monotonic() - cached[0] < self.IMAGES_CACHE_TTL:
+            return cached[1]
         try:
             response = self.ecr.describe_images(
                 repositoryName=repo,
@@ -53,12 +126,14 @@ class ECRClient:
                 return None
 
             image = images[0]
-            return {
+            info = {
                 "digest": image.get("imageDigest"),
                 "tags": image.get("imageTags", []),
                 "pushed_at": image.get("imagePushedAt"),
                 "size_bytes": image.get("imageSizeInBytes"),
             }
+            self._image_info_cache[(repo, tag)] = (time.monotonic(), info)
+            return info
         except ClientError as e:
             if e.response["Error"]["Code"] == "ImageNotFoundException":
                 return None
@@ -67,31 +142,32 @@ class ECRClient:
     def get_latest_images(self, repo: str, limit: int = 10, tag_prefix: str = "main-") -> List[Dict]:
         """Get recent images sorted by push time, optionally filtered by tag prefix."""
         try:
-            paginator = self.ecr.get_paginator("describe_images")
-            all_images = []
-
-            for page in paginator.paginate(repositoryName=repo):
-                for image in page.get("imageDetails", []):
-                    tags = image.get("imageTags", [])
-                    # Filter by tag prefix if specified
-                    if tag_prefix:
-                        matching_tags = [t for t in tags if t.startswith(tag_prefix)]
-                        if not matching_tags:
-                            continue
-
-                    all_images.append({
-                        "digest": image.get("imageDigest"),
-                        "tags": tags,
-                        "pushed_at": image.get("imagePushedAt"),
-                        "size_bytes": image.get("imageSizeInBytes"),
-                    })
-
-            # Sort by push time (newest first)
-            all_images.sort(key=lambda x: x["pushed_at"] or datetime.min.replace(tzinfo=timezone.utc), reverse=True)
-            return all_images[:limit]
+            images = self._describe_repo_images(repo)
         except ClientError:
             return []
 
+        # Filter by tag prefix if specified; a compiled anchored match mapped
+        # over the tags avoids a generator frame and method lookup per tag
+        has_prefix = _prefix_matcher(tag_prefix) if tag_prefix else None
+        if has_prefix:
+            images = (image for image in images if any(map(has_prefix, image.get("imageTags", ()))))
+
+        # Newest first; ECR returns images in no particular order, so a bounded
+        # heap picks the top `limit` and only those are converted
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        newest = heapq.nlargest(limit, images, key=lambda image: image.get("imagePushedAt") or oldest)
+        return [
+            {
+                "digest": image.get("imageDigest"),
+                "tags": image.get("imageTags", []),
+                # First tag with the prefix, so callers don't scan for it again
+                "matching_tag": next(filter(has_prefix, image.get("imageTags", ())), None) if has_prefix else None,
+                "pushed_at": image.get("imagePushedAt"),
+                "size_bytes": image.get("imageSizeInBytes"),
+            }
+            for image in newest
+        ]
+
     def wait_for_image(
         self,
         repo: str,
@@ -111,31 +187,111 @@ class ECRClient:
         Returns:
             True if image found, False if timeout
         """
+        found = False
+
+        def check() -> bool:
+            nonlocal found
+            found = self.image_exists(repo, tag)
+            return found
+
+        return self._poll_until(
+            check, timeout, callback and (lambda attempt, elapsed: callback(attempt, elapsed, found))
+        )
+
+    def _present_tags(self, repo: str, tags: List[str]) -> Set[str]:
+        """Get which of several tags exist with a digest, in one ECR call."""
+        response = self.ecr.batch_get_image(
+            repositoryName=repo,
+            imageIds=[{"imageTag": tag} for tag in tags]
+        )
+        # Missing tags come back under "failures" rather than raising
+        return {
+            image["imageId"]["imageTag"]
+            for image in response.get("images", [])
+            if image["imageId"].get("imageDigest")
+        }
+
+    def wait_for_images(
+        self,
+        targets: List[Tuple[str, str]],
+        timeout: int = 1200,
+        callback: Optional[Callable[[int, int, Dict[Tuple[str, str], bool]], None]] = None
+    ) -> bool:
+        """
+        Poll until several images are ready, with the same backoff as wait_for_image.
+
+        Each tick makes one batch_get_image call per repository for the tags
+        still pending, however many tags are being waited on.
+
+        Args:
+            targets: (repo, tag) pairs to wait for
+            timeout: Maximum wait time in seconds (default: 20 minutes)
+            callback: Optional callback(attempt, elapsed_seconds, found) for progress
+                updates, where found maps each target to whether it is ready
+
+        Returns:
+            True once every image is found, False if timeout
+        """
+        found = {target: False for target in targets}
+
+        def check() -> bool:
+            pending: Dict[str, List[str]] = {}
+            for (repo, tag), ready in found.items():
+                if not ready:
+                    pending.setdefault(repo, []).append(tag)
+            for repo, tags in pending.items():
+                for tag in self._present_tags(repo, tags):
+                    found[(repo, tag)] = True
+            return all(found.values())
+
+        return self._poll_until(
+            check, timeout, callback and (lambda attempt, elapsed: callback(attempt, elapsed, dict(found)))
+        )
+
+    def _poll_until(
+        self,
+        check: Callable[[], bool],
+        timeout: int,
+        on_poll: Optional[Callable[[int, int], None]] = None
+    ) -> bool:
+        """Call check with exponential backoff until it returns True or timeout passes.
+
+        A failed call (e.g. throttling) counts as not done but backs off
+        harder than an ordinary miss.
+        """
         start_time = time.time()
         attempt = 0
+        error_streak = 0
         base_delay = 2
         max_delay = 15
+        max_error_delay = 60
 
         while True:
             attempt += 1
             elapsed = int(time.time() - start_time)
 
-            # Check if image exists
-            found = self.image_exists(repo, tag)
+            try:
+                done = check()
+                error_streak = 0
+            except (BotoCoreError, ClientError):
+                done = False
+                error_streak += 1
 
-            if callback:
-                callback(attempt, elapsed, found)
+            if on_poll:
+                on_poll(attempt, elapsed)
 
-            if found:
+            if done:
                 return True
 
             # Check timeout
             if elapsed >= timeout:
                 return False
 
-            # Exponential backoff with jitter
+            # Exponential backoff with jitter, doubled again per consecutive error
             delay = min(base_delay * (2 ** min(attempt - 1, 3)), max_delay)
-            jitter = random.uniform(0, delay * 0.2)
+            if error_streak:
+                delay = min(delay * (2 ** error_streak), max_error_delay)
+            jitter = self._rng.uniform(0, delay * 0.2)
             actual_delay = delay + jitter
 
             # Don't sleep past timeout
@@ -149,22 +305,24 @@ class ECRClient:
         """
         Fetch currently deployed tag from the /health endpoint.
 
+        Requests go through a shared keep-alive pool, so repeated polls reuse
+        the TLS connection.
+
         Args:
             health_url: URL to the health endpoint (e.g., https://app.example.com/health)
 
         Returns:
             The GIT_COMMIT from the health response, or None
         """
-        import urllib.request
-        import json
-
         try:
-            with urllib.request.urlopen(health_url, timeout=10) as response:
-                data = json.loads(response.read().decode())
-                git_commit = data.get("GIT_COMMIT")
-                if git_commit and git_commit != "development":
-                    # Return as main-<commit> format
-                    return f"main-{git_commit}"
+            response = _http_pool().request("GET", health_url)
+            if response.status != 200:
                 return None
+            data = json.loads(response.data)
+            git_commit = data.get("GIT_COMMIT")
+            if git_commit and git_commit != "development":
+                # Return as main-<commit> format
+                return f"main-{git_commit}"
+            return None
         except Exception:
             return None
@@ -1,10 +1,14 @@
 """Interactive TUI for deployment management."""
+import os
+import select
+import sys
 import time
 import subprocess
-from datetime import datetime
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+from typing import Dict, Optional
 import click
-from rich.console import Console, Group
+from rich.console import Group
 from rich.layout import Layout
 from rich.live import Live
 from rich.panel import Panel
@@ -13,39 +17,67 @@ from rich.text import Text
 from rich import box
 from rich.align import Align
 
-from .aws_client import AWSClient
+from .aws_client import get_aws_client
 from .config import Config
-from .cli import DeploymentManager, get_iac_root
+from .cli import (
+    LIFECYCLE_STYLES, DeploymentManager, _humanize, check_terraform_running, console, format_uptime,
+    get_iac_root, summarize_target_health
+)
 from .ecr_client import ECRClient
-from .deploy_state import DeployState
 
+try:
+    import termios
+    import tty
+except ImportError:  # Windows - no unbuffered key reads
+    termios = None
 
-console = Console()
 
+# Header style per message type
+MESSAGE_STYLES = {
+    "info": "cyan",
+    "success": "green",
+    "error": "red",
+}
+
+# Static menu footer, shared by every menu render (never mutated)
+MENU_HELP_TEXT = Text("\nPress number key to select action, or 'q' to quit", style="dim")
+
+
+def _instance_line(instance: dict, prefix: str) -> Text:
+    """Build one instance's summary line in a single Text.assemble."""
+    lifecycle, lifecycle_style = LIFECYCLE_STYLES.get(instance["lifecycle"], LIFECYCLE_STYLES["on-demand"])
+    state = instance["state"]
+    return Text.assemble(
+        (f"{prefix}{instance['instance_id']}: ", "dim"),
+        (f"{instance['instance_type']} ", "white"),
+        (f"{lifecycle} ", lifecycle_style),
+        (f"{state} ", "green" if state == "running" else "yellow"),
+        (f"↑{format_uptime(instance['uptime'])} ", "dim"),
+        (f"${instance['hourly_cost']:.4f}/hr", "green"),
+    )
 
-def check_terraform_running() -> bool:
-    """Check if there's a terraform process currently running."""
-    try:
-        result = subprocess.run(
-            ["pgrep", "-f", "terraform"],
-            capture_output=True,
-            text=True
-        )
-        return result.returncode == 0  # 0 means process found
-    except Exception:
-        # If pgrep fails, assume no terraform running
-        return False
+
+def _cost_line(prefix: str, hourly: float, monthly: float) -> Text:
+    """Build a panel's cost footer."""
+    return Text.assemble(
+        (f"{prefix}💰 Cost: ", "white"),
+        (f"${hourly:.4f}/hr", "green"),
+        (f" (${monthly:.2f}/mo est)", "dim green"),
+    )
 
 
 class InteractiveDashboard:
     """Interactive dashboard for deployment management."""
 
+    # Re-fetch status this often while waiting for a key
+    AUTO_REFRESH_SECONDS = 30
+
     def __init__(self):
         self.config = Config()
         self.manager = DeploymentManager(self.config)
-        self.aws = AWSClient(region=self.config.region)
+        self.aws = get_aws_client(self.config.region)
         self.ecr = ECRClient(region=self.config.region)
-        self.deploy_state = DeployState(region=self.config.region)
+        self.deploy_state = self.manager.deploy_state
         self.selected_action = 0
         self.actions = [
             ("Deploy to Inactive Environment", "deploy"),
@@ -58,42 +90,52 @@ class InteractiveDashboard:
         self.last_update = None
         self.message = None
         self.message_type = "info"  # info, success, error
+        self._menu_panels: Dict[int, Panel] = {}  # Menu per selected action
 
     def create_header(self) -> Panel:
         """Create header panel."""
-        header = Text()
-        header.append("🚀 Superschedules Deployment Manager", style="bold cyan")
-        header.append(f"\nLast updated: {datetime.now().strftime('%H:%M:%S')}", style="dim")
+        # Time of the last status fetch, shown in local time
+        updated = (self.last_update or datetime.now(timezone.utc)).astimezone()
+        parts = [
+            ("🚀 Superschedules Deployment Manager", "bold cyan"),
+            (f"\nLast updated: {updated:%H:%M:%S}", "dim"),
+        ]
         if self.message:
-            header.append("\n")
-            style = {
-                "info": "cyan",
-                "success": "green",
-                "error": "red"
-            }.get(self.message_type, "white")
-            header.append(f"\n{self.message}", style=f"bold {style}")
+            style = MESSAGE_STYLES.get(self.message_type, "white")
+            parts.append((f"\n\n{self.message}", f"bold {style}"))
+        header = Text.assemble(*parts)
         return Panel(header, box=box.DOUBLE)
 
     def create_status_panels(self) -> Group:
-        """Create status panels for both environments."""
-        active_env = self.manager.get_active_environment()
-
-        # Get status for both environments
-        blue_status = self.aws.get_environment_status(
-            self.config.blue_asg,
-            self.config.blue_target_groups
-        )
-        green_status = self.aws.get_environment_status(
-            self.config.green_asg,
-            self.config.green_target_groups
-        )
+        """Create status panels for both environments.
+
+        Each call is one frame: the active environment is looked up once and
+        that answer is shared by everything drawn in the frame.
+        """
+        # Look the active environment up afresh (straight from terraform
+        # state, nothing cached) so flips made elsewhere show up
+        self.manager.invalidate_active_env()
+        # One clock read per frame, shared by the header and every panel
+        now = self.last_update = datetime.now(timezone.utc)
+
+        # Every lookup below is an independent AWS round trip, so run them
+        # together and wait for the slowest rather than their sum
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            active_future = executor.submit(self.manager.get_active_environment)
+            statuses_future = executor.submit(self.manager.get_environment_statuses)
+            beat_future = executor.submit(self.aws.get_celery_beat_status)
+            version_future = executor.submit(self._create_version_panel, now)
+
+            active_env = active_future.result()
+            blue_status, green_status = statuses_future.result()
+            beat_status = beat_future.result()
+            version_panel = version_future.result()
 
         # Create panels
         blue_panel = self._create_env_panel("Blue", blue_status, active_env == "blue")
         green_panel = self._create_env_panel("Green", green_status, active_env == "green")
 
         # Celery Beat status
-        beat_status = self.aws.get_celery_beat_status()
         beat_panel = self._create_celery_beat_panel(beat_status)
 
         # Cost summary (include celery-beat)
@@ -109,9 +151,6 @@ class InteractiveDashboard:
             box=box.ROUNDED
         )
 
-        # Version info panel
-        version_panel = self._create_version_panel()
-
         return Group(blue_panel, green_panel, beat_panel, version_panel, cost_panel)
 
     def _create_env_panel(self, name: str, status: dict, is_active: bool) -> Panel:
@@ -129,80 +168,27 @@ class InteractiveDashboard:
         lines = []
 
         # Capacity
-        lines.append(Text(f"Capacity: {status['desired_capacity']} ", style="white"))
-        lines[-1].append(f"(min: {status['min_size']}, max: {status['max_size']})", style="dim")
+        lines.append(Text.assemble(
+            (f"Capacity: {status['desired_capacity']} ", "white"),
+            (f"(min: {status['min_size']}, max: {status['max_size']})", "dim"),
+        ))
 
         # Instances
-        if status["instances"]:
-            for instance in status["instances"]:
-                uptime = instance["uptime"]
-                uptime_str = f"{uptime['days']}d {uptime['hours']}h {uptime['minutes']}m"
-                lifecycle = "Spot" if instance["lifecycle"] == "spot" else "On-Demand"
-                lifecycle_style = "yellow" if instance["lifecycle"] == "spot" else "blue"
-
-                state = instance["state"]
-                state_style = "green" if state == "running" else "yellow"
-
-                line = Text()
-                line.append(f"\n  • {instance['instance_id']}: ", style="dim")
-                line.append(f"{instance['instance_type']} ", style="white")
-                line.append(f"{lifecycle} ", style=lifecycle_style)
-                line.append(f"{state} ", style=state_style)
-                line.append(f"↑{uptime_str} ", style="dim")
-                line.append(f"${instance['hourly_cost']:.4f}/hr", style="green")
-                lines.append(line)
+        for instance in status["instances"]:
+            lines.append(_instance_line(instance, "\n  • "))
 
         # Health - show both health state and traffic routing
         lines.append(Text())  # Empty line
         for tg_name, tg_health in status["health"].items():
             if not tg_health:
-                health_line = Text("  • ", style="dim")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append("no targets", style="yellow")
-                lines.append(health_line)
+                lines.append(Text.assemble(("  • ", "dim"), (f"{tg_name}: ", "bold white"), ("no targets", "yellow")))
                 continue
 
-            # Count different health states
-            healthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "healthy")
-            unused_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unused")
-            unhealthy_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "unhealthy")
-            initial_count = sum(1 for t in tg_health if t["TargetHealth"]["State"] == "initial")
-            total_count = len(tg_health)
-
-            health_line = Text()
-            if healthy_count == total_count:
-                # All healthy and receiving traffic (active environment)
-                health_line.append("  ● ", style="green")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append(f"{healthy_count}/{total_count} ✓ receiving traffic", style="green")
-            elif unused_count == total_count:
-                # All unused - ready but not receiving traffic (inactive environment)
-                health_line.append("  ○ ", style="cyan")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append(f"{unused_count}/{total_count} ✓ ready (not receiving traffic)", style="cyan")
-            elif initial_count > 0:
-                # Still initializing
-                health_line.append("  ◐ ", style="yellow")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append(f"{initial_count}/{total_count} initializing...", style="yellow")
-            elif unhealthy_count > 0:
-                # Some unhealthy
-                health_line.append("  ✗ ", style="red")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append(f"{unhealthy_count}/{total_count} failing checks", style="red")
-            else:
-                # Mixed state
-                health_line.append("  ◐ ", style="yellow")
-                health_line.append(f"{tg_name}: ", style="bold white")
-                health_line.append(f"mixed state", style="yellow")
-
-            lines.append(health_line)
+            icon, style, detail, _ = summarize_target_health(tg_health)
+            lines.append(Text.assemble((f"  {icon} ", style), (f"{tg_name}: ", "bold white"), (detail, style)))
 
         # Cost
-        cost_line = Text(f"\n\n💰 Cost: ", style="white")
-        cost_line.append(f"${status['total_hourly_cost']:.4f}/hr", style="green")
-        cost_line.append(f" (${status['total_monthly_cost']:.2f}/mo est)", style="dim green")
-        lines.append(cost_line)
+        lines.append(_cost_line("\n\n", status["total_hourly_cost"], status["total_monthly_cost"]))
 
         return Panel(Group(*lines), title=title, border_style=color, box=box.ROUNDED)
 
@@ -218,42 +204,20 @@ class InteractiveDashboard:
         lines = []
 
         # Instance info
-        uptime = instance["uptime"]
-        uptime_str = f"{uptime['days']}d {uptime['hours']}h {uptime['minutes']}m"
-        lifecycle = "Spot" if instance["lifecycle"] == "spot" else "On-Demand"
-        lifecycle_style = "yellow" if instance["lifecycle"] == "spot" else "blue"
-
-        state = instance["state"]
-        state_style = "green" if state == "running" else "yellow"
-
-        line = Text()
-        line.append(f"  • {instance['instance_id']}: ", style="dim")
-        line.append(f"{instance['instance_type']} ", style="white")
-        line.append(f"{lifecycle} ", style=lifecycle_style)
-        line.append(f"{state} ", style=state_style)
-        line.append(f"↑{uptime_str} ", style="dim")
-        line.append(f"${instance['hourly_cost']:.4f}/hr", style="green")
-        lines.append(line)
+        lines.append(_instance_line(instance, "  • "))
 
         # Status indicator
-        status_line = Text("\n  ")
-        if state == "running":
-            status_line.append("● ", style="green")
-            status_line.append("Scheduling tasks", style="green")
+        if instance["state"] == "running":
+            lines.append(Text.assemble("\n  ", ("● Scheduling tasks", "green")))
         else:
-            status_line.append("◐ ", style="yellow")
-            status_line.append("Starting...", style="yellow")
-        lines.append(status_line)
+            lines.append(Text.assemble("\n  ", ("◐ Starting...", "yellow")))
 
         # Cost
-        cost_line = Text(f"\n💰 Cost: ", style="white")
-        cost_line.append(f"${status['hourly_cost']:.4f}/hr", style="green")
-        cost_line.append(f" (${status['monthly_cost']:.2f}/mo est)", style="dim green")
-        lines.append(cost_line)
+        lines.append(_cost_line("\n", status["hourly_cost"], status["monthly_cost"]))
 
         return Panel(Group(*lines), title=title, border_style="yellow", box=box.ROUNDED)
 
-    def _create_version_panel(self) -> Panel:
+    def _create_version_panel(self, now: datetime) -> Panel:
         """Create panel showing deployed vs available versions."""
         title = "📦 Image Versions"
         lines = []
@@ -275,11 +239,7 @@ class InteractiveDashboard:
 
             # Latest available
             if api_images:
-                latest_tag = None
-                for t in api_images[0].get("tags", []):
-                    if t.startswith("main-"):
-                        latest_tag = t
-                        break
+                latest_tag = api_images[0]["matching_tag"]
 
                 latest_line = Text("  Available: ", style="bold white")
                 if latest_tag:
@@ -296,15 +256,7 @@ class InteractiveDashboard:
                 # Pushed time
                 pushed_at = api_images[0].get("pushed_at")
                 if pushed_at:
-                    from datetime import timezone
-                    now = datetime.now(timezone.utc)
-                    delta = now - pushed_at
-                    if delta.days > 0:
-                        pushed_str = f"{delta.days}d ago"
-                    elif delta.seconds > 3600:
-                        pushed_str = f"{delta.seconds // 3600}h ago"
-                    else:
-                        pushed_str = f"{delta.seconds // 60}m ago"
+                    pushed_str = _humanize(pushed_at, now)
                     pushed_line = Text(f"  Last push: ", style="dim")
                     pushed_line.append(pushed_str, style="dim")
                     lines.append(pushed_line)
@@ -317,7 +269,15 @@ class InteractiveDashboard:
         return Panel(Group(*lines), title=title, border_style="magenta", box=box.ROUNDED)
 
     def create_menu(self) -> Panel:
-        """Create interactive menu."""
+        """Create interactive menu.
+
+        The menu only changes with the selected action, so each variant is
+        built once and reused on later redraws.
+        """
+        panel = self._menu_panels.get(self.selected_action)
+        if panel is not None:
+            return panel
+
         table = Table(box=box.SIMPLE, show_header=False, padding=(0, 2))
         table.add_column("Key", style="cyan", width=5)
         table.add_column("Action", style="white")
@@ -329,23 +289,24 @@ class InteractiveDashboard:
             else:
                 table.add_row(key, action_name)
 
-        help_text = Text("\nPress number key to select action, or 'q' to quit", style="dim")
-        content = Group(table, help_text)
-
-        return Panel(content, title="🎛️  Actions", border_style="cyan", box=box.ROUNDED)
+        content = Group(table, MENU_HELP_TEXT)
+        panel = Panel(content, title="🎛️  Actions", border_style="cyan", box=box.ROUNDED)
+        self._menu_panels[self.selected_action] = panel
+        return panel
 
     def create_layout(self) -> Layout:
         """Create the main layout."""
         layout = Layout()
 
         layout.split_column(
-            Layout(name="header", size=5),
+            Layout(name="header", size=6),  # Title, timestamp and a message
             Layout(name="status", ratio=2),
             Layout(name="menu", size=len(self.actions) + 5)
         )
 
-        layout["header"].update(self.create_header())
+        # Status first - it stamps the frame time the header shows
         layout["status"].update(self.create_status_panels())
+        layout["header"].update(self.create_header())
         layout["menu"].update(self.create_menu())
 
         return layout
@@ -359,6 +320,12 @@ class InteractiveDashboard:
         """Clear status message."""
         self.message = None
 
+    def refresh(self):
+        """Drop cached ECR listings and history so the next redraw is fresh."""
+        self.ecr.invalidate()
+        self.deploy_state.invalidate()
+        self.set_message("Status refreshed", "success")
+
     def run_action(self, action_key: str) -> bool:
         """Run selected action. Returns False to exit."""
         self.clear_message()
@@ -367,7 +334,7 @@ class InteractiveDashboard:
             return False
 
         if action_key == "refresh":
-            self.set_message("Status refreshed", "success")
+            self.refresh()
             return True
 
         if action_key == "deploy":
@@ -405,6 +372,10 @@ class InteractiveDashboard:
             return True
 
         if action_key == "scale_down":
+            # The last frame may be minutes old; never pick the side to scale
+            # down from it. This re-reads terraform state, and capacity below
+            # then reuses this fresh answer.
+            self.manager.invalidate_active_env()
             active_env = self.manager.get_active_environment()
             inactive_env = "green" if active_env == "blue" else "blue"
             active_capacity = self.manager.get_active_capacity()
@@ -418,9 +389,8 @@ class InteractiveDashboard:
                 return True
 
             try:
-                import subprocess
-                cmd = f"make deploy:scale-down-{inactive_env} ACTIVE_DESIRED_CAPACITY={active_capacity}"
-                result = subprocess.run(cmd, shell=True, check=True, capture_output=True, text=True, cwd=get_iac_root())
+                cmd = ["make", f"deploy:scale-down-{inactive_env}", f"ACTIVE_DESIRED_CAPACITY={active_capacity}"]
+                result = subprocess.run(cmd, check=True, capture_output=True, text=True, cwd=get_iac_root())
                 console.print(result.stdout)
                 console.print(f"\n[green]✓ {inactive_env.upper()} scaled down successfully![/green]")
                 console.print(f"[green]✓ {active_env.upper()} capacity preserved at {active_capacity}[/green]")
@@ -446,14 +416,82 @@ class InteractiveDashboard:
             console.print("[dim]Hint: Check for running deployments or terraform apply commands.[/dim]")
             return
 
+        if termios is None or not sys.stdin.isatty():
+            # No single-key input (Windows, piped stdin) - fall back to prompting
+            self._run_prompt_loop()
+            return
+
+        while True:
+            action_key = self._select_action()
+            if action_key is None or not self.run_action(action_key):
+                break
+
+    def _update_live_layout(self, layout: Layout, fetch: bool):
+        """Redraw the header and menu, re-fetching the status panels if asked."""
+        if fetch:
+            layout["status"].update(self.create_status_panels())
+        layout["header"].update(self.create_header())
+        layout["menu"].update(self.create_menu())
+
+    def _select_action(self) -> Optional[str]:
+        """Show the live dashboard until an action key is pressed.
+
+        Keys are read unbuffered with a timeout so the status re-fetches every
+        AUTO_REFRESH_SECONDS while idle, and Live only repaints the cells that
+        changed instead of clearing and reprinting the whole screen.
+
+        Returns:
+            The chosen action key, or None to quit
+        """
+        layout = self.create_layout()
+        fd = sys.stdin.fileno()
+        saved_tty = termios.tcgetattr(fd)
+        try:
+            tty.setcbreak(fd)
+            with Live(layout, console=console, screen=True, auto_refresh=False) as live:
+                next_fetch = time.monotonic() + self.AUTO_REFRESH_SECONDS
+                while True:
+                    ready, _, _ = select.select([sys.stdin], [], [], max(0, next_fetch - time.monotonic()))
+                    # Read the fd directly; sys.stdin buffering would hide pending keys from select
+                    key = os.read(fd, 1).decode(errors="replace").lower() if ready else None
+
+                    if key is None:
+                        action_key = "refresh"
+                    elif key == "q":
+                        return None
+                    elif key == "r":
+                        action_key = "refresh"
+                        self.refresh()
+                    elif key.isdigit() and 1 <= int(key) <= len(self.actions):
+                        self.selected_action = int(key) - 1
+                        action_key = self.actions[self.selected_action][1]
+                        if action_key == "refresh":
+                            self.refresh()
+                        elif action_key == "exit":
+                            return None
+                        else:
+                            return action_key
+                    else:
+                        self.set_message(f"Invalid key. Press 1-{len(self.actions)}, 'r' or 'q'.", "error")
+                        action_key = None
+
+                    if action_key == "refresh":
+                        next_fetch = time.monotonic() + self.AUTO_REFRESH_SECONDS
+                    self._update_live_layout(layout, fetch=action_key == "refresh")
+                    live.refresh()
+        finally:
+            termios.tcsetattr(fd, termios.TCSADRAIN, saved_tty)
+
+    def _run_prompt_loop(self):
+        """Redraw and prompt for a line of input after every action."""
         console.clear()
 
         while True:
-            # Display the dashboard
+            # Display the dashboard; status first - it stamps the frame time
+            status_panels = self.create_status_panels()
             console.clear()
             console.print(self.create_header())
             console.print()
-            status_panels = self.create_status_panels()
             console.print(status_panels)
             console.print()
             console.print(self.create_menu())
@@ -467,7 +505,7 @@ class InteractiveDashboard:
                     break
 
                 if choice == 'r':
-                    self.set_message("Status refreshed", "success")
+                    self.refresh()
                     continue
 
                 if choice.isdigit():
@@ -6,7 +6,7 @@ setup(
     version="0.1.0",
     packages=find_packages(),
     install_requires=[
-        "boto3>=1.34.0",
+        "boto3>=1.36.0",
         "click>=8.1.0",
         "rich>=13.7.0",
         "python-dateutil>=2.8.2",
@@ -1,8 +1,8 @@
 """Tests for AWS client wrapper."""
 import pytest
 from datetime import datetime, timezone
-from unittest.mock import Mock, MagicMock
-from deploy_manager.aws_client import AWSClient
+from unittest.mock import Mock, patch
+from deploy_manager.aws_client import AWSClient, get_aws_client, get_client, get_session
 
 
 @pytest.fixture
@@ -13,9 +13,52 @@ def aws_client():
     client.elbv2 = Mock()
     client.autoscaling = Mock()
     client.pricing = Mock()
+    client.s3 = Mock()
     return client
 
 
+@pytest.fixture
+def stubbed_ec2(aws_client):
+    """Swap in a real ec2 client so request and response shapes are validated."""
+    import boto3
+    from botocore.stub import Stubber
+    aws_client.ec2 = boto3.client("ec2", region_name="us-east-1")
+    with Stubber(aws_client.ec2) as stubber:
+        yield stubber
+        stubber.assert_no_pending_responses()
+
+
+class TestClientCaching:
+    """Tests for shared session and client reuse."""
+
+    def test_get_session_is_shared_per_region(self):
+        """Test that sessions are built once per region."""
+        assert get_session("us-east-1") is get_session("us-east-1")
+        assert get_session("us-east-1") is not get_session("us-west-2")
+
+    def test_get_aws_client_is_shared_per_region(self):
+        """Test that the AWSClient factory returns the same instance."""
+        assert get_aws_client("us-east-1") is get_aws_client("us-east-1")
+
+    def test_clients_use_adaptive_retries(self):
+        """Test that every shared client gets the adaptive retry and pool config."""
+        for service in ("autoscaling", "s3", "ssm"):
+            config = get_client(service, "us-east-1").meta.config
+            assert config.retries["mode"] == "adaptive"
+            assert config.max_pool_connections == 25
+            assert config.connect_timeout == 3
+            assert config.tcp_keepalive is True
+
+    def test_clients_are_shared_across_wrappers(self):
+        """Test that DeployState and ECRClient reuse AWSClient's boto3 clients."""
+        from deploy_manager.deploy_state import DeployState
+        from deploy_manager.ecr_client import ECRClient
+
+        assert get_client("s3", "us-east-1") is get_client("s3", "us-east-1")
+        assert DeployState(region="us-east-1").s3 is AWSClient(region="us-east-1").s3
+        assert ECRClient(region="us-east-1").ecr is get_client("ecr", "us-east-1")
+
+
 class TestGetASGInfo:
     """Tests for get_asg_info method."""
 
@@ -50,6 +93,32 @@ class TestGetASGInfo:
 
         assert result is None
 
+    def test_get_asg_infos_single_call(self, aws_client):
+        """Test several ASGs are described in one call and keyed by name."""
+        aws_client.autoscaling.describe_auto_scaling_groups.return_value = {
+            "AutoScalingGroups": [{"AutoScalingGroupName": "asg-blue", "DesiredCapacity": 2}]
+        }
+
+        result = aws_client.get_asg_infos(["asg-blue", "asg-green"])
+
+        assert result == {"asg-blue": {"AutoScalingGroupName": "asg-blue", "DesiredCapacity": 2}}
+        aws_client.autoscaling.describe_auto_scaling_groups.assert_called_once_with(
+            AutoScalingGroupNames=["asg-blue", "asg-green"]
+        )
+
+    def test_get_asg_summary(self, aws_client):
+        """Test ASG summary returns desired capacity and instance ID set."""
+        aws_client.autoscaling.describe_auto_scaling_groups.return_value = {
+            "AutoScalingGroups": [{
+                "DesiredCapacity": 2,
+                "Instances": [{"InstanceId": "i-123"}, {"InstanceId": "i-456"}]
+            }]
+        }
+
+        result = aws_client.get_asg_summary("test-asg")
+
+        assert result == (2, frozenset({"i-123", "i-456"}))
+
 
 class TestGetTargetGroupHealth:
     """Tests for get_target_group_health method."""
@@ -75,13 +144,27 @@ class TestGetTargetGroupHealth:
         assert result[0]["TargetHealth"]["State"] == "healthy"
         assert result[1]["TargetHealth"]["State"] == "unhealthy"
 
+    def test_get_target_groups_health_keys_by_arn(self, aws_client):
+        """Test each target group's health is returned under its own ARN."""
+        aws_client.elbv2.describe_target_health.side_effect = lambda TargetGroupArn: {
+            "TargetHealthDescriptions": [{"Target": {"Id": TargetGroupArn}, "TargetHealth": {"State": "healthy"}}]
+        }
+
+        result = aws_client.get_target_groups_health(["arn:tg-frontend", "arn:tg-django"])
+
+        assert {arn: health[0]["Target"]["Id"] for arn, health in result.items()} == {
+            "arn:tg-frontend": "arn:tg-frontend",
+            "arn:tg-django": "arn:tg-django",
+        }
+        assert aws_client.elbv2.describe_target_health.call_count == 2
+
 
 class TestGetInstanceDetails:
     """Tests for get_instance_details method."""
 
-    def test_get_instance_details_success(self, aws_client):
+    def test_get_instance_details_success(self, aws_client, stubbed_ec2):
         """Test getting instance details."""
-        aws_client.ec2.describe_instances.return_value = {
+        stubbed_ec2.add_response("describe_instances", {
             "Reservations": [{
                 "Instances": [
                     {
@@ -93,7 +176,7 @@ class TestGetInstanceDetails:
                     }
                 ]
             }]
-        }
+        }, expected_params={"InstanceIds": ["i-123"]})
 
         result = aws_client.get_instance_details(["i-123"])
 
@@ -101,12 +184,45 @@ class TestGetInstanceDetails:
         assert result[0]["InstanceId"] == "i-123"
         assert result[0]["InstanceType"] == "t3.micro"
 
-    def test_get_instance_details_empty_list(self, aws_client):
-        """Test getting instance details with empty list."""
+    def test_get_instance_details_chunks_large_lists(self, aws_client):
+        """Test large ID lists are described in ordered batches."""
+        def describe(InstanceIds):
+            return {"Reservations": [{"Instances": [{"InstanceId": i} for i in InstanceIds]}]}
+
+        aws_client.ec2.describe_instances.side_effect = describe
+        instance_ids = [f"i-{n:03d}" for n in range(250)]
+
+        with patch.object(AWSClient, "INSTANCE_BATCH_SIZE", 100):
+            result = aws_client.get_instance_details(instance_ids)
+
+        assert [i["InstanceId"] for i in result] == instance_ids
+        assert sorted(len(c.kwargs["InstanceIds"]) for c in aws_client.ec2.describe_instances.call_args_list) == [50, 100, 100]
+
+    def test_get_instance_details_empty_list(self, aws_client, stubbed_ec2):
+        """Test getting instance details with empty list skips the API call."""
         result = aws_client.get_instance_details([])
 
         assert result == []
-        aws_client.ec2.describe_instances.assert_not_called()
+
+
+class TestTerminateInstances:
+    """Tests for terminate_instances method."""
+
+    def test_terminate_instances_single_call(self, aws_client, stubbed_ec2):
+        """Test all instances are terminated in one API call."""
+        stubbed_ec2.add_response(
+            "terminate_instances",
+            {"TerminatingInstances": [{"InstanceId": "i-123"}, {"InstanceId": "i-456"}]},
+            expected_params={"InstanceIds": ["i-123", "i-456"]}
+        )
+
+        result = aws_client.terminate_instances(["i-123", "i-456"])
+
+        assert len(result) == 2
+
+    def test_terminate_instances_empty_list(self, aws_client, stubbed_ec2):
+        """Test terminating nothing skips the API call."""
+        assert aws_client.terminate_instances([]) == []
 
 
 class TestCalculateInstanceUptime:
@@ -114,28 +230,33 @@ class TestCalculateInstanceUptime:
 
     def test_calculate_uptime_days(self, aws_client):
         """Test uptime calculation for days."""
-        launch_time = datetime.now(timezone.utc).replace(
-            day=datetime.now(timezone.utc).day - 2,
-            hour=datetime.now(timezone.utc).hour - 3,
-            minute=datetime.now(timezone.utc).minute - 15
-        )
-
-        days, hours, minutes = aws_client.calculate_instance_uptime(launch_time)
+        from datetime import timedelta
+        now = datetime.now(timezone.utc)
+        launch_time = now - timedelta(days=2, hours=3, minutes=15)
 
-        assert days == 2
-        assert hours == 3
-        assert 14 <= minutes <= 16  # Allow small timing variations
+        assert aws_client.calculate_instance_uptime(launch_time, now) == (2, 3, 15)
 
     def test_calculate_uptime_hours(self, aws_client):
         """Test uptime calculation for hours."""
         from datetime import timedelta
-        launch_time = datetime.now(timezone.utc) - timedelta(hours=5, minutes=30)
+        now = datetime.now(timezone.utc)
+        launch_time = now - timedelta(hours=5, minutes=30)
+
+        assert aws_client.calculate_instance_uptime(launch_time, now) == (0, 5, 30)
 
-        days, hours, minutes = aws_client.calculate_instance_uptime(launch_time)
+    def test_calculate_uptime_defaults_to_clock(self):
+        """Test uptime is measured against the client's clock when now is omitted."""
+        now = datetime(2024, 1, 3, 15, 45, tzinfo=timezone.utc)
+        client = AWSClient(region="us-east-1", clock=lambda: now)
 
-        assert days == 0
-        assert hours == 5
-        assert 29 <= minutes <= 31
+        assert client.calculate_instance_uptime(datetime(2024, 1, 3, 14, 30, tzinfo=timezone.utc)) == (0, 1, 15)
+
+    def test_calculate_uptime_at_given_time(self, aws_client):
+        """Test uptime is measured against the supplied moment."""
+        launch_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        now = datetime(2024, 1, 3, 15, 45, 59, tzinfo=timezone.utc)
+
+        assert aws_client.calculate_instance_uptime(launch_time, now) == (2, 3, 45)
 
 
 class TestGetEnvironmentStatus:
@@ -153,9 +274,27 @@ class TestGetEnvironmentStatus:
         assert result["desired_capacity"] == 0
         assert result["instances"] == []
 
+    def test_scaled_down_environment_skips_lookups(self, aws_client):
+        """Test an empty, scaled-down environment only costs the ASG describe."""
+        aws_client.autoscaling.describe_auto_scaling_groups.return_value = {
+            "AutoScalingGroups": [{"DesiredCapacity": 0, "MinSize": 0, "MaxSize": 2, "Instances": []}]
+        }
+
+        result = aws_client.get_environment_status("test-asg", {"frontend": "arn:tg"})
+
+        assert result["exists"] is True
+        assert result["instances"] == []
+        assert result["health"] == {"frontend": []}
+        assert result["total_monthly_cost"] == 0.0
+        aws_client.elbv2.describe_target_health.assert_not_called()
+        aws_client.ec2.describe_instances.assert_not_called()
+        aws_client.ec2.describe_spot_price_history.assert_not_called()
+
     def test_environment_with_instances(self, aws_client):
         """Test getting status with running instances."""
-        launch_time = datetime.now(timezone.utc)
+        from datetime import timedelta
+        launch_time = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        aws_client._now = lambda: launch_time + timedelta(hours=1, minutes=15)
 
         aws_client.autoscaling.describe_auto_scaling_groups.return_value = {
             "AutoScalingGroups": [{
@@ -187,7 +326,11 @@ class TestGetEnvironmentStatus:
         }
 
         aws_client.ec2.describe_spot_price_history.return_value = {
-            "SpotPriceHistory": [{"SpotPrice": "0.0033"}]
+            "SpotPriceHistory": [{
+                "InstanceType": "t3.micro",
+                "AvailabilityZone": "us-east-1a",
+                "SpotPrice": "0.0033"
+            }]
         }
 
         result = aws_client.get_environment_status(
@@ -201,30 +344,269 @@ class TestGetEnvironmentStatus:
         assert result["instances"][0]["instance_type"] == "t3.micro"
         assert result["instances"][0]["lifecycle"] == "spot"
         assert result["instances"][0]["hourly_cost"] == 0.0033
+        assert result["instances"][0]["uptime"] == {"days": 0, "hours": 1, "minutes": 15}
         assert result["total_hourly_cost"] > 0
 
 
+class TestGetCeleryBeatStatus:
+    """Tests for get_celery_beat_status method."""
+
+    def _beat_instance(self, aws_client, launch_time):
+        """Describe a single spot beat instance."""
+        aws_client.autoscaling.describe_auto_scaling_groups.return_value = {
+            "AutoScalingGroups": [{"Instances": [{"InstanceId": "i-beat"}]}]
+        }
+        aws_client.ec2.describe_instances.return_value = {
+            "Reservations": [{
+                "Instances": [{
+                    "InstanceId": "i-beat",
+                    "InstanceType": "t3.nano",
+                    "InstanceLifecycle": "spot",
+                    "State": {"Name": "running"},
+                    "LaunchTime": launch_time,
+                    "Placement": {"AvailabilityZone": "us-east-1b"}
+                }]
+            }]
+        }
+
+    def test_spot_price_and_uptime_share_one_moment(self, aws_client):
+        """Test the spot price is queried as of the moment uptime is measured from."""
+        from datetime import timedelta
+        self._beat_instance(aws_client, datetime.now(timezone.utc) - timedelta(hours=2))
+        aws_client.ec2.describe_spot_price_history.return_value = {
+            "SpotPriceHistory": [{
+                "InstanceType": "t3.nano",
+                "AvailabilityZone": "us-east-1b",
+                "SpotPrice": "0.0017"
+            }]
+        }
+
+        with patch.object(aws_client, 'calculate_instance_uptime', return_value=(0, 2, 0)) as mock_uptime:
+            result = aws_client.get_celery_beat_status()
+
+        assert result["hourly_cost"] == 0.0017
+        start_time = aws_client.ec2.describe_spot_price_history.call_args.kwargs["StartTime"]
+        assert mock_uptime.call_args[0][1] is start_time
+
+    def test_falls_back_without_price_history(self, aws_client):
+        """Test an approximate price is used when the spot history is empty."""
+        self._beat_instance(aws_client, datetime.now(timezone.utc))
+        aws_client.ec2.describe_spot_price_history.return_value = {"SpotPriceHistory": []}
+
+        assert aws_client.get_celery_beat_status()["hourly_cost"] == 0.0016
+
+
 class TestGetSpotPrice:
     """Tests for get_spot_price method."""
 
-    def test_get_spot_price_success(self, aws_client):
+    def test_get_spot_price_success(self, aws_client, stubbed_ec2):
         """Test getting spot price."""
-        aws_client.ec2.describe_spot_price_history.return_value = {
+        stubbed_ec2.add_response("describe_spot_price_history", {
             "SpotPriceHistory": [
                 {"SpotPrice": "0.0031", "Timestamp": datetime.now(timezone.utc)}
             ]
-        }
+        }, expected_params={
+            "InstanceTypes": ["t3.micro"],
+            "ProductDescriptions": ["Linux/UNIX"],
+            "AvailabilityZone": "us-east-1a",
+            "MaxResults": 1
+        })
 
         price = aws_client.get_spot_price("t3.micro", "us-east-1a")
 
         assert price == 0.0031
 
-    def test_get_spot_price_no_history(self, aws_client):
+    def test_get_spot_price_no_history(self, aws_client, stubbed_ec2):
         """Test getting spot price with no history."""
-        aws_client.ec2.describe_spot_price_history.return_value = {
-            "SpotPriceHistory": []
-        }
+        stubbed_ec2.add_response("describe_spot_price_history", {"SpotPriceHistory": []})
 
         price = aws_client.get_spot_price("t3.micro", "us-east-1a")
 
         assert price is None
+
+
+class TestGetSpotPrices:
+    """Tests for get_spot_prices method."""
+
+    def test_get_spot_prices_batches_one_call(self, aws_client, stubbed_ec2):
+        """Test that every pair is priced from a single API call."""
+        now = datetime.now(timezone.utc)
+        stubbed_ec2.add_response("describe_spot_price_history", {
+            "SpotPriceHistory": [
+                {"InstanceType": "t3.micro", "AvailabilityZone": "us-east-1a", "SpotPrice": "0.0031"},
+                {"InstanceType": "t3.micro", "AvailabilityZone": "us-east-1b", "SpotPrice": "0.0035"},
+                {"InstanceType": "t3.small", "AvailabilityZone": "us-east-1a", "SpotPrice": "0.0062"},
+                {"InstanceType": "t3.micro", "AvailabilityZone": "us-east-1a", "SpotPrice": "0.0029"},
+            ]
+        }, expected_params={
+            "InstanceTypes": ["t3.micro"],
+            "ProductDescriptions": ["Linux/UNIX"],
+            "Filters": [{"Name": "availability-zone", "Values": ["us-east-1a", "us-east-1b"]}],
+            "StartTime": now
+        })
+
+        prices = aws_client.get_spot_prices([
+            ("t3.micro", "us-east-1a"),
+            ("t3.micro", "us-east-1b"),
+            ("t3.micro", "us-east-1a"),
+        ], now)
+
+        assert prices == {
+            ("t3.micro", "us-east-1a"): 0.0031,
+            ("t3.micro", "us-east-1b"): 0.0035,
+        }
+
+    def test_get_spot_prices_reuses_recent_prices(self, aws_client, stubbed_ec2):
+        """Test prices are served from cache within SPOT_PRICE_TTL and refetched after."""
+        from datetime import timedelta
+        now = datetime(2024, 1, 1, 12, 0, tzinfo=timezone.utc)
+        expired = now + timedelta(seconds=AWSClient.SPOT_PRICE_TTL)
+        history = {"SpotPriceHistory": [
+            {"InstanceType": "t3.micro", "AvailabilityZone": "us-east-1a", "SpotPrice": "0.0031"}
+        ]}
+        stubbed_ec2.add_response("describe_spot_price_history", history)
+        stubbed_ec2.add_response("describe_spot_price_history", {"SpotPriceHistory": []})
+        stubbed_ec2.add_response("describe_spot_price_history", history, expected_params={
+            "InstanceTypes": ["t3.micro"],
+            "ProductDescriptions": ["Linux/UNIX"],
+            "Filters": [{"Name": "availability-zone", "Values": ["us-east-1a"]}],
+            "StartTime": expired
+        })
+
+        pair, other = ("t3.micro", "us-east-1a"), ("t3.small", "us-east-1b")
+        assert aws_client.get_spot_prices([pair], now) == {pair: 0.0031}
+        # Only the pair not seen yet is fetched; it has no history, which is cached too
+        assert aws_client.get_spot_prices([pair, other], now + timedelta(seconds=30)) == {pair: 0.0031}
+        assert aws_client.get_spot_prices([other], now + timedelta(seconds=45)) == {}
+        assert aws_client.get_spot_prices([pair], expired) == {pair: 0.0031}
+
+    def test_get_spot_prices_no_pairs(self, aws_client, stubbed_ec2):
+        """Test that no API call is made when there is nothing to price."""
+        assert aws_client.get_spot_prices([]) == {}
+
+
+class TestGetOndemandPrice:
+    """Tests for get_ondemand_price method."""
+
+    def test_listed_type_skips_pricing_api(self, aws_client):
+        """Test a type in the built-in table is priced without an API call."""
+        assert aws_client.get_ondemand_price("t3.micro") == 0.0104
+        aws_client.pricing.get_products.assert_not_called()
+
+    def test_unlisted_type_is_looked_up_once(self, aws_client):
+        """Test a missing type is fetched from the Pricing API and then reused."""
+        import json
+        product = {"terms": {"OnDemand": {"SKU.TERM": {"priceDimensions": {
+            "SKU.TERM.DIM": {"pricePerUnit": {"USD": "0.0960000000"}}
+        }}}}}
+        aws_client.pricing.get_products.return_value = {"PriceList": [json.dumps(product)]}
+
+        assert aws_client.get_ondemand_price("m5.large") == 0.096
+        assert aws_client.get_ondemand_price("m5.large") == 0.096
+        aws_client.pricing.get_products.assert_called_once()
+        filters = aws_client.pricing.get_products.call_args.kwargs["Filters"]
+        assert {"Type": "TERM_MATCH", "Field": "instanceType", "Value": "m5.large"} in filters
+        assert {"Type": "TERM_MATCH", "Field": "regionCode", "Value": "us-east-1"} in filters
+
+    def test_unpriceable_type_returns_none(self, aws_client):
+        """Test a type the Pricing API doesn't know is reported as None, once."""
+        aws_client.pricing.get_products.return_value = {"PriceList": []}
+
+        assert aws_client.get_ondemand_price("x9.huge") is None
+        assert aws_client.get_ondemand_price("x9.huge") is None
+        aws_client.pricing.get_products.assert_called_once()
+
+
+class TestGetTerraformOutput:
+    """Tests for get_terraform_output method."""
+
+    def test_reads_output_value(self, aws_client):
+        """Test an output value is read from the state JSON."""
+        import io
+        state = b'{"outputs": {"active_color": {"value": "green", "type": "string"}}}'
+        aws_client.s3.get_object.return_value = {"Body": io.BytesIO(state)}
+
+        assert aws_client.get_terraform_output("bucket", "key", "active_color") == "green"
+        aws_client.s3.get_object.assert_called_once_with(Bucket="bucket", Key="key")
+
+    def test_missing_output_returns_none(self, aws_client):
+        """Test a state without the output returns None."""
+        import io
+        aws_client.s3.get_object.return_value = {"Body": io.BytesIO(b'{"outputs": {}}')}
+
+        assert aws_client.get_terraform_output("bucket", "key", "active_color") is None
+
+
+class TestWaitForTargetsSettled:
+    """Tests for wait_for_targets_settled method."""
+
+    @pytest.fixture
+    def stubbed_elbv2(self, aws_client):
+        """Swap in a real elbv2 client so the waiter model is exercised."""
+        import boto3
+        from botocore.stub import Stubber
+        aws_client.elbv2 = boto3.client("elbv2", region_name="us-east-1")
+        with Stubber(aws_client.elbv2) as stubber:
+            yield stubber
+
+    @staticmethod
+    def _health(*states):
+        return {"TargetHealthDescriptions": [{"TargetHealth": {"State": s}} for s in states]}
+
+    def test_unused_and_healthy_targets_settle(self, aws_client, stubbed_elbv2):
+        """Test unused targets count as settled once enough are registered."""
+        stubbed_elbv2.add_response("describe_target_health", self._health("unused"))
+        stubbed_elbv2.add_response("describe_target_health", self._health("initial", "unused"))
+        stubbed_elbv2.add_response("describe_target_health", self._health("unused", "unused"))
+
+        with patch('time.sleep'):
+            assert aws_client.wait_for_targets_settled("arn:tg", min_targets=2, delay=1, max_attempts=5) is True
+
+        stubbed_elbv2.assert_no_pending_responses()
+
+    def test_mixed_healthy_and_unused_is_not_settled(self, aws_client, stubbed_elbv2):
+        """Test a group mixing healthy and unused targets keeps waiting."""
+        stubbed_elbv2.add_response("describe_target_health", self._health("healthy", "unused"))
+        stubbed_elbv2.add_response("describe_target_health", self._health("healthy", "healthy"))
+
+        with patch('time.sleep'):
+            assert aws_client.wait_for_targets_settled("arn:tg", min_targets=2, delay=1, max_attempts=5) is True
+
+        stubbed_elbv2.assert_no_pending_responses()
+
+    def test_stop_event_ends_the_wait(self, aws_client, stubbed_elbv2):
+        """Test setting stop ends the wait between attempts without further calls."""
+        import threading
+        stop = threading.Event()
+        stubbed_elbv2.add_response("describe_target_health", self._health("initial"))
+
+        with patch.object(stop, 'wait', side_effect=lambda timeout: stop.set() or True) as mock_wait:
+            assert aws_client.wait_for_targets_settled("arn:tg", delay=5, max_attempts=10, stop=stop) is False
+
+        mock_wait.assert_called_once_with(5)
+        stubbed_elbv2.assert_no_pending_responses()
+
+    def test_api_error_ends_the_wait(self, aws_client, stubbed_elbv2):
+        """Test an API error gives up instead of retrying."""
+        stubbed_elbv2.add_client_error("describe_target_health", "TargetGroupNotFound")
+
+        with patch('time.sleep') as mock_sleep:
+            assert aws_client.wait_for_targets_settled("arn:tg", delay=1, max_attempts=5) is False
+
+        mock_sleep.assert_not_called()
+
+    def test_already_stopped_makes_no_calls(self, aws_client, stubbed_elbv2):
+        """Test a wait started after stop was set returns at once."""
+        import threading
+        stop = threading.Event()
+        stop.set()
+
+        assert aws_client.wait_for_targets_settled("arn:tg", stop=stop) is False
+
+    def test_gives_up_after_max_attempts(self, aws_client, stubbed_elbv2):
+        """Test the waiter returns False when targets never settle."""
+        for _ in range(2):
+            stubbed_elbv2.add_response("describe_target_health", self._health("unhealthy"))
+
+        with patch('time.sleep'):
+            assert aws_client.wait_for_targets_settled("arn:tg", delay=1, max_attempts=2) is False
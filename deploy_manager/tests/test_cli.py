@@ -1,19 +1,35 @@
 """Tests for CLI deployment manager."""
+import os
 import pytest
-from unittest.mock import Mock, patch, MagicMock
-from deploy_manager.cli import DeploymentManager
+import subprocess
+import sys
+from concurrent.futures import Future
+from pathlib import Path
+from unittest.mock import Mock, patch
+from deploy_manager.cli import (
+    DeploymentManager, MonitorPanel, ProdLiteManager, _humanize, _print_remote_line, check_terraform_running,
+    format_uptime, parse_systemctl_show, print_fields, print_rows, run_deploy_with_tag, summarize_target_health
+)
 from deploy_manager.config import Config
+from rich.text import Text
 
 
 @pytest.fixture
 def mock_aws_client():
     """Create a mock AWS client."""
-    with patch('deploy_manager.cli.AWSClient') as mock:
+    with patch('deploy_manager.cli.get_aws_client') as mock:
         yield mock.return_value
 
 
 @pytest.fixture
-def deployment_manager(mock_aws_client):
+def mock_deploy_state():
+    """Create a mock DeployState."""
+    with patch('deploy_manager.cli.DeployState') as mock:
+        yield mock.return_value
+
+
+@pytest.fixture
+def deployment_manager(mock_aws_client, mock_deploy_state):
     """Create a DeploymentManager with mocked AWS client."""
     config = Config()
     manager = DeploymentManager(config)
@@ -24,48 +40,124 @@ def deployment_manager(mock_aws_client):
 class TestGetActiveEnvironment:
     """Tests for get_active_environment method."""
 
-    def test_get_active_from_terraform_output(self, deployment_manager):
-        """Test getting active environment from terraform output."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.return_value.stdout = '"blue"'
-            mock_run.return_value.returncode = 0
+    def test_get_active_from_terraform_state(self, deployment_manager, mock_aws_client):
+        """Test getting active environment from the prod terraform state in S3."""
+        mock_aws_client.get_terraform_output.return_value = "blue"
 
-            result = deployment_manager.get_active_environment()
+        result = deployment_manager.get_active_environment()
 
-            assert result == "blue"
+        assert result == "blue"
+        mock_aws_client.get_terraform_output.assert_called_once_with(
+            "superschedules-tf-state", "prod/terraform.tfstate", "active_color"
+        )
 
-    def test_get_active_fallback_to_asg_check(self, deployment_manager, mock_aws_client):
-        """Test fallback to ASG check when terraform fails."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = Exception("terraform failed")
+    def test_active_env_is_memoized_until_invalidated(self, deployment_manager, mock_aws_client):
+        """Test the lookup runs once until invalidate_active_env."""
+        mock_aws_client.get_terraform_output.return_value = "blue"
+
+        assert deployment_manager.get_active_environment() == "blue"
+        assert deployment_manager.get_active_environment() == "blue"
+        assert mock_aws_client.get_terraform_output.call_count == 1
+
+        deployment_manager.invalidate_active_env()
+        mock_aws_client.get_terraform_output.return_value = "green"
+        assert deployment_manager.get_active_environment() == "green"
+
+    def test_active_env_memo_expires(self, deployment_manager, mock_aws_client):
+        """Test the memoized environment is looked up again after ACTIVE_ENV_TTL."""
+        mock_aws_client.get_terraform_output.side_effect = ["blue", "green"]
+
+        with patch('deploy_manager.cli.time.monotonic', return_value=100.0):
+            assert deployment_manager.get_active_environment() == "blue"
+        with patch('deploy_manager.cli.time.monotonic', return_value=100.0 + DeploymentManager.ACTIVE_ENV_TTL - 1):
+            assert deployment_manager.get_active_environment() == "blue"
+        with patch('deploy_manager.cli.time.monotonic', return_value=100.0 + DeploymentManager.ACTIVE_ENV_TTL):
+            assert deployment_manager.get_active_environment() == "green"
+
+    def test_unknown_active_env_is_not_memoized(self, deployment_manager, mock_aws_client):
+        """Test an ambiguous answer is looked up again next time."""
+        mock_aws_client.get_terraform_output.return_value = None
+        mock_aws_client.get_asg_infos.return_value = {}
+
+        deployment_manager.get_active_environment()
+        deployment_manager.get_active_environment()
+
+        assert mock_aws_client.get_terraform_output.call_count == 2
+
+    def test_concurrent_callers_share_one_lookup(self, deployment_manager):
+        """Test concurrent callers wait on the in-flight lookup."""
+        import threading
+        started = threading.Event()
+        follower_waiting = threading.Event()
+        release = threading.Event()
+
+        class SignalingFuture(Future):
+            def result(self, timeout=None):
+                follower_waiting.set()
+                return super().result(timeout)
+
+        def slow_lookup():
+            started.set()
+            release.wait(5)
+            return "blue"
+
+        results = []
+
+        def call():
+            results.append(deployment_manager.get_active_environment())
+
+        with patch('deploy_manager.cli.Future', SignalingFuture), \
+                patch.object(deployment_manager, '_lookup_active_environment', side_effect=slow_lookup) as mock_lookup:
+            leader = threading.Thread(target=call)
+            leader.start()
+            started.wait(5)
+            follower = threading.Thread(target=call)
+            follower.start()
+            follower_waiting.wait(5)
+            release.set()
+            leader.join(5)
+            follower.join(5)
+
+        assert results == ["blue", "blue"]
+        assert mock_lookup.call_count == 1
 
-            mock_aws_client.get_asg_info.side_effect = [
-                {"DesiredCapacity": 1},  # Blue
-                {"DesiredCapacity": 0}   # Green
-            ]
+    def test_get_active_fallback_to_asg_check(self, deployment_manager, mock_aws_client):
+        """Test fallback to ASG check when the terraform state can't be read."""
+        mock_aws_client.get_terraform_output.return_value = None
+        config = deployment_manager.config
+        mock_aws_client.get_asg_infos.return_value = {
+            config.blue_asg: {"DesiredCapacity": 1},
+            config.green_asg: {"DesiredCapacity": 0},
+        }
 
-            result = deployment_manager.get_active_environment()
+        result = deployment_manager.get_active_environment()
 
-            assert result == "blue"
+        assert result == "blue"
+        mock_aws_client.get_asg_infos.assert_called_once_with([config.blue_asg, config.green_asg])
 
     def test_get_active_both_running(self, deployment_manager, mock_aws_client):
         """Test when both environments are running."""
-        with patch('subprocess.run') as mock_run:
-            mock_run.side_effect = Exception("terraform failed")
-
-            mock_aws_client.get_asg_info.side_effect = [
-                {"DesiredCapacity": 1},  # Blue
-                {"DesiredCapacity": 1}   # Green
-            ]
+        config = deployment_manager.config
+        mock_aws_client.get_terraform_output.return_value = None
+        mock_aws_client.get_asg_infos.return_value = {
+            config.blue_asg: {"DesiredCapacity": 1},
+            config.green_asg: {"DesiredCapacity": 1},
+        }
 
-            result = deployment_manager.get_active_environment()
+        result = deployment_manager.get_active_environment()
 
-            assert result == "unknown"
+        assert result == "unknown"
 
 
 class TestMonitorDeployment:
     """Tests for _monitor_deployment method."""
 
+    @pytest.fixture(autouse=True)
+    def asg_summary(self, mock_aws_client):
+        """Report one unchanged instance unless a test overrides it."""
+        mock_aws_client.get_asg_summary.return_value = (1, frozenset({"i-123"}))
+        mock_aws_client.wait_for_targets_settled.return_value = True
+
     def test_monitor_deployment_becomes_healthy(self, deployment_manager, mock_aws_client):
         """Test monitoring deployment that becomes healthy."""
         # First call: not healthy, second call: healthy
@@ -134,6 +226,114 @@ class TestMonitorDeployment:
 
         assert result is True
 
+    def test_monitor_reuses_settled_status_until_asg_changes(self, deployment_manager, mock_aws_client):
+        """Test settled targets are not re-described while the ASG is unchanged."""
+        waiting = {
+            "exists": True,
+            "desired_capacity": 2,
+            "instances": [{"instance_id": "i-123", "state": "running"}],
+            "health": {"frontend": [{"TargetHealth": {"State": "unused"}}]}
+        }
+        ready = {
+            "exists": True,
+            "desired_capacity": 2,
+            "instances": [
+                {"instance_id": "i-123", "state": "running"},
+                {"instance_id": "i-456", "state": "running"}
+            ],
+            "health": {"frontend": [
+                {"TargetHealth": {"State": "unused"}},
+                {"TargetHealth": {"State": "unused"}}
+            ]}
+        }
+        mock_aws_client.get_asg_summary.side_effect = [
+            (2, frozenset({"i-123"})),
+            (2, frozenset({"i-123"})),
+            (2, frozenset({"i-123"})),
+            (2, frozenset({"i-123", "i-456"}))
+        ]
+        mock_aws_client.get_environment_status.side_effect = [waiting, ready]
+
+        with patch('time.sleep'):
+            result = deployment_manager._monitor_deployment("green")
+
+        assert result is True
+        assert mock_aws_client.get_environment_status.call_count == 2
+
+    def test_monitor_redescribes_mixed_target_group(self, deployment_manager, mock_aws_client):
+        """Test a group mixing healthy and unused targets is not treated as settled."""
+        mixed = {
+            "exists": True,
+            "desired_capacity": 1,
+            "instances": [{"instance_id": "i-123", "state": "running"}],
+            "health": {"frontend": [
+                {"TargetHealth": {"State": "healthy"}},
+                {"TargetHealth": {"State": "unused"}}
+            ]}
+        }
+        healthy = {
+            **mixed,
+            "health": {"frontend": [{"TargetHealth": {"State": "healthy"}}]}
+        }
+        mock_aws_client.get_environment_status.side_effect = [mixed, healthy]
+
+        with patch('time.sleep'):
+            result = deployment_manager._monitor_deployment("green")
+
+        assert result is True
+        assert mock_aws_client.get_environment_status.call_count == 2
+
+    def test_monitor_starts_waiter_per_target_group(self, deployment_manager, mock_aws_client):
+        """Test each target group gets a waiter sized to the ASG's desired capacity."""
+        mock_aws_client.get_asg_summary.return_value = (2, frozenset({"i-123", "i-456"}))
+        mock_aws_client.get_environment_status.return_value = {
+            "exists": True,
+            "desired_capacity": 2,
+            "instances": [{"instance_id": "i-123", "state": "running"}, {"instance_id": "i-456", "state": "running"}],
+            "health": {"frontend": [{"TargetHealth": {"State": "unused"}}] * 2}
+        }
+
+        started = []
+
+        def run_inline(fn, *args):
+            started.append(args)
+            future = Future()
+            future.set_result(fn(*args))
+            return future
+
+        with patch('time.sleep'), patch('deploy_manager.cli._run_in_daemon_thread', side_effect=run_inline):
+            assert deployment_manager._monitor_deployment("green") is True
+
+        assert sorted(args[0] for args in started) == sorted(deployment_manager.config.green_target_groups.values())
+        assert all(args[1] == 2 for args in started)
+        # The shared stop event is set once the monitor is done
+        assert all(args[4].is_set() for args in started)
+
+    def test_monitor_backs_off_while_nothing_changes(self, deployment_manager, mock_aws_client):
+        """Test polling slows down while targets stay in the same state."""
+        mock_aws_client.get_environment_status.return_value = {
+            "exists": True,
+            "desired_capacity": 1,
+            "instances": [{"instance_id": "i-123", "state": "running"}],
+            "health": {"frontend": [{"TargetHealth": {"State": "initial"}}]}
+        }
+        clock = [0.0]
+        sleeps = []
+
+        def fake_sleep(seconds):
+            sleeps.append(seconds)
+            clock[0] += seconds
+
+        with patch('deploy_manager.cli.time.sleep', side_effect=fake_sleep), \
+                patch('deploy_manager.cli.MonitorPanel.elapsed', lambda self: int(clock[0])):
+            result = deployment_manager._monitor_deployment("green")
+
+        assert result is False
+        assert sleeps[:3] == [5, 7.5, 11.25]
+        assert max(sleeps) == 30
+        # A fixed 10s interval would have polled 60 times in the 10 minute window
+        assert mock_aws_client.get_environment_status.call_count < 30
+
     def test_monitor_deployment_timeout(self, deployment_manager, mock_aws_client):
         """Test monitoring deployment that times out."""
         mock_aws_client.get_environment_status.return_value = {
@@ -153,6 +353,35 @@ class TestMonitorDeployment:
         assert result is False
 
 
+class TestMonitorPanel:
+    """Tests for the deploy monitor's live panel."""
+
+    def test_elapsed_ticks_without_new_content(self):
+        """Test each render recomputes the elapsed time from the clock."""
+        with patch('time.monotonic', return_value=100.0):
+            panel = MonitorPanel("GREEN Deployment Status", 600)
+        panel.content = ([("Instances: 1\n", "white")], False)
+
+        with patch('time.monotonic', return_value=103.5):
+            first = panel.__rich__()
+        with patch('time.monotonic', return_value=107.0):
+            second = panel.__rich__()
+
+        assert first.renderable.plain.startswith("⏱  Elapsed: 3s / 600s")
+        assert second.renderable.plain.startswith("⏱  Elapsed: 7s / 600s")
+        assert second.border_style == "cyan"
+
+    def test_ready_panel_is_green(self):
+        """Test a ready environment gets the success line and green border."""
+        panel = MonitorPanel("GREEN Deployment Status", 600)
+        panel.content = ([], True)
+
+        rendered = panel.__rich__()
+
+        assert rendered.border_style == "green"
+        assert rendered.renderable.plain.endswith("✓ Environment is healthy and ready!")
+
+
 class TestFlipTraffic:
     """Tests for flip_traffic method."""
 
@@ -169,7 +398,9 @@ class TestFlipTraffic:
 
         assert result is True
         mock_run.assert_called_once()
-        assert 'make deploy:flip' in mock_run.call_args[0][0]
+        assert mock_run.call_args[0][0] == ["make", "deploy:flip"]
+        assert mock_run.call_args.kwargs["input"] == "y\n"
+        assert "shell" not in mock_run.call_args.kwargs
 
     @patch('deploy_manager.cli.click.confirm')
     @patch('subprocess.run')
@@ -183,7 +414,20 @@ class TestFlipTraffic:
             result = deployment_manager.flip_traffic()
 
         assert result is True
-        assert 'make deploy:rollback' in mock_run.call_args[0][0]
+        assert mock_run.call_args[0][0] == ["make", "deploy:rollback"]
+
+    @patch('deploy_manager.cli.click.confirm')
+    @patch('subprocess.run')
+    def test_flip_invalidates_active_env(self, mock_run, mock_confirm, deployment_manager):
+        """Test a successful flip drops the memoized active environment."""
+        mock_confirm.return_value = True
+        mock_run.return_value.stdout = "Success"
+
+        with patch.object(deployment_manager, 'get_active_environment', return_value='blue'), \
+                patch.object(deployment_manager, 'invalidate_active_env') as mock_invalidate:
+            deployment_manager.flip_traffic()
+
+        mock_invalidate.assert_called_once()
 
     @patch('deploy_manager.cli.click.confirm')
     def test_flip_cancelled(self, mock_confirm, deployment_manager):
@@ -203,7 +447,7 @@ class TestFlipTraffic:
         mock_confirm.return_value = True
         mock_run.side_effect = subprocess.CalledProcessError(
             returncode=1,
-            cmd="make deploy:flip",
+            cmd=["make", "deploy:flip"],
             stderr="Command failed"
         )
 
@@ -240,13 +484,17 @@ class TestDeployToInactive:
 
     @patch('deploy_manager.cli.click.confirm')
     @patch('subprocess.Popen')
-    def test_deploy_succeeds(self, mock_popen, mock_confirm, deployment_manager, mock_aws_client):
+    def test_deploy_succeeds(self, mock_popen, mock_confirm, deployment_manager, mock_aws_client, capsys):
         """Test successful deployment."""
         mock_confirm.return_value = True
+        mock_aws_client.get_asg_info.return_value = {"DesiredCapacity": 2, "MinSize": 1, "MaxSize": 3}
 
-        # Mock subprocess
+        # Mock subprocess, with its output on a real pipe
+        read_fd, write_fd = os.pipe()
+        os.write(write_fd, "Line 1\nLine 2 [bold]\n".encode())
+        os.close(write_fd)
         mock_process = Mock()
-        mock_process.stdout = iter(["Line 1\n", "Line 2\n"])
+        mock_process.stdout = os.fdopen(read_fd, "rb")
         mock_process.wait.return_value = None
         mock_process.returncode = 0
         mock_popen.return_value = mock_process
@@ -257,6 +505,14 @@ class TestDeployToInactive:
                 result = deployment_manager.deploy_to_inactive()
 
         assert result is True
+        assert "Line 1\nLine 2 [bold]\n" in capsys.readouterr().out
+        assert mock_process.stdout.closed
+        args = mock_popen.call_args[0][0]
+        assert args == [
+            "make", "deploy:new-green",
+            "ACTIVE_DESIRED_CAPACITY=2", "ACTIVE_MIN_SIZE=1", "ACTIVE_MAX_SIZE=3"
+        ]
+        assert "shell" not in mock_popen.call_args.kwargs
 
 
 class TestShowStatus:
@@ -264,7 +520,7 @@ class TestShowStatus:
 
     def test_show_status_displays_both_environments(self, deployment_manager, mock_aws_client):
         """Test that status displays both blue and green environments."""
-        mock_aws_client.get_environment_status.side_effect = [
+        statuses = (
             {
                 "exists": True,
                 "desired_capacity": 1,
@@ -295,8 +551,430 @@ class TestShowStatus:
                 "total_hourly_cost": 0,
                 "total_monthly_cost": 0
             }
-        ]
+        )
 
-        with patch.object(deployment_manager, 'get_active_environment', return_value='blue'):
+        with patch.object(deployment_manager, 'get_active_environment', return_value='blue'), \
+                patch.object(deployment_manager, 'get_environment_statuses', return_value=statuses):
             # Just ensure it doesn't crash - output testing is complex with Rich
             deployment_manager.show_status()
+
+    def test_get_environment_statuses_keeps_order(self, deployment_manager, mock_aws_client):
+        """Test both ASGs are described once and statuses come back as (blue, green)."""
+        config = deployment_manager.config
+        mock_aws_client.get_asg_infos.return_value = {config.blue_asg: {"DesiredCapacity": 1}}
+        mock_aws_client.build_environment_status.side_effect = lambda asg, info, _: {"asg": asg, "info": info}
+
+        blue, green = deployment_manager.get_environment_statuses()
+
+        mock_aws_client.get_asg_infos.assert_called_once_with([config.blue_asg, config.green_asg])
+        assert blue == {"asg": config.blue_asg, "info": {"DesiredCapacity": 1}}
+        assert green == {"asg": config.green_asg, "info": None}
+
+
+class TestDeployAndFlip:
+    """Tests for deploy_and_flip method."""
+
+    @patch('deploy_manager.cli.time.sleep')
+    def test_waits_once_then_flips(self, mock_sleep, deployment_manager):
+        """Test the stabilization wait is a single sleep before flipping."""
+        with patch.object(deployment_manager, 'get_active_environment', return_value='blue'), \
+                patch.object(deployment_manager, 'deploy_to_inactive', return_value=True), \
+                patch.object(deployment_manager, 'flip_traffic', return_value=True) as mock_flip:
+            result = deployment_manager.deploy_and_flip(wait_seconds=30)
+
+        assert result is True
+        mock_sleep.assert_called_once_with(30)
+        mock_flip.assert_called_once_with(target_env="green", skip_confirm=True)
+
+
+class TestCheckTerraformRunning:
+    """Tests for check_terraform_running helper."""
+
+    @staticmethod
+    def _fake_proc(tmp_path, processes):
+        """Lay out /proc-style pid directories with comm files."""
+        for pid, comm in processes.items():
+            (tmp_path / str(pid)).mkdir()
+            (tmp_path / str(pid) / "comm").write_text(comm + "\n")
+        (tmp_path / "self").mkdir()
+        return tmp_path
+
+    def test_terraform_found_in_proc(self, tmp_path):
+        """Test a terraform process is found by scanning /proc without forking."""
+        proc = self._fake_proc(tmp_path, {1: "systemd", 4242: "terraform"})
+
+        with patch('deploy_manager.cli.PROC_DIR', proc), patch('subprocess.run') as mock_run:
+            assert check_terraform_running() is True
+        mock_run.assert_not_called()
+
+    def test_no_terraform_in_proc(self, tmp_path):
+        """Test other processes are ignored."""
+        proc = self._fake_proc(tmp_path, {1: "systemd", 77: "python3"})
+
+        with patch('deploy_manager.cli.PROC_DIR', proc):
+            assert check_terraform_running() is False
+
+    def test_vanished_process_is_skipped(self, tmp_path):
+        """Test a pid that exits mid-scan doesn't abort the scan."""
+        proc = self._fake_proc(tmp_path, {99: "terraform"})
+        (proc / "12").mkdir()  # No comm file - process already gone
+
+        with patch('deploy_manager.cli.PROC_DIR', proc):
+            assert check_terraform_running() is True
+
+    @patch('subprocess.run')
+    def test_terraform_found(self, mock_run, tmp_path):
+        """Test detection when pgrep finds a terraform process."""
+        mock_run.return_value.returncode = 0
+
+        with patch('deploy_manager.cli.PROC_DIR', tmp_path / "missing"):
+            assert check_terraform_running() is True
+        assert mock_run.call_args.kwargs["timeout"] == 1
+
+    @patch('deploy_manager.cli.PROC_DIR', Path("/nonexistent-proc"))
+    @patch('subprocess.run')
+    def test_pgrep_timeout_is_not_fatal(self, mock_run):
+        """Test a hung pgrep is treated as no terraform running."""
+        import subprocess
+        mock_run.side_effect = subprocess.TimeoutExpired(cmd="pgrep", timeout=1)
+
+        assert check_terraform_running() is False
+
+
+class TestFormatUptime:
+    """Tests for format_uptime helper."""
+
+    def test_format_uptime(self):
+        """Test uptime dicts render as compact d/h/m strings."""
+        assert format_uptime({"days": 1, "hours": 2, "minutes": 30}) == "1d 2h 30m"
+
+
+@pytest.fixture
+def lite_clients():
+    """Mock boto3 clients keyed by service name for ProdLiteManager."""
+    clients = {"ec2": Mock(), "ssm": Mock(), "logs": Mock()}
+    with patch.object(ProdLiteManager, '_client', side_effect=lambda service: clients[service]), \
+            patch.object(ProdLiteManager, '_instance_cache', None), \
+            patch.object(ProdLiteManager, '_ssm_online', {}):
+        yield clients
+
+
+class TestProdLiteGetInstance:
+    """Tests for ProdLiteManager.get_instance."""
+
+    def test_instance_lookup_is_shared(self, lite_clients):
+        """Test repeated lookups in one process reuse the first describe."""
+        lite_clients["ec2"].describe_instances.return_value = {
+            "Reservations": [{"Instances": [{"InstanceId": "i-123"}]}]
+        }
+
+        first = ProdLiteManager().get_instance()
+        second = ProdLiteManager().get_instance()
+
+        assert first["InstanceId"] == second["InstanceId"] == "i-123"
+        lite_clients["ec2"].describe_instances.assert_called_once()
+
+    def test_missing_instance_is_not_cached(self, lite_clients):
+        """Test a missing instance is looked up again on the next call."""
+        lite_clients["ec2"].describe_instances.return_value = {"Reservations": []}
+
+        assert ProdLiteManager().get_instance() is None
+        assert ProdLiteManager().get_instance() is None
+        assert lite_clients["ec2"].describe_instances.call_count == 2
+
+
+class TestProdLiteCheckSSMStatus:
+    """Tests for ProdLiteManager.check_ssm_status."""
+
+    def test_online_status_is_reused(self, lite_clients):
+        """Test an Online instance is not described again."""
+        lite_clients["ssm"].describe_instance_information.return_value = {
+            "InstanceInformationList": [{"PingStatus": "Online"}]
+        }
+
+        assert ProdLiteManager().check_ssm_status("i-123") is True
+        assert ProdLiteManager().check_ssm_status("i-123") is True
+        lite_clients["ssm"].describe_instance_information.assert_called_once()
+
+    def test_offline_status_is_rechecked(self, lite_clients):
+        """Test a non-Online instance is checked again next time."""
+        lite_clients["ssm"].describe_instance_information.return_value = {
+            "InstanceInformationList": [{"PingStatus": "ConnectionLost"}]
+        }
+
+        assert ProdLiteManager().check_ssm_status("i-123") is False
+        assert ProdLiteManager().check_ssm_status("i-123") is False
+        assert lite_clients["ssm"].describe_instance_information.call_count == 2
+
+
+class TestProdLiteRunCommand:
+    """Tests for ProdLiteManager.run_command."""
+
+    @patch('deploy_manager.cli.time.sleep')
+    def test_short_command_returns_quickly(self, mock_sleep, lite_clients):
+        """Test polling backs off from a sub-second first delay."""
+        ssm = lite_clients["ssm"]
+        ssm.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        ssm.get_command_invocation.side_effect = [
+            {"Status": "InProgress"},
+            {"Status": "Success", "StandardOutputContent": "ok"}
+        ]
+
+        success, output = ProdLiteManager().run_command("i-123", "echo ok")
+
+        assert success is True
+        assert output == "ok"
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [0.25, 0.5]
+
+    @patch('deploy_manager.cli.time.sleep')
+    def test_failed_command_returns_stderr(self, mock_sleep, lite_clients):
+        """Test failed commands return their error output."""
+        ssm = lite_clients["ssm"]
+        ssm.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        ssm.get_command_invocation.return_value = {
+            "Status": "Failed",
+            "StandardErrorContent": "boom"
+        }
+
+        assert ProdLiteManager().run_command("i-123", "false") == (False, "boom")
+
+    @patch('deploy_manager.cli.time.sleep')
+    def test_streams_output_while_running(self, mock_sleep, lite_clients):
+        """Test CloudWatch output lines are passed on once each while polling."""
+        ssm = lite_clients["ssm"]
+        ssm.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        ssm.get_command_invocation.side_effect = [
+            {"Status": "InProgress"},
+            {"Status": "Success", "StandardOutputContent": "done"}
+        ]
+        first = {"eventId": "e1", "timestamp": 1, "message": "Cloning\nFetched\n"}
+        second = {"eventId": "e2", "timestamp": 2, "message": "Built"}
+        lite_clients["logs"].filter_log_events.side_effect = [
+            {"events": [first]},
+            {"events": [first, second]},
+        ]
+        lines = []
+
+        assert ProdLiteManager().run_command("i-123", "build", on_output=lines.append) == (True, "done")
+
+        assert lines == ["Cloning", "Fetched", "Built"]
+        assert ssm.send_command.call_args.kwargs["CloudWatchOutputConfig"]["CloudWatchOutputEnabled"] is True
+        assert lite_clients["logs"].filter_log_events.call_args.kwargs["logStreamNamePrefix"] == "cmd-1"
+
+    @patch('deploy_manager.cli.time.time', return_value=2000.0)
+    @patch('deploy_manager.cli.time.sleep')
+    def test_streams_output_written_before_first_poll(self, mock_sleep, mock_time, lite_clients):
+        """Test lines logged before the first poll are streamed, not filtered by the local clock."""
+        ssm = lite_clients["ssm"]
+        ssm.send_command.return_value = {"Command": {"CommandId": "cmd-1"}}
+        ssm.get_command_invocation.side_effect = [
+            {"Status": "InProgress"},
+            {"Status": "Success", "StandardOutputContent": "done"}
+        ]
+        early = {"eventId": "e1", "timestamp": 1000000, "message": "Starting"}
+        later = {"eventId": "e2", "timestamp": 1000000, "message": "Started"}
+        logs = lite_clients["logs"]
+        logs.filter_log_events.side_effect = [
+            {"events": [early]},
+            {"events": [early, later]},
+        ]
+        lines = []
+
+        ProdLiteManager().run_command("i-123", "build", on_output=lines.append)
+
+        assert lines == ["Starting", "Started"]
+        first_call, second_call = logs.filter_log_events.call_args_list
+        assert "startTime" not in first_call.kwargs
+        assert second_call.kwargs["startTime"] == 1000000
+
+
+class TestProdLiteRunSteps:
+    """Tests for ProdLiteManager.run_steps."""
+
+    def test_stops_at_first_failure(self, lite_clients):
+        """Test later steps are skipped once a step fails."""
+        manager = ProdLiteManager()
+        steps = [
+            ("Step one", "One done", "One failed", "cmd-1", 10),
+            ("Step two", "Two done", "Two failed", "cmd-2", 10),
+        ]
+
+        with patch.object(manager, 'run_command', return_value=(False, "boom")) as mock_run:
+            assert manager.run_steps("i-123", steps) is False
+
+        mock_run.assert_called_once()
+        assert mock_run.call_args.args == ("i-123", "cmd-1")
+        assert mock_run.call_args.kwargs["timeout"] == 10
+
+
+class TestPrintRows:
+    """Tests for print_rows helper."""
+
+    def test_large_output_is_plain_text(self, capsys):
+        """Test row counts past the threshold bypass Rich table layout."""
+        rows = [(Text("current", style="green"), "main-abc"), ("1", "main-def")]
+
+        with patch('deploy_manager.cli.PLAIN_OUTPUT_THRESHOLD', 1):
+            print_rows([("#", "dim"), ("Tag", "cyan")], rows)
+
+        assert capsys.readouterr().out == "#\tTag\ncurrent\tmain-abc\n1\tmain-def\n"
+
+    def test_small_output_is_table(self):
+        """Test small outputs render a table with fixed column widths."""
+        with patch('deploy_manager.cli.console') as mock_console:
+            print_rows([("Tag", "cyan")], [("main-abc",)])
+
+        table = mock_console.print.call_args[0][0]
+        assert table.columns[0].width == len("main-abc")
+        assert table.columns[0].no_wrap is True
+
+
+class TestPrintFields:
+    """Tests for print_fields helper."""
+
+    def test_aligns_labels(self):
+        """Test labels are padded to a common width under the title."""
+        with patch('deploy_manager.cli.console') as mock_console:
+            print_fields("Status", [("ID", "i-123"), ("SSM Status", Text("Online", style="green"))])
+
+        printed = mock_console.print.call_args[0][0]
+        assert printed.plain == "Status\nID          i-123\nSSM Status  Online"
+
+    def test_empty_fields_print_message(self):
+        """Test an empty field list prints the empty message instead of failing."""
+        with patch('deploy_manager.cli.console') as mock_console:
+            print_fields("Service Status", [], empty="No services reported")
+
+        assert mock_console.print.call_args[0][0].plain == "Service Status\nNo services reported"
+
+
+class TestHumanize:
+    """Tests for _humanize helper."""
+
+    def test_humanize_ranges(self):
+        """Test days, hours and minutes buckets."""
+        from datetime import datetime, timedelta, timezone
+        now = datetime(2024, 1, 10, 12, 0, tzinfo=timezone.utc)
+
+        assert _humanize(now - timedelta(days=2, hours=5), now) == "2d ago"
+        assert _humanize(now - timedelta(hours=3, minutes=10), now) == "3h ago"
+        assert _humanize(now - timedelta(minutes=42), now) == "42m ago"
+        assert _humanize(now + timedelta(minutes=5), now) == "0m ago"
+
+
+class TestRunDeployWithTag:
+    """Tests for run_deploy_with_tag helper."""
+
+    @patch('deploy_manager.cli.subprocess.run')
+    def test_runs_make_with_tag(self, mock_run):
+        """Test make is invoked with the tag and success follows its exit code."""
+        mock_run.return_value = Mock(returncode=0)
+        assert run_deploy_with_tag("main-abc") is True
+        assert mock_run.call_args[0][0] == ["make", "deploy:with-tag", "TAG=main-abc"]
+
+        mock_run.return_value = Mock(returncode=2)
+        assert run_deploy_with_tag("main-abc") is False
+
+
+class TestParseSystemctlShow:
+    """Tests for parse_systemctl_show helper."""
+
+    def test_parses_unit_blocks(self):
+        """Test each unit block becomes a (service, state) pair in order."""
+        output = (
+            "Id=gunicorn.service\nActiveState=active\n\n"
+            "Id=celery-beat.service\nActiveState=failed\n\n"
+            "Id=nginx.service\nActiveState=inactive\n"
+        )
+        assert parse_systemctl_show(output) == [
+            ("gunicorn", "active"),
+            ("celery-beat", "failed"),
+            ("nginx", "inactive"),
+        ]
+
+    def test_keeps_non_service_unit_names(self):
+        """Test only a trailing .service suffix is stripped."""
+        output = "Id=backup.timer\nActiveState=active\n\nId=my.service.d.service\nActiveState=active\n"
+        assert parse_systemctl_show(output) == [("backup.timer", "active"), ("my.service.d", "active")]
+
+
+class TestProdLiteRunPipelines:
+    """Tests for ProdLiteManager.run_pipelines."""
+
+    def test_concurrent_runs_every_pipeline(self):
+        """Test each pipeline runs even when another fails."""
+        manager = ProdLiteManager()
+        pipelines = {"backend": ["backend"], "frontend": ["frontend"], "docs": ["docs"]}
+        with patch.object(manager, 'run_steps', side_effect=lambda _, steps, **kw: steps != ["frontend"]) as mock_steps:
+            assert manager.run_pipelines("i-123", pipelines) is False
+
+        assert sorted(c.args[1][0] for c in mock_steps.call_args_list) == ["backend", "docs", "frontend"]
+        assert sorted(c.kwargs["label"] for c in mock_steps.call_args_list) == ["backend", "docs", "frontend"]
+
+    def test_sequential_stops_at_first_failure(self):
+        """Test sequential mode skips pipelines after a failure."""
+        manager = ProdLiteManager()
+        pipelines = {"backend": ["backend"], "frontend": ["frontend"], "docs": ["docs"]}
+        with patch.object(manager, 'run_steps', side_effect=lambda _, steps, **kw: steps != ["frontend"]) as mock_steps:
+            assert manager.run_pipelines("i-123", pipelines, sequential=True) is False
+
+        assert [c.args[1][0] for c in mock_steps.call_args_list] == ["backend", "frontend"]
+        assert all("label" not in c.kwargs for c in mock_steps.call_args_list)
+
+
+class TestPrintRemoteLine:
+    """Tests for _print_remote_line helper."""
+
+    def test_label_prefixes_line(self):
+        """Test output from a labelled pipeline names the pipeline."""
+        with patch('deploy_manager.cli.console') as mock_console:
+            _print_remote_line("Built", label="frontend")
+
+        assert mock_console.print.call_args.args[0].plain == "  │ [frontend] Built"
+
+    def test_unlabelled_line_has_no_prefix(self):
+        """Test sequential output is printed without a prefix."""
+        with patch('deploy_manager.cli.console') as mock_console:
+            _print_remote_line("Built")
+
+        assert mock_console.print.call_args.args[0].plain == "  │ Built"
+
+
+class TestStartup:
+    """Tests for CLI import cost."""
+
+    def test_import_defers_boto3(self):
+        """Test importing the CLI doesn't load boto3 until a command needs AWS."""
+        code = "import sys, deploy_manager.cli; sys.exit('boto3' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", code]).returncode == 0
+
+
+class TestSummarizeTargetHealth:
+    """Tests for summarize_target_health."""
+
+    @staticmethod
+    def _targets(*states):
+        """Build target health descriptions with the given states."""
+        return [{"TargetHealth": {"State": state}} for state in states]
+
+    def test_all_healthy_is_settled(self):
+        """Test a fully healthy group reports traffic and is settled."""
+        assert summarize_target_health(self._targets("healthy", "healthy")) == (
+            "●", "green", "2/2 ✓ receiving traffic", True
+        )
+
+    def test_all_unused_is_settled(self):
+        """Test an inactive group is ready but not receiving traffic."""
+        assert summarize_target_health(self._targets("unused"))[1:] == (
+            "cyan", "1/1 ✓ ready (not receiving traffic)", True
+        )
+
+    def test_initializing_wins_over_unhealthy(self):
+        """Test initializing targets are reported before failing ones."""
+        assert summarize_target_health(self._targets("initial", "unhealthy", "healthy"))[2:] == (
+            "1/3 initializing...", False
+        )
+
+    def test_mixed_healthy_and_unused(self):
+        """Test a mix of settled states is not itself settled."""
+        assert summarize_target_health(self._targets("healthy", "unused"))[2:] == ("mixed state", False)
@@ -0,0 +1,182 @@
+"""Tests for S3-backed deployment state."""
+import io
+import json
+import time
+import pytest
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+from botocore.response import StreamingBody
+from deploy_manager.deploy_state import DeployState
+
+
+def _jsonl_body(deployments):
+    """Wrap deployments like an S3 get_object response for the JSONL key."""
+    data = "".join(json.dumps(d) + "\n" for d in deployments).encode("utf-8")
+    return {"Body": StreamingBody(io.BytesIO(data), len(data))}
+
+
+def _no_such_key():
+    """Build the ClientError S3 raises for a missing object."""
+    return ClientError({"Error": {"Code": "NoSuchKey"}}, "GetObject")
+
+
+def _not_modified():
+    """Build the ClientError S3 raises when IfNoneMatch matches."""
+    return ClientError({"Error": {"Code": "304"}}, "GetObject")
+
+
+@pytest.fixture
+def deploy_state():
+    """Create DeployState with a mocked S3 client."""
+    state = DeployState(region="us-east-1")
+    state.s3 = Mock()
+    return state
+
+
+class TestStateCache:
+    """Tests for reusing loaded history within a process."""
+
+    def test_reads_reuse_loaded_state(self, deploy_state):
+        """Test a longer read is reused for shorter ones."""
+        deploy_state.s3.get_object.return_value = _jsonl_body([{"tag": "main-b"}, {"tag": "main-a"}])
+
+        assert deploy_state.get_previous_tag() == "main-a"
+        assert deploy_state.get_current_tag() == "main-b"
+        assert deploy_state.s3.get_object.call_count == 1
+
+    def test_record_deploy_refreshes_and_updates_cache(self, deploy_state):
+        """Test recording re-reads S3 and later reads see the new entry."""
+        deploy_state.s3.get_object.side_effect = [
+            _jsonl_body([{"tag": "main-a"}]),
+            _jsonl_body([{"tag": "main-b"}, {"tag": "main-a"}]),
+        ]
+
+        assert deploy_state.get_current_tag() == "main-a"
+        deploy_state.record_deploy("main-c", deployed_by="tester")
+
+        assert deploy_state.s3.get_object.call_count == 2
+        assert [d["tag"] for d in deploy_state.get_history()] == ["main-c", "main-b", "main-a"]
+        deploy_state.s3.put_object.assert_called_once()
+
+
+class TestConditionalRecord:
+    """Tests for recording without overwriting concurrent deploys."""
+
+    def test_record_deploy_writes_if_unchanged(self, deploy_state):
+        """Test the write is conditional on the ETag that was read."""
+        deploy_state.s3.get_object.return_value = dict(_jsonl_body([{"tag": "main-a"}]), ETag='"v1"')
+
+        deploy_state.record_deploy("main-b", deployed_by="tester")
+
+        assert deploy_state.s3.put_object.call_args.kwargs["IfMatch"] == '"v1"'
+
+    def test_first_record_requires_no_object(self, deploy_state):
+        """Test the first write fails if another deploy created the history."""
+        deploy_state.s3.get_object.side_effect = _no_such_key()
+
+        deploy_state.record_deploy("main-a", deployed_by="tester")
+
+        assert deploy_state.s3.put_object.call_args.kwargs["IfNoneMatch"] == "*"
+
+    def test_record_deploy_retries_after_conflict(self, deploy_state):
+        """Test a lost race re-reads history and keeps the other deploy's entry."""
+        deploy_state.s3.get_object.side_effect = [
+            dict(_jsonl_body([{"tag": "main-a"}]), ETag='"v1"'),
+            dict(_jsonl_body([{"tag": "main-other"}, {"tag": "main-a"}]), ETag='"v2"'),
+        ]
+        deploy_state.s3.put_object.side_effect = [
+            ClientError({"Error": {"Code": "PreconditionFailed"}}, "PutObject"),
+            {"ETag": '"v3"'},
+        ]
+
+        deploy_state.record_deploy("main-b", deployed_by="tester")
+
+        kwargs = deploy_state.s3.put_object.call_args.kwargs
+        assert kwargs["IfMatch"] == '"v2"'
+        assert [json.loads(line)["tag"] for line in kwargs["Body"].splitlines()] == [
+            "main-b", "main-other", "main-a"
+        ]
+
+    def test_record_deploy_gives_up_after_attempts(self, deploy_state):
+        """Test persistent conflicts are raised instead of retried forever."""
+        deploy_state.s3.get_object.return_value = _jsonl_body([])
+        deploy_state.s3.put_object.side_effect = ClientError(
+            {"Error": {"Code": "PreconditionFailed"}}, "PutObject"
+        )
+
+        with pytest.raises(ClientError):
+            deploy_state.record_deploy("main-b", deployed_by="tester")
+        assert deploy_state.s3.put_object.call_count == DeployState.RECORD_ATTEMPTS
+
+
+class TestJsonLinesHistory:
+    """Tests for the JSON lines history format."""
+
+    def test_get_history_stops_at_limit(self, deploy_state):
+        """Test only the requested number of lines are parsed."""
+        deploy_state.s3.get_object.return_value = _jsonl_body([{"tag": f"main-{i}"} for i in range(5)])
+
+        assert [d["tag"] for d in deploy_state.get_history(limit=2)] == ["main-0", "main-1"]
+
+    def test_record_deploy_writes_lines_newest_first(self, deploy_state):
+        """Test history is written one JSON object per line and trimmed."""
+        deploy_state.s3.get_object.return_value = _jsonl_body(
+            [{"tag": f"main-{i}"} for i in range(DeployState.MAX_HISTORY)]
+        )
+
+        deploy_state.record_deploy("main-new", deployed_by="tester")
+
+        body = deploy_state.s3.put_object.call_args.kwargs["Body"]
+        tags = [json.loads(line)["tag"] for line in body.splitlines()]
+        assert len(tags) == DeployState.MAX_HISTORY
+        assert tags[:2] == ["main-new", "main-0"]
+
+    def test_record_deploy_writes_compact_json(self, deploy_state):
+        """Test stored lines carry no padding whitespace."""
+        deploy_state.s3.get_object.return_value = _jsonl_body([])
+
+        deploy_state.record_deploy("main-new", service="api", deployed_by="tester")
+
+        line = deploy_state.s3.put_object.call_args.kwargs["Body"].splitlines()[0]
+        assert line.startswith('{"tag":"main-new","service":"api",')
+
+    def test_limited_reads_use_range(self, deploy_state):
+        """Test limited reads only request a prefix of the object."""
+        deploy_state.s3.get_object.return_value = _jsonl_body([{"tag": "main-a"}])
+
+        deploy_state.get_current_tag()
+
+        assert deploy_state.s3.get_object.call_args.kwargs["Range"] == "bytes=0-65535"
+
+    def test_truncated_range_drops_partial_line(self, deploy_state):
+        """Test a record cut off by the range is not parsed."""
+        data = b'{"tag": "main-b"}\n{"tag": "main-a"}\n{"tag": "ma'
+        deploy_state.s3.get_object.return_value = {
+            "Body": io.BytesIO(data),
+            "ContentRange": f"bytes 0-{len(data) - 1}/5000",
+        }
+
+        assert [d["tag"] for d in deploy_state.get_history(limit=2)] == ["main-b", "main-a"]
+
+    def test_expired_cache_is_revalidated_by_etag(self, deploy_state):
+        """Test an unchanged history is reused after a 304."""
+        first = _jsonl_body([{"tag": "main-b"}, {"tag": "main-a"}])
+        first["ETag"] = '"abc"'
+        deploy_state.s3.get_object.side_effect = [first, _not_modified()]
+
+        assert deploy_state.get_current_tag() == "main-b"
+        with patch('deploy_manager.deploy_state.time.monotonic', return_value=time.monotonic() + 3600):
+            assert deploy_state.get_current_tag() == "main-b"
+
+        assert deploy_state.s3.get_object.call_args.kwargs["IfNoneMatch"] == '"abc"'
+
+    def test_falls_back_to_legacy_json(self, deploy_state):
+        """Test the old single-document history is read when no JSONL exists."""
+        legacy = json.dumps({"deployments": [{"tag": "main-old"}]}).encode("utf-8")
+        deploy_state.s3.get_object.side_effect = [
+            _no_such_key(),
+            {"Body": io.BytesIO(legacy)},
+        ]
+
+        assert deploy_state.get_current_tag() == "main-old"
+        assert deploy_state.s3.get_object.call_args.kwargs["Key"] == DeployState.LEGACY_S3_KEY
@@ -0,0 +1,211 @@
+"""Tests for ECR client."""
+import re
+import pytest
+from datetime import datetime, timezone
+from unittest.mock import Mock, patch
+from botocore.exceptions import ClientError
+from deploy_manager.ecr_client import ECRClient, _prefix_matcher
+
+
+@pytest.fixture
+def ecr_client():
+    """Create ECRClient with a mocked boto3 client."""
+    client = ECRClient(region="us-east-1")
+    client.ecr = Mock()
+    return client
+
+
+def _image(tag, day):
+    """Build an imageDetails entry pushed on the given day."""
+    return {
+        "imageDigest": f"sha256:{tag}",
+        "imageTags": [tag],
+        "imagePushedAt": datetime(2024, 1, day, tzinfo=timezone.utc),
+    }
+
+
+class TestRepoNames:
+    """Tests for service to repository name mapping."""
+
+    def test_repo_names_are_read_only(self, ecr_client):
+        """Test known services map to their repo and the mapping can't be changed."""
+        assert ecr_client.get_repo_name("api") == "superschedules-api"
+        assert ecr_client.get_repo_name("custom-repo") == "custom-repo"
+        with pytest.raises(TypeError):
+            ECRClient.REPOS["api"] = "other"
+
+
+class TestRepoListingCache:
+    """Tests for sharing one describe_images listing."""
+
+    def test_listing_serves_latest_images_and_image_exists(self, ecr_client):
+        """Test a listing is paginated once and reused for tag checks."""
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = [
+            {"imageDetails": [_image("main-a", 1), _image("dev-x", 3)]},
+            {"imageDetails": [_image("main-b", 2)]},
+        ]
+
+        latest = ecr_client.get_latest_images("repo", limit=5)
+        assert [img["tags"][0] for img in latest] == ["main-b", "main-a"]
+        assert ecr_client.get_latest_images("repo", limit=1)[0]["tags"] == ["main-b"]
+        ecr_client.ecr.get_paginator.return_value.paginate.assert_called_once()
+
+        assert ecr_client.image_exists("repo", "main-a") is True
+        ecr_client.ecr.describe_images.assert_not_called()
+
+    def test_latest_images_without_prefix_keeps_newest(self, ecr_client):
+        """Test an empty prefix considers every tag and still honours the limit."""
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = [
+            {"imageDetails": [_image("main-a", 1), _image("dev-x", 3)]},
+            {"imageDetails": [_image("main-b", 2)]},
+        ]
+
+        latest = ecr_client.get_latest_images("repo", limit=2, tag_prefix="")
+
+        assert [img["tags"] for img in latest] == [["dev-x"], ["main-b"]]
+        assert all(img["matching_tag"] is None for img in latest)
+
+    def test_latest_images_carry_matching_tag(self, ecr_client):
+        """Test the first prefixed tag is returned alongside the full tag list."""
+        image = dict(_image("sha-abc", 1), imageTags=["sha-abc", "main-abc", "main-old"])
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = [{"imageDetails": [image]}]
+
+        latest = ecr_client.get_latest_images("repo")
+
+        assert latest[0]["matching_tag"] == "main-abc"
+
+    def test_prefix_is_compiled_once(self, ecr_client):
+        """Test repeated calls with one prefix reuse its compiled matcher."""
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = [
+            {"imageDetails": [_image("main-a", 1), _image("dev-x", 3)]},
+        ]
+        _prefix_matcher.cache_clear()
+
+        with patch('deploy_manager.ecr_client.re.compile', wraps=re.compile) as mock_compile:
+            ecr_client.get_latest_images("repo")
+            latest = ecr_client.get_latest_images("repo")
+
+        assert [img["matching_tag"] for img in latest] == ["main-a"]
+        mock_compile.assert_called_once()
+
+    def test_listing_requests_tagged_images_in_large_pages(self, ecr_client):
+        """Test untagged images are filtered by ECR and pages are maximal."""
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = []
+
+        ecr_client.get_latest_images("repo")
+
+        kwargs = ecr_client.ecr.get_paginator.return_value.paginate.call_args.kwargs
+        assert kwargs["filter"] == {"tagStatus": "TAGGED"}
+        assert kwargs["PaginationConfig"] == {"PageSize": 1000}
+
+    def test_image_exists_misses_fall_through_to_ecr(self, ecr_client):
+        """Test tags missing from the listing are looked up directly."""
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = [
+            {"imageDetails": [_image("main-a", 1)]},
+        ]
+        ecr_client.get_latest_images("repo")
+        ecr_client.ecr.describe_images.return_value = {"imageDetails": [_image("main-new", 4)]}
+
+        assert ecr_client.image_exists("repo", "main-new") is True
+        ecr_client.ecr.describe_images.assert_called_once()
+
+
+class TestImageInfoCache:
+    """Tests for reusing image details between dashboard redraws."""
+
+    def test_found_image_info_is_reused(self, ecr_client):
+        """Test repeated lookups of a found tag hit ECR once."""
+        ecr_client.ecr.describe_images.return_value = {"imageDetails": [_image("main-a", 1)]}
+
+        first = ecr_client.get_image_info("repo", "main-a")
+        assert ecr_client.get_image_info("repo", "main-a") == first
+        ecr_client.ecr.describe_images.assert_called_once()
+
+    def test_invalidate_forces_fresh_reads(self, ecr_client):
+        """Test invalidate drops both the listing and image details."""
+        ecr_client.ecr.describe_images.return_value = {"imageDetails": [_image("main-a", 1)]}
+        ecr_client.ecr.get_paginator.return_value.paginate.return_value = []
+        ecr_client.get_image_info("repo", "main-a")
+        ecr_client.get_latest_images("repo")
+
+        ecr_client.invalidate()
+        ecr_client.get_image_info("repo", "main-a")
+        ecr_client.get_latest_images("repo")
+
+        assert ecr_client.ecr.describe_images.call_count == 2
+        assert ecr_client.ecr.get_paginator.return_value.paginate.call_count == 2
+
+
+class TestWaitForImage:
+    """Tests for wait_for_image polling."""
+
+    def test_errors_back_off_harder_and_reset(self, ecr_client):
+        """Test consecutive API errors stretch the delay up to the cap, and a clean poll resets it."""
+        throttled = ClientError({"Error": {"Code": "ThrottlingException"}}, "DescribeImages")
+        results = [throttled] * 4 + [False, True]
+
+        def image_exists(repo, tag):
+            result = results.pop(0)
+            if isinstance(result, Exception):
+                raise result
+            return result
+
+        with patch.object(ecr_client, 'image_exists', side_effect=image_exists), \
+                patch.object(ecr_client._rng, 'uniform', return_value=0), patch('time.sleep') as mock_sleep:
+            assert ecr_client.wait_for_image("repo", "main-a") is True
+
+        assert [c.args[0] for c in mock_sleep.call_args_list] == [4, 16, 60, 60, 15]
+
+
+class TestDeployedTagFromHealth:
+    """Tests for get_deployed_tag_from_health."""
+
+    def test_reads_commit_through_shared_pool(self, ecr_client):
+        """Test the health commit is returned as a main- tag via the pooled client."""
+        with patch('deploy_manager.ecr_client._http_pool') as mock_pool:
+            mock_pool.return_value.request.return_value = Mock(status=200, data=b'{"GIT_COMMIT": "abc123"}')
+
+            assert ecr_client.get_deployed_tag_from_health("https://example.com/health") == "main-abc123"
+            mock_pool.return_value.request.assert_called_once_with("GET", "https://example.com/health")
+
+    def test_error_status_returns_none(self, ecr_client):
+        """Test a non-200 response is not parsed."""
+        with patch('deploy_manager.ecr_client._http_pool') as mock_pool:
+            mock_pool.return_value.request.return_value = Mock(status=503, data=b'{"GIT_COMMIT": "abc123"}')
+
+            assert ecr_client.get_deployed_tag_from_health("https://example.com/health") is None
+
+    def test_pool_is_shared(self):
+        """Test every call gets the same connection pool."""
+        from deploy_manager.ecr_client import _http_pool
+        assert _http_pool() is _http_pool()
+
+
+class TestWaitForImages:
+    """Tests for waiting on several images at once."""
+
+    @staticmethod
+    def _batch(*found_tags):
+        """Build a batch_get_image response with the given tags present."""
+        return {"images": [{"imageId": {"imageTag": t, "imageDigest": f"sha256:{t}"}} for t in found_tags]}
+
+    def test_polls_only_pending_tags_per_repo(self, ecr_client):
+        """Test each tick makes one call per repo and drops tags already found."""
+        ecr_client.ecr.batch_get_image.side_effect = [
+            self._batch("main-a"),  # api ready on the first tick
+            self._batch(),          # frontend still missing
+            self._batch("main-a"),  # frontend ready on the second tick
+        ]
+        progress = []
+
+        with patch('time.sleep'):
+            ready = ecr_client.wait_for_images(
+                [("api", "main-a"), ("frontend", "main-a")],
+                callback=lambda attempt, elapsed, found: progress.append(found)
+            )
+
+        assert ready is True
+        calls = [c.kwargs for c in ecr_client.ecr.batch_get_image.call_args_list]
+        assert [c["repositoryName"] for c in calls] == ["api", "frontend", "frontend"]
+        assert progress[0] == {("api", "main-a"): True, ("frontend", "main-a"): False}
+        assert all(progress[-1].values())
@@ -69,7 +69,8 @@ resource "aws_iam_role_policy" "lambda_permissions" {
       {
         Effect = "Allow"
         Action = [
-          "route53:ChangeResourceRecordSets"
+          "route53:ChangeResourceRecordSets",
+          "route53:ListResourceRecordSets"
         ]
         Resource = "arn:aws:route53:::hostedzone/${data.aws_route53_zone.main.zone_id}"
       },
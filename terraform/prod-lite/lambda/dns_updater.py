@@ -5,15 +5,35 @@ Updates all configured domain A records to point to the new instance's public IP
 """
 
 import json
+import logging
 import os
-import time
 
 import boto3
+from botocore.exceptions import WaiterError
+
+# The Lambda runtime installs a handler on the root logger
+logger = logging.getLogger()
+logger.setLevel(os.environ.get("LOG_LEVEL", "INFO"))
+
+# Route53 accepts at most 1000 changes in a single ChangeBatch
+MAX_CHANGES_PER_BATCH = 1000
+
+# Configuration from the environment, parsed once per execution environment
+HOSTED_ZONE_ID = os.environ["HOSTED_ZONE_ID"]
+DOMAINS = tuple(
+    dict.fromkeys(d.strip() for d in os.environ["DOMAINS"].split(",") if d.strip())
+)
+TTL = int(os.environ.get("TTL", "60"))
+
+# Clients are built once per execution environment and reused by warm invocations
+_EC2 = boto3.client("ec2")
+_ROUTE53 = boto3.client("route53")
+_AUTOSCALING = boto3.client("autoscaling")
 
 
 def handler(event, context):
     """Handle ASG lifecycle hook event and update DNS."""
-    print(f"Event received: {json.dumps(event)}")
+    logger.debug("Event received: %s", event)
 
     # Extract event details
     detail = event.get("detail", {})
@@ -23,96 +43,122 @@ def handler(event, context):
     lifecycle_action_token = detail.get("LifecycleActionToken")
 
     if not instance_id:
-        print("ERROR: No instance ID in event")
+        logger.error("No instance ID in event")
         return {"statusCode": 400, "body": "No instance ID"}
 
-    print(f"Processing instance: {instance_id}")
+    logger.info("Processing instance: %s", instance_id)
 
-    ec2 = boto3.client("ec2")
-    route53 = boto3.client("route53")
-    autoscaling = boto3.client("autoscaling")
-
-    # Wait for instance to get a public IP (with retries)
+    # Wait for the instance to reach "running" (the public IP is assigned by
+    # then), then read the IP with a single describe call.
     public_ip = None
-    for attempt in range(10):
-        response = ec2.describe_instances(InstanceIds=[instance_id])
-        try:
-            instance = response["Reservations"][0]["Instances"][0]
-            public_ip = instance.get("PublicIpAddress")
-            if public_ip:
-                print(f"Instance {instance_id} has public IP: {public_ip}")
-                break
-        except (IndexError, KeyError) as e:
-            print(f"Error getting instance details: {e}")
-
-        print(f"Attempt {attempt + 1}: No public IP yet, waiting 5s...")
-        time.sleep(5)
+    try:
+        _EC2.get_waiter("instance_running").wait(
+            InstanceIds=[instance_id],
+            WaiterConfig={"Delay": 3, "MaxAttempts": 15},
+        )
+        response = _EC2.describe_instances(InstanceIds=[instance_id])
+        instance = response["Reservations"][0]["Instances"][0]
+        public_ip = instance.get("PublicIpAddress")
+    except WaiterError as e:
+        logger.warning("Instance %s did not reach running: %s", instance_id, e)
+    except (IndexError, KeyError) as e:
+        logger.warning("Error getting instance details: %s", e)
 
     if not public_ip:
-        print(f"ERROR: Instance {instance_id} has no public IP after 50s")
+        logger.error("Instance %s has no public IP after 45s", instance_id)
         # Complete lifecycle action to avoid blocking ASG
         _complete_lifecycle_action(
-            autoscaling, lifecycle_hook_name, asg_name, lifecycle_action_token
+            _AUTOSCALING, lifecycle_hook_name, asg_name, lifecycle_action_token
         )
         return {"statusCode": 500, "body": "Instance has no public IP"}
 
-    # Get configuration from environment
-    hosted_zone_id = os.environ["HOSTED_ZONE_ID"]
-    domains = [d.strip() for d in os.environ["DOMAINS"].split(",") if d.strip()]
-    ttl = int(os.environ.get("TTL", "60"))
-
-    print(f"Updating Route53 zone {hosted_zone_id} for domains: {domains}")
-
-    # Build Route53 change batch
-    changes = []
-    for domain in domains:
-        changes.append(
-            {
-                "Action": "UPSERT",
-                "ResourceRecordSet": {
-                    "Name": domain,
-                    "Type": "A",
-                    "TTL": ttl,
-                    "ResourceRecords": [{"Value": public_ip}],
-                },
-            }
-        )
-
-    if changes:
-        try:
-            response = route53.change_resource_record_sets(
-                HostedZoneId=hosted_zone_id,
+    logger.info("Instance %s has public IP: %s", instance_id, public_ip)
+
+    logger.info("Updating Route53 zone %s for domains: %s", HOSTED_ZONE_ID, ", ".join(DOMAINS))
+
+    # Build Route53 change batch, skipping records that already point here
+    current = _current_a_records()
+    wanted = (TTL, (public_ip,))
+    changes = [
+        {
+            "Action": "UPSERT",
+            "ResourceRecordSet": {
+                "Name": domain,
+                "Type": "A",
+                "TTL": TTL,
+                "ResourceRecords": [{"Value": public_ip}],
+            },
+        }
+        for domain in DOMAINS
+        if current.get(_normalize_name(domain)) != wanted
+    ]
+    if not changes:
+        logger.info("All records already point to %s, nothing to update", public_ip)
+
+    try:
+        for start in range(0, len(changes), MAX_CHANGES_PER_BATCH):
+            response = _ROUTE53.change_resource_record_sets(
+                HostedZoneId=HOSTED_ZONE_ID,
                 ChangeBatch={
                     "Comment": f"Auto-update for prod-lite instance {instance_id}",
-                    "Changes": changes,
+                    "Changes": changes[start : start + MAX_CHANGES_PER_BATCH],
                 },
             )
-            print(f"Route53 update response: {response}")
-        except Exception as e:
-            print(f"ERROR updating Route53: {e}")
-            # Still complete lifecycle action to avoid blocking
-            _complete_lifecycle_action(
-                autoscaling, lifecycle_hook_name, asg_name, lifecycle_action_token
-            )
-            return {"statusCode": 500, "body": str(e)}
+            logger.info("Route53 change %s is %s", response["ChangeInfo"]["Id"], response["ChangeInfo"]["Status"])
+    except Exception as e:
+        logger.error("Failed to update Route53: %s", e)
+        # Still complete lifecycle action to avoid blocking
+        _complete_lifecycle_action(
+            _AUTOSCALING, lifecycle_hook_name, asg_name, lifecycle_action_token
+        )
+        return {"statusCode": 500, "body": str(e)}
 
     # Complete lifecycle action
     _complete_lifecycle_action(
-        autoscaling, lifecycle_hook_name, asg_name, lifecycle_action_token
+        _AUTOSCALING, lifecycle_hook_name, asg_name, lifecycle_action_token
     )
 
+    updated = [change["ResourceRecordSet"]["Name"] for change in changes]
     return {
         "statusCode": 200,
         "body": json.dumps(
             {
                 "instance_id": instance_id,
                 "public_ip": public_ip,
-                "domains_updated": domains,
+                "domains_updated": updated,
+                "domains_unchanged": [d for d in DOMAINS if d not in updated],
             }
         ),
     }
 
 
+def _normalize_name(name):
+    """Normalize a DNS name for comparison (lowercase, no trailing dot)."""
+    return name.rstrip(".").lower()
+
+
+def _current_a_records():
+    """Get the zone's A records for DOMAINS as {name: (ttl, values)}.
+
+    Returns an empty dict if the zone can't be read, so every domain is
+    upserted as before.
+    """
+    names = {_normalize_name(d) for d in DOMAINS}
+    records = {}
+    try:
+        paginator = _ROUTE53.get_paginator("list_resource_record_sets")
+        for page in paginator.paginate(HostedZoneId=HOSTED_ZONE_ID):
+            for record in page["ResourceRecordSets"]:
+                name = _normalize_name(record["Name"])
+                if record["Type"] == "A" and name in names and "ResourceRecords" in record:
+                    values = tuple(sorted(r["Value"] for r in record["ResourceRecords"]))
+                    records[name] = (record.get("TTL"), values)
+    except Exception as e:
+        logger.warning("Could not read existing records: %s", e)
+        return {}
+    return records
+
+
 def _complete_lifecycle_action(
     autoscaling, lifecycle_hook_name, asg_name, lifecycle_action_token
 ):
@@ -125,8 +171,8 @@ def _complete_lifecycle_action(
                 LifecycleActionToken=lifecycle_action_token,
                 LifecycleActionResult="CONTINUE",
             )
-            print("Lifecycle action completed successfully")
+            logger.info("Lifecycle action completed successfully")
         except Exception as e:
-            print(f"WARNING: Failed to complete lifecycle action: {e}")
+            logger.warning("Failed to complete lifecycle action: %s", e)
     else:
-        print("No lifecycle hook info - skipping completion")
+        logger.info("No lifecycle hook info - skipping completion")